@@ -2,8 +2,10 @@ import os
 import warnings
 from importlib.metadata import Distribution
 
-from . import python_aio, python_aio_asyncio
+from . import buffers, ioprio, python_aio, python_aio_asyncio, rwflags
 from .abstract import AbstractContext, AbstractOperation
+from .asyncio_cache import CachedAsyncioContext
+from .asyncio_file import AsyncFile
 
 __version__ = Distribution.from_name("caio").version
 __author__ = "Dmitry Orlov <me@mosquito.su>"
@@ -98,17 +100,22 @@ AsyncioContext = preferred_asyncio.AsyncioContext   # type: ignore
 __all__ = (
     "AbstractContext",
     "AbstractOperation",
+    "AsyncFile",
     "AsyncioContext",
+    "CachedAsyncioContext",
     "Context",
     "Operation",
     "__author__",
     "__version__",
+    "buffers",
+    "ioprio",
     "linux_aio",
     "linux_aio_asyncio",
     "linux_uring",
     "linux_uring_asyncio",
     "python_aio",
     "python_aio_asyncio",
+    "rwflags",
     "thread_aio",
     "thread_aio_asyncio",
     "variants",
@@ -1,5 +1,5 @@
 import abc
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 
@@ -20,7 +20,7 @@ class AbstractOperation(abc.ABC):
     @abc.abstractmethod
     def read(
         cls, nbytes: int, fd: int,
-        offset: int, priority=0,
+        offset: int, priority=0, *, alignment: int = 0, flags: int = 0,
     ) -> "AbstractOperation":
         """
         Creates a new instance of AIOOperation on read mode.
@@ -31,13 +31,49 @@ class AbstractOperation(abc.ABC):
     @abc.abstractmethod
     def write(
         cls, payload_bytes: bytes,
-        fd: int, offset: int, priority=0,
+        fd: int, offset: int, priority=0, *, flags: int = 0,
     ) -> "AbstractOperation":
         """
         Creates a new instance of AIOOperation on write mode.
         """
         raise NotImplementedError
 
+    @classmethod
+    @abc.abstractmethod
+    def readinto(
+        cls, buffer: Any, fd: int,
+        offset: int, priority=0,
+    ) -> "AbstractOperation":
+        """
+        Creates a new instance of AIOOperation reading directly into
+        ``buffer``, a writable buffer-protocol object. get_value()
+        returns the number of bytes read.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def readv(
+        cls, sizes: Sequence[int], fd: int,
+        offset: int, priority=0,
+    ) -> "AbstractOperation":
+        """
+        Creates a new instance of AIOOperation on vectored read mode.
+        get_value() returns one bytes object per entry of ``sizes``.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def writev(
+        cls, buffers: Sequence[bytes],
+        fd: int, offset: int, priority=0,
+    ) -> "AbstractOperation":
+        """
+        Creates a new instance of AIOOperation on vectored write mode.
+        """
+        raise NotImplementedError
+
     @classmethod
     @abc.abstractmethod
     def fsync(cls, fd: int, priority=0) -> "AbstractOperation":
@@ -56,7 +92,7 @@ class AbstractOperation(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_value(self) -> bytes | int | None:
+    def get_value(self) -> bytes | memoryview | list[bytes] | int | None:
         """
         Method returns a bytes value of AIOOperation's result or None.
         """
@@ -74,7 +110,7 @@ class AbstractOperation(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def payload(self) -> bytes | memoryview | None:
+    def payload(self) -> Any:
         raise NotImplementedError
 
     @property
@@ -1,20 +1,39 @@
 import abc
 import asyncio
 import typing
+from collections import deque
 from functools import partial
 
 from . import abstract
 
+# The kernel rejects writev() with more buffers than this (UIO_MAXIOV)
+IOV_MAX = 1024
+
 ContextType = type[abstract.AbstractContext]
 OperationType = type[abstract.AbstractOperation]
 
 
+class _SyncGroup:
+    __slots__ = ("full", "next", "task")
+
+    def __init__(self) -> None:
+        # Shared by the callers waiting for the next sync, None while none
+        self.next: asyncio.Future | None = None
+        # Whether any of them asked for fsync rather than fdsync
+        self.full = False
+        self.task: asyncio.Task | None = None
+
+
 class AsyncioContextBase(abc.ABC):
     MAX_REQUESTS_DEFAULT = 512
     CONTEXT_CLASS: ContextType
     OPERATION_CLASS: OperationType
 
-    def __init__(self, max_requests=None, loop=None, deferred=False, **kwargs):
+    def __init__(
+        self, max_requests=None, loop=None, deferred=False, batched=False,
+        group_commit=False, coalesce_reads=0, coalesce_writes=0,
+        single_flight=False, **kwargs,
+    ):
         max_requests = max_requests or self.MAX_REQUESTS_DEFAULT
         self.loop = loop or asyncio.get_event_loop()
         # Opt-in: batch multiple submissions into one syscall instead of
@@ -22,8 +41,40 @@ class AsyncioContextBase(abc.ABC):
         # linux_uring's adapters actually act on this (see their own
         # _submit_op/_on_submitted overrides) - it's a no-op elsewhere.
         self.deferred = deferred
+        self.max_requests = max_requests
         self.semaphore = asyncio.BoundedSemaphore(max_requests)
+        # Held by a chain while it takes its slots - see _submit_batch()
+        self._chain_slots = asyncio.Lock()
         self.context = self._create_context(max_requests, **kwargs)
+        # Opt-in: resolve futures from one Context.set_batch_callback()
+        # call per drained batch rather than one Operation.set_callback()
+        # call (and call_soon_threadsafe()) each. Needs a context that
+        # completes on the event loop's thread - linux_aio and linux_uring
+        # - it's a no-op elsewhere.
+        self.batched = batched and hasattr(self.context, "set_batch_callback")
+        self._waiters: dict[abstract.AbstractOperation, asyncio.Future] = {}
+        if self.batched:
+            # Bound to the dict only, not self - the Context holding it
+            # mustn't keep this adapter alive.
+            self.context.set_batch_callback(
+                partial(self._resolve_batch, self._waiters),
+            )
+        # Opt-in: concurrent fsync()/fdsync() calls on one fd share a
+        # single in-flight operation - see _group_sync().
+        self.group_commit = group_commit
+        self._sync_groups: dict[int, _SyncGroup] = {}
+        # Opt-in: the largest span, in bytes, that reads of one fd issued
+        # in the same loop iteration get merged into - see _flush_reads().
+        self.coalesce_reads = coalesce_reads
+        self._read_queue: dict[int, list] = {}
+        # Same for writes at exactly contiguous offsets - see
+        # _flush_writes().
+        self.coalesce_writes = coalesce_writes
+        self._write_queue: dict[int, list] = {}
+        # Opt-in: identical reads in flight at once share one operation -
+        # see _single_flight_read().
+        self.single_flight = single_flight
+        self._flights: dict[int, dict[tuple[int, int], asyncio.Future]] = {}
 
     def _create_context(self, max_requests, **kwargs):
         return self.CONTEXT_CLASS(max_requests=max_requests, **kwargs)
@@ -45,13 +96,15 @@ class AsyncioContextBase(abc.ABC):
             raise ValueError("Operation object expected")  # noqa: TRY004 (pre-existing public exception type, not changing it here)
 
         future = self.loop.create_future()
-        op.set_callback(partial(self._on_done, future))
+        if not self.batched:
+            op.set_callback(partial(self._on_done, future))
 
         async with self.semaphore:
-            self._submit_op(op, future)
-            self._on_submitted()
-
+            if self.batched:
+                self._waiters[op] = future
             try:
+                self._submit_op(op, future)
+                self._on_submitted()
                 await future
             except asyncio.CancelledError:
                 try:
@@ -59,8 +112,136 @@ class AsyncioContextBase(abc.ABC):
                 except ValueError:
                     pass
                 raise
+            finally:
+                if self.batched:
+                    self._waiters.pop(op, None)
             return op.get_value()
 
+    async def submit_many(self, *ops) -> list:
+        """
+        Submits ``ops`` with as few Context.submit() calls as the
+        semaphore allows - one, unless there are more than max_requests -
+        and returns their values in order, or raises the first failure.
+        """
+        self._check_operations(ops)
+        return await self._submit_batch(ops, self._submit_ops)
+
+    async def submit_chain(self, *ops) -> list:
+        """
+        Runs ``ops`` in order, each only once the previous one succeeded -
+        a failed or short one fails the rest with ECANCELED. Returns their
+        values, or raises the first failure. Contexts without
+        submit_chain() (linux_aio) await them one by one instead.
+        """
+        self._check_operations(ops)
+
+        if len(ops) > self.max_requests:
+            # Would wait forever for semaphore slots it can never get
+            raise ValueError("Chain is longer than max_requests")
+
+        if not hasattr(self.context, "submit_chain"):
+            return [await self.submit(op) for op in ops]
+
+        # Not through _submit_ops(): a chain has to reach the context in
+        # one call, so deferred mode only gets to batch its flush.
+        return await self._submit_batch(
+            ops, lambda batch, _: self.context.submit_chain(*batch),
+            split=False,
+        )
+
+    def read_many(
+        self, requests: typing.Iterable[tuple[int, int, int]],
+        priority: int = 0,
+    ) -> typing.Awaitable[list[bytes]]:
+        """Reads every ``(nbytes, fd, offset)`` with one submit_many()."""
+        return self.submit_many(*(
+            self.OPERATION_CLASS.read(nbytes, fd, offset, priority)
+            for nbytes, fd, offset in requests
+        ))
+
+    def write_many(
+        self, requests: typing.Iterable[tuple[bytes, int, int]],
+        priority: int = 0,
+    ) -> typing.Awaitable[list[int]]:
+        """Writes every ``(payload, fd, offset)`` with one submit_many()."""
+        ops = []
+        for payload, fd, offset in requests:
+            self._flights.pop(fd, None)
+            ops.append(
+                self.OPERATION_CLASS.write(payload, fd, offset, priority),
+            )
+        return self.submit_many(*ops)
+
+    def _check_operations(self, ops):
+        for op in ops:
+            if not isinstance(op, self.OPERATION_CLASS):
+                raise ValueError("Operation object expected")  # noqa: TRY004 (same exception type as submit())
+
+    async def _submit_batch(self, ops, submit, split=True) -> list:
+        """
+        Takes one semaphore slot per op and hands them to ``submit(ops,
+        futures)`` together - or, with ``split``, in as many parts as it
+        takes to never wait for a slot while holding unsubmitted ops.
+        Each slot is given back as soon as its own op completes.
+
+        Without ``split`` the slots are still taken one at a time, so only
+        one such batch takes them at once: two of them each holding part
+        of the slots would wait for one another forever.
+        """
+        futures: list[asyncio.Future] = []
+        unsubmitted: list = []
+        submitted = 0
+
+        def flush():
+            nonlocal submitted
+            submit(unsubmitted[:], futures[submitted:])
+            submitted = len(futures)
+            unsubmitted.clear()
+            self._on_submitted()
+
+        async def take_slot(op):
+            await self.semaphore.acquire()
+            future = self.loop.create_future()
+            future.add_done_callback(lambda _: self.semaphore.release())
+            futures.append(future)
+            if self.batched:
+                self._waiters[op] = future
+            else:
+                op.set_callback(partial(self._on_done, future))
+            unsubmitted.append(op)
+
+        try:
+            if split:
+                for op in ops:
+                    if unsubmitted and self.semaphore.locked():
+                        flush()
+                    await take_slot(op)
+            else:
+                async with self._chain_slots:
+                    for op in ops:
+                        await take_slot(op)
+            if unsubmitted:
+                flush()
+            await asyncio.gather(*futures)
+        except asyncio.CancelledError:
+            for op in ops[:submitted]:
+                try:
+                    self.context.cancel(op)
+                except ValueError:
+                    pass
+            raise
+        finally:
+            for index, op in enumerate(ops[:len(futures)]):
+                future = futures[index]
+                if index < submitted and not future.done():
+                    # Accepted and still running - its completion resolves
+                    # the future and only then gives back its slot
+                    continue
+                self._waiters.pop(op, None)
+                # Gives back the slots of the ones left behind
+                future.cancel()
+        return [op.get_value() for op in ops]
+
     def _submit_op(self, op, future):
         """Default: submit immediately and raise on rejection right away.
         Subclasses may defer submission (batching) - in that case they must
@@ -68,6 +249,14 @@ class AsyncioContextBase(abc.ABC):
         if self.context.submit(op) != 1:
             raise OSError("Operation was not submitted")
 
+    def _submit_ops(self, ops, futures):
+        """Like _submit_op(), for a whole batch in one Context.submit()
+        call - the ones it didn't accept fail with an exception."""
+        accepted = self.context.submit(*ops)
+        for future in futures[accepted:]:
+            if not future.done():
+                future.set_exception(OSError("Operation was not submitted"))
+
     def _on_submitted(self):
         """Hook called after each op is placed in the context's queue.
         Subclasses can override to implement batched submission (deferred flush).
@@ -86,24 +275,374 @@ class AsyncioContextBase(abc.ABC):
             lambda: future.done() or future.set_result(True),
         )
 
+    @staticmethod
+    def _resolve_batch(waiters, operations):
+        """Batch callback for batched mode: runs on the event loop's
+        thread, from process_events()/flush() - sets results directly."""
+        for op in operations:
+            future = waiters.pop(op, None)
+            if future is not None and not future.done():
+                future.set_result(True)
+
     def read(
         self, nbytes: int, fd: int,
-        offset: int, priority: int = 0,
+        offset: int, priority: int = 0, *, alignment: int = 0,
+        flags: int = 0,
     ) -> typing.Awaitable[bytes]:
+        if alignment or flags:
+            # A buffer or RWF_* flags of its own - never merged or shared
+            return self.submit(
+                self.OPERATION_CLASS.read(
+                    nbytes, fd, offset, priority,
+                    alignment=alignment, flags=flags,
+                ),
+            )
+        if self.single_flight:
+            return self._single_flight_read(nbytes, fd, offset, priority)
+        return self._read(nbytes, fd, offset, priority)
+
+    def _read(self, nbytes, fd, offset, priority):
+        if self.coalesce_reads:
+            return self._coalesced_read(nbytes, fd, offset, priority)
         return self.submit(
             self.OPERATION_CLASS.read(nbytes, fd, offset, priority),
         )
 
     def write(
         self, payload: bytes, fd: int,
-        offset: int, priority: int = 0,
+        offset: int, priority: int = 0, *, flags: int = 0,
     ) -> typing.Awaitable[int]:
+        self._flights.pop(fd, None)
+        if flags:
+            return self.submit(
+                self.OPERATION_CLASS.write(
+                    payload, fd, offset, priority, flags=flags,
+                ),
+            )
+        if self.coalesce_writes:
+            return self._coalesced_write(payload, fd, offset, priority)
         return self.submit(
             self.OPERATION_CLASS.write(payload, fd, offset, priority),
         )
 
+    def readinto(
+        self, buffer: typing.Any, fd: int,
+        offset: int, priority: int = 0,
+    ) -> typing.Awaitable[int]:
+        return self.submit(
+            self.OPERATION_CLASS.readinto(buffer, fd, offset, priority),
+        )
+
+    def readv(
+        self, sizes: typing.Sequence[int], fd: int,
+        offset: int, priority: int = 0,
+    ) -> typing.Awaitable[list[bytes]]:
+        return self.submit(
+            self.OPERATION_CLASS.readv(sizes, fd, offset, priority),
+        )
+
+    def writev(
+        self, buffers: typing.Sequence[bytes], fd: int,
+        offset: int, priority: int = 0,
+    ) -> typing.Awaitable[int]:
+        self._flights.pop(fd, None)
+        return self.submit(
+            self.OPERATION_CLASS.writev(buffers, fd, offset, priority),
+        )
+
+    async def iter_chunks(
+        self, fd: int, start: int = 0, end: int | None = None,
+        chunk_size: int = 65536, window: int = 4, priority: int = 0,
+        arena: typing.Any = None,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Yields ``fd``'s bytes from ``start`` up to ``end`` (or the end of
+        file if None) in order, ``chunk_size`` at a time, keeping up to
+        ``window`` reads in flight - so at most that many chunks are held
+        in memory.
+
+        With a ``caio.buffers.BufferArena``, reads go into its buffers and
+        chunks are ``memoryview`` slices of them, valid only until the
+        next one is asked for.
+        """
+        if chunk_size <= 0 or window < 1:
+            raise ValueError("chunk_size and window must be positive")
+        if arena is not None and chunk_size > arena.buffer_size:
+            raise ValueError("chunk_size is larger than the arena's buffers")
+
+        pending: deque[tuple[int, asyncio.Future, typing.Any]] = deque()
+        offset = start
+
+        def fill():
+            nonlocal offset
+            while len(pending) < window and (end is None or offset < end):
+                size = chunk_size
+                if end is not None:
+                    size = min(size, end - offset)
+                buffer = None
+                if arena is None:
+                    read = self.read(size, fd, offset, priority)
+                else:
+                    buffer = arena.acquire()
+                    read = self.readinto(
+                        buffer[:size], fd, offset, priority,
+                    )
+                pending.append((size, asyncio.ensure_future(read), buffer))
+                offset += size
+
+        try:
+            fill()
+            while pending:
+                size, task, buffer = pending.popleft()
+                try:
+                    data = await task
+                    if buffer is not None:
+                        data = buffer[:data]
+                    if data:
+                        yield data
+                finally:
+                    # Not if the read was cancelled from under this await -
+                    # the same as the ones still in flight below
+                    if (
+                        buffer is not None and task.done()
+                        and not task.cancelled()
+                    ):
+                        arena.release(buffer)
+                if len(data) < size:
+                    if arena is not None:
+                        # Past the end of file, so they finish at once -
+                        # waited for to get their buffers back
+                        await asyncio.gather(
+                            *(task for _, task, _ in pending),
+                            return_exceptions=True,
+                        )
+                    return
+                fill()
+        finally:
+            for _, task, buffer in pending:
+                if task.done() and not task.cancelled():
+                    # Retrieve it - nobody is going to see this one
+                    task.exception()
+                    if buffer is not None:
+                        arena.release(buffer)
+                task.cancel()
+            # Buffers of reads still in flight are left out of the arena:
+            # the kernel may write into them after the cancellation.
+
+    async def _single_flight_read(self, nbytes, fd, offset, priority):
+        """
+        Joins a read of exactly this range already in flight, if any.
+        write() and writev() to ``fd`` detach those first, so a read that
+        starts after a write was issued never gets data from before it.
+        """
+        flights = self._flights.setdefault(fd, {})
+        key = (offset, nbytes)
+        flight = flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._read(nbytes, fd, offset, priority),
+            )
+            flights[key] = flight
+            flight.add_done_callback(partial(self._land, fd, key))
+        # One cancelled caller must not cancel the others' read
+        return await asyncio.shield(flight)
+
+    def _land(self, fd, key, flight):
+        if not flight.cancelled():
+            # Retrieve it, in case every caller was cancelled meanwhile
+            flight.exception()
+        flights = self._flights.get(fd)
+        if flights is not None and flights.get(key) is flight:
+            del flights[key]
+            if not flights:
+                del self._flights[fd]
+
+    async def _coalesced_read(self, nbytes, fd, offset, priority):
+        future = self.loop.create_future()
+        if not self._read_queue:
+            self.loop.call_soon(self._flush_reads)
+        self._read_queue.setdefault(fd, []).append(
+            (offset, nbytes, priority, future),
+        )
+        return await future
+
+    def _flush_reads(self):
+        """
+        Merges the reads queued since the last loop iteration: per fd, in
+        offset order, ranges that overlap or touch share one read as long
+        as it spans at most coalesce_reads bytes. Each caller gets its own
+        part of that read's result, as bytes like any read().
+        """
+        queue, self._read_queue = self._read_queue, {}
+        for fd, requests in queue.items():
+            requests.sort(key=lambda request: request[0])
+            group = [requests[0]]
+            start, end = requests[0][0], requests[0][0] + requests[0][1]
+            for request in requests[1:]:
+                offset, nbytes = request[0], request[1]
+                merged_end = max(end, offset + nbytes)
+                if offset <= end and merged_end - start <= self.coalesce_reads:
+                    group.append(request)
+                    end = merged_end
+                    continue
+                self._start_read_group(fd, start, end, group)
+                group = [request]
+                start, end = offset, offset + nbytes
+            self._start_read_group(fd, start, end, group)
+
+    def _start_read_group(self, fd, start, end, group):
+        priority = min(request[2] for request in group)
+        asyncio.ensure_future(
+            self._run_read_group(fd, start, end - start, priority, group),
+        )
+
+    async def _run_read_group(self, fd, start, nbytes, priority, group):
+        try:
+            data = await self.submit(
+                self.OPERATION_CLASS.read(nbytes, fd, start, priority),
+            )
+        except asyncio.CancelledError:
+            for *_, future in group:
+                future.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001 (handed to every waiter)
+            for *_, future in group:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        if len(group) == 1:
+            # Nothing merged - the read was exactly this caller's own
+            if not group[0][-1].done():
+                group[0][-1].set_result(data)
+            return
+
+        # A short read just leaves the slices past its end short too
+        view = memoryview(data)
+        for offset, size, _, future in group:
+            if not future.done():
+                future.set_result(
+                    bytes(view[offset - start:offset - start + size]),
+                )
+
+    async def _coalesced_write(
+        self, payload: bytes, fd: int, offset: int, priority: int,
+    ) -> int:
+        future = self.loop.create_future()
+        if not self._write_queue:
+            self.loop.call_soon(self._flush_writes)
+        self._write_queue.setdefault(fd, []).append(
+            (offset, payload, memoryview(payload).nbytes, priority, future),
+        )
+        return await future
+
+    def _flush_writes(self):
+        """
+        Merges the writes queued since the last loop iteration: per fd, in
+        offset order, each one starting exactly where the previous one
+        ends joins its writev() as long as that spans at most
+        coalesce_writes bytes. Overlapping writes are never merged.
+        """
+        queue, self._write_queue = self._write_queue, {}
+        for fd, requests in queue.items():
+            requests.sort(key=lambda request: request[0])
+            group = [requests[0]]
+            start, end = requests[0][0], requests[0][0] + requests[0][2]
+            for request in requests[1:]:
+                offset, size = request[0], request[2]
+                if (
+                    offset == end and len(group) < IOV_MAX and
+                    end + size - start <= self.coalesce_writes
+                ):
+                    group.append(request)
+                    end += size
+                    continue
+                self._start_write_group(fd, start, group)
+                group = [request]
+                start, end = offset, offset + size
+            self._start_write_group(fd, start, group)
+
+    def _start_write_group(self, fd, start, group):
+        priority = min(request[3] for request in group)
+        if len(group) == 1:
+            op = self.OPERATION_CLASS.write(group[0][1], fd, start, priority)
+        else:
+            op = self.OPERATION_CLASS.writev(
+                [request[1] for request in group], fd, start, priority,
+            )
+        asyncio.ensure_future(self._run_write_group(op, start, group))
+
+    async def _run_write_group(self, op, start, group):
+        try:
+            written = await self.submit(op)
+        except asyncio.CancelledError:
+            for *_, future in group:
+                future.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001 (handed to every waiter)
+            for *_, future in group:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        # Each caller's share of a short write
+        end = start + written
+        for offset, _, size, _, future in group:
+            if not future.done():
+                future.set_result(max(0, min(size, end - offset)))
+
     def fsync(self, fd: int) -> typing.Awaitable:
+        if self.group_commit:
+            return self._group_sync(fd, full=True)
         return self.submit(self.OPERATION_CLASS.fsync(fd))
 
     def fdsync(self, fd: int) -> typing.Awaitable:
+        if self.group_commit:
+            return self._group_sync(fd, full=False)
         return self.submit(self.OPERATION_CLASS.fdsync(fd))
+
+    async def _group_sync(self, fd: int, full: bool) -> None:
+        """
+        Joins the next sync of ``fd``. A sync already in flight may have
+        started before the caller's writes completed, so it never counts -
+        callers arriving meanwhile wait for the one issued right after it,
+        which is an fsync if any of them asked for one.
+        """
+        group = self._sync_groups.get(fd)
+        if group is None:
+            group = self._sync_groups[fd] = _SyncGroup()
+        if group.next is None:
+            group.next = self.loop.create_future()
+        group.full = group.full or full
+        if group.task is None:
+            group.task = self.loop.create_task(self._run_sync_group(fd, group))
+        # A cancelled caller must not cancel the sync it shares with others
+        await asyncio.shield(group.next)
+
+    async def _run_sync_group(self, fd: int, group: "_SyncGroup") -> None:
+        try:
+            while group.next is not None:
+                future, full = group.next, group.full
+                group.next, group.full = None, False
+                op = (
+                    self.OPERATION_CLASS.fsync(fd) if full
+                    else self.OPERATION_CLASS.fdsync(fd)
+                )
+                try:
+                    await self.submit(op)
+                except asyncio.CancelledError:
+                    # Nothing left to run the queued sync either - every
+                    # waiter, this one's and the next one's, gets it
+                    future.cancel()
+                    if group.next is not None:
+                        group.next.cancel()
+                        group.next = None
+                    raise
+                except Exception as exc:  # noqa: BLE001 (handed to every waiter)
+                    future.set_exception(exc)
+                    # Mark it retrieved, in case every waiter was cancelled
+                    future.exception()
+                else:
+                    future.set_result(None)
+        finally:
+            del self._sync_groups[fd]
@@ -0,0 +1,221 @@
+"""
+Userspace block cache in front of an ``AsyncioContext``'s reads.
+
+Useful with ``O_DIRECT``, where the kernel's page cache is bypassed
+entirely: reads are served from whole ``block_size`` blocks kept in an LRU
+of at most ``capacity_bytes``, concurrent misses on one block share a
+single read, and writes through the same wrapper invalidate the blocks
+they touch - and the block the end of file cut short, should they grow
+the file:
+
+    >>> ctx = CachedAsyncioContext(AsyncioContext(), 64 << 20, 4096)
+    >>> header = await ctx.read(512, fd, 0)
+
+Only ``write()``, ``writev()`` and ``write_many()`` invalidate - after
+writing any other way (raw operations, another process), call
+``invalidate()``. Everything else is passed through to ``context``.
+For an ``O_DIRECT`` fd, pass its ``logical_block_size()`` as
+``alignment``.
+"""
+import asyncio
+import typing
+from collections import OrderedDict
+
+from .asyncio_base import AsyncioContextBase
+
+
+class CachedAsyncioContext:
+    def __init__(
+        self, context: AsyncioContextBase, capacity_bytes: int,
+        block_size: int = 4096, alignment: int = 0,
+    ):
+        if block_size <= 0 or capacity_bytes < 0:
+            raise ValueError("block_size and capacity_bytes must be positive")
+
+        self.context = context
+        self.capacity_bytes = capacity_bytes
+        self.block_size = block_size
+        self.alignment = alignment
+        self.hits = 0
+        self.misses = 0
+        self.cached_bytes = 0
+
+        self._blocks: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+        # Indexes of the short blocks - ones the end of file cut off - of
+        # each fd. A write anywhere past their start may grow the file.
+        self._short_blocks: dict[int, set[int]] = {}
+        self._loading: dict[tuple[int, int], asyncio.Future] = {}
+        # Bumped by every write to an fd, and _epoch by invalidate() - a
+        # block read that started before either may hold stale data and
+        # must not be cached.
+        self._generations: dict[int, int] = {}
+        self._epoch = 0
+
+    def __getattr__(self, name):
+        return getattr(self.context, name)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.invalidate()
+        self.context.close()
+
+    async def read(
+        self, nbytes: int, fd: int, offset: int, priority: int = 0,
+    ) -> bytes:
+        """Reads through the cache, up to the end of file like read()."""
+        if nbytes <= 0:
+            return b""
+
+        first = offset // self.block_size
+        last = (offset + nbytes - 1) // self.block_size
+        blocks = await asyncio.gather(*(
+            self._get_block(fd, index, priority)
+            for index in range(first, last + 1)
+        ))
+
+        chunks = []
+        position = offset
+        for index, block in zip(range(first, last + 1), blocks):
+            start = position - index * self.block_size
+            end = min(len(block), offset + nbytes - index * self.block_size)
+            if start < end:
+                chunks.append(block[start:end])
+                position += end - start
+            if len(block) < self.block_size:
+                break
+        return b"".join(chunks)
+
+    async def write(
+        self, payload: bytes, fd: int, offset: int, priority: int = 0,
+    ) -> int:
+        size = memoryview(payload).nbytes
+        return await self._invalidating(
+            self.context.write(payload, fd, offset, priority),
+            fd, offset, size,
+        )
+
+    async def writev(
+        self, buffers: typing.Sequence[bytes], fd: int, offset: int,
+        priority: int = 0,
+    ) -> int:
+        size = sum(memoryview(buffer).nbytes for buffer in buffers)
+        return await self._invalidating(
+            self.context.writev(buffers, fd, offset, priority),
+            fd, offset, size,
+        )
+
+    async def write_many(
+        self, requests: typing.Iterable[tuple[bytes, int, int]],
+        priority: int = 0,
+    ) -> list[int]:
+        requests = list(requests)
+        ranges = [
+            (fd, offset, offset + memoryview(payload).nbytes)
+            for payload, fd, offset in requests
+        ]
+        for fd, start, end in ranges:
+            self._invalidate_range(fd, start, end)
+        try:
+            return await self.context.write_many(requests, priority)
+        finally:
+            for fd, start, end in ranges:
+                self._invalidate_range(fd, start, end)
+
+    def invalidate(self, fd: int | None = None) -> None:
+        """Drops every cached block, or only ``fd``'s."""
+        if fd is not None:
+            self._invalidate_range(fd, 0, None)
+            return
+        self._epoch += 1
+        self._blocks.clear()
+        self._loading.clear()
+        self._short_blocks.clear()
+        self.cached_bytes = 0
+
+    async def _invalidating(self, write, fd, offset, size):
+        # Before, so no read joins a load that can't see this write, and
+        # after, so none caches what it read while the write was running
+        self._invalidate_range(fd, offset, offset + size)
+        try:
+            return await write
+        finally:
+            self._invalidate_range(fd, offset, offset + size)
+
+    def _invalidate_range(self, fd: int, start: int, end: int | None):
+        self._generations[fd] = self._generations.get(fd, 0) + 1
+        if end is None:
+            keys = [key for key in self._blocks if key[0] == fd]
+            keys += [key for key in self._loading if key[0] == fd]
+        else:
+            keys = [
+                (fd, index) for index in range(
+                    start // self.block_size,
+                    (end - 1) // self.block_size + 1,
+                )
+            ]
+        short = self._short_blocks.get(fd, set())
+        grown = {
+            index for index in short
+            if end is None or index * self.block_size <= end
+        }
+        short -= grown
+        keys += [(fd, index) for index in grown]
+        if not short:
+            self._short_blocks.pop(fd, None)
+
+        for key in keys:
+            self._loading.pop(key, None)
+            block = self._blocks.pop(key, None)
+            if block is not None:
+                self.cached_bytes -= len(block)
+
+    async def _get_block(self, fd: int, index: int, priority: int) -> bytes:
+        key = (fd, index)
+        block = self._blocks.get(key)
+        if block is not None:
+            self._blocks.move_to_end(key)
+            self.hits += 1
+            return block
+
+        loading = self._loading.get(key)
+        if loading is None:
+            self.misses += 1
+            loading = asyncio.ensure_future(self._load(key, priority))
+            self._loading[key] = loading
+        # One cancelled caller must not cancel the others' read
+        return await asyncio.shield(loading)
+
+    async def _load(self, key: tuple[int, int], priority: int) -> bytes:
+        fd, index = key
+        generation = self._epoch, self._generations.get(fd, 0)
+        try:
+            block = bytes(await self.context.read(
+                self.block_size, fd, index * self.block_size, priority,
+                alignment=self.alignment,
+            ))
+        finally:
+            if self._loading.get(key) is asyncio.current_task():
+                del self._loading[key]
+
+        if (self._epoch, self._generations.get(fd, 0)) == generation:
+            self._store(key, block)
+        return block
+
+    def _store(self, key: tuple[int, int], block: bytes) -> None:
+        if len(block) > self.capacity_bytes:
+            return
+        if key in self._blocks:
+            self.cached_bytes -= len(self._blocks[key])
+        self._blocks[key] = block
+        self.cached_bytes += len(block)
+        if len(block) < self.block_size:
+            self._short_blocks.setdefault(key[0], set()).add(key[1])
+        while self.cached_bytes > self.capacity_bytes:
+            (fd, index), evicted = self._blocks.popitem(last=False)
+            self.cached_bytes -= len(evicted)
+            self._short_blocks.get(fd, set()).discard(index)
@@ -0,0 +1,380 @@
+"""
+Buffered, position-tracking file object on top of an ``AsyncioContext``.
+
+Sequential reads keep a window of chunk reads in flight ahead of the
+caller, and small writes are merged into large, aligned ones issued in the
+background - callers get streaming throughput without juggling offsets or
+concurrency themselves:
+
+    >>> async with await AsyncFile.open("data.bin", "rb") as fp:
+    ...     async for line in fp:
+    ...         ...
+"""
+import asyncio
+import os
+import typing
+from collections import deque
+
+from .asyncio_base import AsyncioContextBase
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+_OPEN_FLAGS = {
+    "r": os.O_RDONLY,
+    "w": os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+    "a": os.O_WRONLY | os.O_CREAT,
+    "x": os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+}
+
+
+def _open_flags(mode: str) -> int:
+    kinds = [c for c in mode if c in _OPEN_FLAGS]
+    if (
+        len(kinds) != 1 or set(mode) - set("rwax+b") or
+        len(set(mode)) != len(mode)
+    ):
+        raise ValueError(f"invalid mode: {mode!r}")
+
+    flags = _OPEN_FLAGS[kinds[0]]
+    if "+" in mode:
+        flags = (flags & ~(os.O_RDONLY | os.O_WRONLY)) | os.O_RDWR
+    return flags | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+
+class AsyncFile:
+    """
+    Binary file over ``fd``, read and written through ``context``.
+
+    ``read_ahead`` chunk reads of ``chunk_size`` bytes stay in flight ahead
+    of a sequential reader; seeking elsewhere drops them. Writes collect in
+    a buffer flushed whenever it crosses a ``write_buffer_size`` boundary
+    of the file, with up to ``write_behind`` such writes in flight at once.
+    Reads, ``flush()`` and ``close()`` wait for pending writes, and a write
+    error is raised from whichever of those, or the next ``write()``,
+    comes first.
+    """
+
+    def __init__(
+        self, context: AsyncioContextBase, fd: int, *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE, read_ahead: int = 4,
+        write_buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+        write_behind: int = 4, closefd: bool = True,
+        owns_context: bool = False,
+    ):
+        if chunk_size <= 0 or write_buffer_size <= 0:
+            raise ValueError(
+                "chunk_size and write_buffer_size must be positive",
+            )
+        if read_ahead < 1 or write_behind < 1:
+            raise ValueError("read_ahead and write_behind must be at least 1")
+
+        self.context = context
+        self.fd = fd
+        self.chunk_size = chunk_size
+        self.read_ahead = read_ahead
+        self.write_buffer_size = write_buffer_size
+        self.write_behind = write_behind
+        self.closefd = closefd
+        self.owns_context = owns_context
+        self.closed = False
+
+        self._position = 0
+        # End of everything written so far, for SEEK_END before it lands
+        self._written_end = 0
+
+        # Last chunk read, starting at file offset _buffer_offset
+        self._buffer = b""
+        self._buffer_offset = 0
+        # (offset, task) of the reads in flight, in file order
+        self._ahead: deque[tuple[int, asyncio.Task]] = deque()
+        self._ahead_offset = 0
+        self._eof: int | None = None
+
+        self._wbuffer = bytearray()
+        self._wbuffer_offset = 0
+        self._writes: set[asyncio.Task] = set()
+
+    @classmethod
+    async def open(
+        cls, path: str | os.PathLike, mode: str = "rb",
+        *, context: AsyncioContextBase | None = None, **kwargs,
+    ) -> "AsyncFile":
+        """
+        Opens ``path`` like the builtin ``open()`` in binary mode. Without
+        ``context``, a default ``caio.AsyncioContext`` is created and
+        closed together with the file. ``"a"`` starts at the end of the
+        file but, without ``O_APPEND``, honors ``seek()`` afterwards.
+        """
+        flags = _open_flags(mode)
+        owns_context = context is None
+        if context is None:
+            from . import AsyncioContext
+            context = AsyncioContext()
+
+        try:
+            fd = os.open(path, flags, 0o666)
+        except BaseException:
+            if owns_context:
+                context.close()
+            raise
+
+        result = cls(context, fd, owns_context=owns_context, **kwargs)
+        if "a" in mode:
+            result.seek(0, os.SEEK_END)
+        return result
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        line = await self.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} fd={self.fd} "
+            f"position={self._position} closed={self.closed}>"
+        )
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            size = max(os.fstat(self.fd).st_size, self._written_end)
+            position = size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence!r}")
+
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    async def read(self, size: int = -1) -> bytes:
+        """Reads up to ``size`` bytes, or to the end of file if negative."""
+        self._check_closed()
+        await self._wait_writes()
+
+        chunks = []
+        while size != 0:
+            data, start = await self._peek()
+            if start >= len(data):
+                break
+            end = len(data) if size < 0 else min(len(data), start + size)
+            if size > 0:
+                size -= end - start
+            chunks.append(data[start:end])
+            self._position += end - start
+        return b"".join(chunks)
+
+    async def readline(self) -> bytes:
+        """Reads through the next ``b"\\n"``, or to the end of file."""
+        self._check_closed()
+        await self._wait_writes()
+
+        chunks = []
+        while True:
+            data, start = await self._peek()
+            if start >= len(data):
+                break
+            end = data.find(b"\n", start) + 1
+            chunks.append(data[start:end or len(data)])
+            self._position += len(chunks[-1])
+            if end:
+                break
+        return b"".join(chunks)
+
+    async def iter_chunks(
+        self, chunk_size: int | None = None,
+    ) -> typing.AsyncIterator[bytes]:
+        """Yields the rest of the file, ``chunk_size`` bytes at a time."""
+        chunk_size = chunk_size or self.chunk_size
+        while True:
+            data = await self.read(chunk_size)
+            if not data:
+                return
+            yield data
+
+    async def write(self, data: typing.Any) -> int:
+        """Buffers ``data`` at the current position, returns its length."""
+        self._check_closed()
+        self._drop_reads()
+
+        data = memoryview(data).cast("B")
+        if self._wbuffer and (
+            self._wbuffer_offset + len(self._wbuffer) != self._position
+        ):
+            await self._issue_write(len(self._wbuffer))
+        if not self._wbuffer:
+            self._wbuffer_offset = self._position
+
+        self._wbuffer += data
+        self._position += len(data)
+        self._written_end = max(self._written_end, self._position)
+
+        end = self._wbuffer_offset + len(self._wbuffer)
+        boundary = end - end % self.write_buffer_size
+        if boundary > self._wbuffer_offset:
+            await self._issue_write(boundary - self._wbuffer_offset)
+        return len(data)
+
+    async def flush(self) -> None:
+        """Writes out everything buffered and waits for it to land."""
+        self._check_closed()
+        await self._wait_writes()
+
+    async def fsync(self) -> None:
+        await self.flush()
+        await self.context.fsync(self.fd)
+
+    async def fdsync(self) -> None:
+        await self.flush()
+        await self.context.fdsync(self.fd)
+
+    async def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            await self._wait_writes()
+        finally:
+            self.closed = True
+            self._drop_reads()
+            try:
+                # However the wait above ended, the writes it left behind
+                # must be done with the fd before it's closed - its number
+                # may be reused for another file right after.
+                await self._settle_writes()
+            finally:
+                if self.closefd:
+                    os.close(self.fd)
+                if self.owns_context:
+                    self.context.close()
+
+    def _check_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+
+    async def _peek(self) -> tuple[bytes, int]:
+        """
+        The chunk holding the current position, and where in it that is -
+        past its end at end of file. Not sliced, callers copy out only
+        what they consume.
+        """
+        start = self._position - self._buffer_offset
+        if 0 <= start < len(self._buffer):
+            return self._buffer, start
+        if self._eof is not None and self._position >= self._eof:
+            return b"", 0
+
+        offset = self._position - self._position % self.chunk_size
+        while self._ahead and self._ahead[0][0] < offset:
+            self._ahead.popleft()[1].cancel()
+        if not self._ahead or self._ahead[0][0] != offset:
+            self._drop_reads()
+            self._ahead_offset = offset
+        self._fill_ahead()
+
+        offset, task = self._ahead.popleft()
+        try:
+            data = await task
+        except BaseException:
+            self._drop_reads()
+            raise
+
+        if len(data) < self.chunk_size:
+            self._eof = offset + len(data)
+            while self._ahead:
+                self._ahead.pop()[1].cancel()
+        self._buffer, self._buffer_offset = data, offset
+        self._fill_ahead()
+        return data, self._position - offset
+
+    def _fill_ahead(self) -> None:
+        while len(self._ahead) < self.read_ahead and (
+            self._eof is None or self._ahead_offset < self._eof
+        ):
+            task = asyncio.ensure_future(
+                self.context.read(self.chunk_size, self.fd, self._ahead_offset),
+            )
+            self._ahead.append((self._ahead_offset, task))
+            self._ahead_offset += self.chunk_size
+
+    def _drop_reads(self) -> None:
+        while self._ahead:
+            self._ahead.pop()[1].cancel()
+        self._buffer = b""
+        self._eof = None
+
+    async def _issue_write(self, size: int) -> None:
+        # A free slot first: the payload stays in _wbuffer until it's in
+        # flight, so neither a cancelled wait nor an earlier write's error
+        # can lose it.
+        while len(self._writes) >= self.write_behind:
+            done, self._writes = await asyncio.wait(
+                self._writes, return_when=asyncio.FIRST_COMPLETED,
+            )
+            error = None
+            for task in done:
+                exc = None if task.cancelled() else task.exception()
+                if error is None:
+                    error = exc
+            if error is not None:
+                raise error
+
+        payload = bytes(self._wbuffer[:size])
+        offset = self._wbuffer_offset
+        del self._wbuffer[:size]
+        self._wbuffer_offset += size
+        self._writes.add(
+            asyncio.ensure_future(self._write_all(payload, offset)),
+        )
+
+    async def _write_all(self, payload: bytes, offset: int) -> None:
+        while payload:
+            written = await self.context.write(payload, self.fd, offset)
+            if written <= 0:
+                raise OSError(f"write returned {written} at offset {offset}")
+            payload = payload[written:]
+            offset += written
+
+    async def _wait_writes(self) -> None:
+        if self._wbuffer:
+            await self._issue_write(len(self._wbuffer))
+        error = await self._settle_writes()
+        if error is not None:
+            raise error
+
+    async def _settle_writes(self) -> BaseException | None:
+        """
+        Waits for every write in flight, not just up to the first failure,
+        and returns that failure. Ones still running stay in ``_writes``
+        if this is cancelled.
+        """
+        writes = set(self._writes)
+        if not writes:
+            return None
+        await asyncio.wait(writes)
+        self._writes -= writes
+
+        error = None
+        for task in writes:
+            if task.cancelled():
+                continue
+            exc = task.exception()
+            if error is None:
+                error = exc
+        return error
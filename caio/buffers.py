@@ -0,0 +1,200 @@
+"""
+Buffers for ``O_DIRECT`` and large sequential I/O.
+
+``O_DIRECT`` transfers bypass the page cache, and the kernel rejects them
+with ``EINVAL`` unless the memory, the file offset and the length are all
+multiples of the device's logical block size. ``Operation.read()`` takes
+an ``alignment`` for its own buffer; ``aligned_buffer()`` makes one for
+``readinto()`` and writes:
+
+    >>> fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+    >>> block = logical_block_size(fd)
+    >>> op = Operation.read(16 * block, fd, 0, alignment=block)
+
+``BufferArena`` keeps a fixed set of equally sized buffers in one mapping,
+on huge pages where it can get them, to be reused across ``readinto()``
+calls instead of allocated and faulted in afresh for each one.
+"""
+import ctypes
+import mmap
+import os
+import stat
+import struct
+import sys
+
+# <linux/fs.h> _IO(0x12, 104)
+BLKSSZGET = 0x1268
+
+# What every device Linux supports at least accepts
+DEFAULT_BLOCK_SIZE = 512
+
+HUGE_PAGE_SIZE = 2 << 20
+# Not exported by the mmap module - <linux/mman.h>, generic value
+MAP_HUGETLB = getattr(
+    mmap, "MAP_HUGETLB", 0x40000 if sys.platform == "linux" else 0,
+)
+
+
+def check_alignment(alignment: int) -> int:
+    if alignment <= 0 or alignment & (alignment - 1):
+        raise ValueError("alignment must be a power of two")
+    return alignment
+
+
+def aligned_buffer(size: int, alignment: int = mmap.PAGESIZE) -> memoryview:
+    """
+    Writable, zero-filled ``size`` bytes starting on an ``alignment``
+    boundary. Backed by an anonymous mapping, kept alive by the returned
+    view.
+    """
+    check_alignment(alignment)
+    if size < 0:
+        raise ValueError(f"size must not be negative, got {size}")
+
+    # Mappings start on a page boundary - only a coarser alignment needs
+    # the slack to move the start forward.
+    slack = alignment if alignment > mmap.PAGESIZE else 0
+    area = mmap.mmap(-1, max(size + slack, 1))
+    anchor = ctypes.c_char.from_buffer(area)
+    skip = -ctypes.addressof(anchor) % alignment
+    del anchor
+    return memoryview(area)[skip:skip + size]
+
+
+def _sysfs_block_size(device: int) -> int | None:
+    base = f"/sys/dev/block/{os.major(device)}:{os.minor(device)}"
+    # A partition has no queue of its own - its disk's is one level up
+    for path in (base, os.path.join(base, "..")):
+        try:
+            with open(os.path.join(path, "queue", "logical_block_size")) as fp:
+                return int(fp.read())
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def logical_block_size(fd: int) -> int:
+    """
+    The smallest unit ``O_DIRECT`` I/O on ``fd`` must be aligned to.
+
+    Asked with ``BLKSSZGET`` for a block device, and from sysfs for the
+    device backing a regular file. Where neither answers (not Linux,
+    network or virtual filesystems) it's the filesystem's block size, a
+    multiple of the logical one.
+    """
+    st = os.fstat(fd)
+    if stat.S_ISBLK(st.st_mode):
+        try:
+            import fcntl
+            result = fcntl.ioctl(fd, BLKSSZGET, struct.pack("i", 0))
+            return struct.unpack("i", result)[0]
+        except (ImportError, OSError):
+            pass
+    else:
+        size = _sysfs_block_size(st.st_dev)
+        if size:
+            return size
+
+    try:
+        return os.fstatvfs(fd).f_bsize or DEFAULT_BLOCK_SIZE
+    except (AttributeError, OSError):
+        return DEFAULT_BLOCK_SIZE
+
+
+class BufferArena:
+    """
+    ``count`` buffers of ``buffer_size`` bytes, each page aligned, carved
+    out of one mapping. Backed by hugetlbfs pages when ``hugepages`` is set
+    and the system has them reserved, otherwise by normal pages advised
+    for transparent huge pages. The ``hugepages`` attribute tells which
+    one it got.
+
+    ``acquire()`` hands out a free buffer, ``release()`` takes it back and
+    releases the view, which can't be used after that. When all of them
+    are in use ``acquire()`` maps a new one instead of failing -
+    ``release()`` just drops those.
+    """
+
+    def __init__(self, buffer_size: int, count: int, hugepages: bool = True):
+        if buffer_size <= 0 or count <= 0:
+            raise ValueError("buffer_size and count must be positive")
+
+        self.buffer_size = buffer_size
+        self.count = count
+        self.hugepages = False
+        self._stride = -(-buffer_size // mmap.PAGESIZE) * mmap.PAGESIZE
+        self._map = self._create_map(self._stride * count, hugepages)
+        self._view = memoryview(self._map)
+        self._free = list(range(count - 1, -1, -1))
+        self._lent: dict[int, tuple[int, memoryview]] = {}
+
+    def _create_map(self, size: int, hugepages: bool) -> mmap.mmap:
+        if hugepages and MAP_HUGETLB:
+            try:
+                area = mmap.mmap(
+                    -1, -(-size // HUGE_PAGE_SIZE) * HUGE_PAGE_SIZE,
+                    flags=mmap.MAP_PRIVATE | MAP_HUGETLB,
+                )
+            except OSError:
+                # None reserved (vm.nr_hugepages) or not permitted
+                pass
+            else:
+                self.hugepages = True
+                return area
+
+        area = mmap.mmap(-1, size)
+        if hugepages and hasattr(mmap, "MADV_HUGEPAGE"):
+            try:
+                area.madvise(mmap.MADV_HUGEPAGE)
+            except OSError:
+                pass
+        # Fault everything in now rather than on the first read into it
+        for offset in range(0, size, mmap.PAGESIZE):
+            area[offset] = 0
+        return area
+
+    @property
+    def available(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> memoryview:
+        if not self._free:
+            return aligned_buffer(self.buffer_size)
+        index = self._free.pop()
+        start = index * self._stride
+        buffer = self._view[start:start + self.buffer_size]
+        self._lent[id(buffer)] = (index, buffer)
+        return buffer
+
+    def release(self, buffer: memoryview) -> None:
+        entry = self._lent.get(id(buffer))
+        if entry is None or entry[1] is not buffer:
+            return
+        # BufferError, leaving it lent, while something still exports it
+        buffer.release()
+        del self._lent[id(buffer)]
+        self._free.append(entry[0])
+
+    def close(self) -> None:
+        """
+        Unmaps the arena, releasing the buffers still lent out. Raises
+        BufferError, and the arena stays as it was, while its memory is
+        still in use - by a view sliced out of a buffer, or an operation
+        reading into one.
+        """
+        for _, buffer in self._lent.values():
+            buffer.release()
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            self._view = memoryview(self._map)
+            raise
+        self._lent.clear()
+        self._free.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,62 @@
+"""
+I/O scheduling classes for the ``priority`` argument every
+``Operation`` constructor accepts.
+
+Every backend reads it the same way. 0, the default, asks for nothing in
+particular: the request gets the submitting thread's own I/O priority,
+which is ``IOPRIO_NORM`` of the best-effort class unless it was changed.
+A plain ``priority`` of 1 to 7 is that level of the best-effort class, 1
+being the most urgent - so 1 to 3 run ahead of the default and 5 to 7
+behind it. ``ioprio_value()`` builds a priority that carries a class as
+well, the same bit layout as the kernel's
+``IOPRIO_PRIO_VALUE(class, level)``:
+
+    >>> from caio.ioprio import IoprioClass, ioprio_value
+    >>> scrub = ioprio_value(IoprioClass.IDLE)
+    >>> op = Operation.read(4096, fd, 0, priority=scrub)
+
+``linux_uring`` and ``linux_aio`` pass it to the kernel as the request's
+ioprio - the realtime class needs ``CAP_SYS_ADMIN``. ``thread_aio`` and
+``python_aio`` only order their own worker queue by it: realtime first,
+idle last, the default at ``IOPRIO_NORM``.
+"""
+from enum import IntEnum, unique
+
+IOPRIO_CLASS_SHIFT = 13
+IOPRIO_LEVELS = 8
+# The kernel's IOPRIO_NORM - the best-effort level of a nice 0 thread
+IOPRIO_NORM = 4
+
+
+@unique
+class IoprioClass(IntEnum):
+    NONE = 0
+    RT = 1
+    BE = 2
+    IDLE = 3
+
+
+def ioprio_value(ioprio_class: IoprioClass, level: int = 0) -> int:
+    if not 0 <= level < IOPRIO_LEVELS:
+        raise ValueError(
+            f"level must be between 0 and {IOPRIO_LEVELS - 1}, got {level}",
+        )
+    return (IoprioClass(ioprio_class) << IOPRIO_CLASS_SHIFT) | level
+
+
+def ioprio_class(priority: int) -> IoprioClass:
+    return IoprioClass(priority >> IOPRIO_CLASS_SHIFT)
+
+
+def queue_level(priority: int) -> int:
+    """Worker queue level for a priority, 0 runs first - what thread_aio
+    and python_aio order by."""
+    if priority == 0:
+        return IOPRIO_NORM
+    level = priority & ((1 << IOPRIO_CLASS_SHIFT) - 1)
+    cls = priority >> IOPRIO_CLASS_SHIFT
+    if cls == IoprioClass.RT:
+        return 0
+    if cls == IoprioClass.IDLE:
+        return IOPRIO_LEVELS - 1
+    return min(max(level, 0), IOPRIO_LEVELS - 1)
@@ -5,6 +5,7 @@
 #include <stdlib.h>
 #include <sys/eventfd.h>
 #include <sys/syscall.h>
+#include <sys/uio.h>
 #include <stdint.h>
 #include <unistd.h>
 
@@ -40,11 +41,36 @@
 #endif
 #include <sys/utsname.h>
 
+#include "src/freelist/freelist.h"
+#include "src/ioprio/ioprio.h"
+#include "src/rwflags/rwflags.h"
+
+#ifndef IOCB_FLAG_IOPRIO
+#define IOCB_FLAG_IOPRIO (1 << 1)   /* Linux 4.18 */
+#endif
+
 
 static const unsigned CTX_MAX_REQUESTS_DEFAULT = 32;
 static const unsigned EV_MAX_REQUESTS_DEFAULT = 512;
+
+/* UIO_MAXIOV - the kernel rejects preadv/pwritev with more iovecs */
+#ifndef IOV_MAX
+#define IOV_MAX 1024
+#endif
 static int kernel_support = -1;
 
+/* Recycled Operation objects and PREAD/PREADV buffers, see freelist.h */
+static caio_freelist_t freelist = CAIO_FREELIST_INIT;
+
+/* set_zero_fill(): zero read buffers up front instead of only the part
+ * the kernel didn't fill, once the read completes */
+static int zero_fill = 0;
+
+/* Cleared once io_submit() turns IOCB_FLAG_IOPRIO down - kernels before
+ * 4.18 fail any iocb that sets it with EINVAL. Priorities are dropped
+ * from then on rather than failing every submit that has one. */
+static int iocb_ioprio_supported = 1;
+
 inline static int io_setup(unsigned nr, aio_context_t *ctxp) {
     return syscall(__NR_io_setup, nr, ctxp);
 }
@@ -63,6 +89,50 @@ inline static int io_getevents(
 }
 
 
+/* The completion ring io_setup() maps at the aio_context_t address itself
+ * (fs/aio.c) - a layout userspace has relied on since 2.6, libaio and fio
+ * reap from it the same way. */
+#define AIO_RING_MAGIC 0xa10a10a1
+
+struct aio_ring {
+    unsigned id;
+    unsigned nr;        /* io_events entries */
+    unsigned head;      /* next to consume - written by whoever consumes */
+    unsigned tail;      /* next to fill - written by the kernel */
+    unsigned magic;
+    unsigned compat_features;
+    unsigned incompat_features;
+    unsigned header_length;
+    struct io_event io_events[];
+};
+
+
+/* Copies up to `max_nr` completions straight off the ring, with no
+ * syscall. -1 if the ring isn't laid out as expected - io_getevents()
+ * is the only way then. Callers must make sure nothing else consumes
+ * from this ring meanwhile, io_getevents() included. */
+static int aio_ring_reap(
+    aio_context_t ctx, struct io_event *events, unsigned max_nr
+) {
+    struct aio_ring *ring = (struct aio_ring *)(uintptr_t) ctx;
+    if (ring->magic != AIO_RING_MAGIC || ring->incompat_features != 0)
+        return -1;
+
+    unsigned nr = ring->nr;
+    unsigned head = ring->head % nr;
+    unsigned tail = __atomic_load_n(&ring->tail, __ATOMIC_ACQUIRE) % nr;
+    unsigned count = 0;
+
+    while (head != tail && count < max_nr) {
+        events[count++] = ring->io_events[head];
+        head = (head + 1) % nr;
+    }
+    if (count > 0)
+        __atomic_store_n(&ring->head, head, __ATOMIC_RELEASE);
+    return (int) count;
+}
+
+
 inline static int io_submit(aio_context_t ctx, long nr, struct iocb **iocbpp) {
     return syscall(__NR_io_submit, ctx, nr, iocbpp);
 }
@@ -155,7 +225,15 @@ typedef struct {
     aio_context_t ctx;
     int32_t fileno;
     uint32_t max_requests;
+    PyObject* batch_callback;   /* set_batch_callback(), or NULL */
     PyObject* weakreflist;
+    /* process_events()' buffer, kept between calls - NULL while a call
+     * has it, so a callback re-entering process_events() gets its own */
+    struct io_event* events;
+    uint32_t events_capacity;
+    /* Threads inside io_getevents() on this context - the ring is only
+     * reaped from userspace while there are none */
+    uint32_t getevents_waiters;
 } AIOContext;
 
 
@@ -165,12 +243,29 @@ typedef struct {
     PyObject* py_buffer;
     PyObject* callback;
     char* buffer;
+    size_t buffer_capacity; /* buffer's real size, for the free list */
+    uint8_t dirty;          /* buffer allocated uninitialized and not
+                             * yet settled (AIOOperation_settle_buffer) */
+    uint8_t aligned;        /* PREAD: buffer from caio_aligned_buffer_get(),
+                             * freed with free() instead */
     int error;
     uint8_t in_progress;
     uint8_t done;   /* genuine completion reached - unlike in_progress
                      * (sticky forever, guards resubmission), this is what
                      * payload/get_value() gate on */
     struct iocb iocb;
+    uint16_t priority;      /* as passed - aio_reqprio gets the kernel
+                             * value at submit, see src/ioprio/ioprio.h */
+    /* PREADV/PWRITEV: aio_buf points at iov and aio_nbytes holds iovcnt
+     * until completion, so the byte total is kept separately. */
+    struct iovec* iov;
+    Py_buffer* views;       /* PWRITEV: one held export per iovec */
+    int iovcnt;
+    uint64_t iov_nbytes;
+    /* readinto(): the caller's buffer, which aio_buf points straight
+     * into - held until completion (target.obj != NULL). buffer stays
+     * NULL, there's nothing of our own to free. */
+    Py_buffer target;
     PyObject* weakreflist;
 } AIOOperation;
 
@@ -188,6 +283,30 @@ static PyObject *AIOOperation_callback_ref(AIOOperation *self) {
 }
 
 
+static PyObject *AIOContext_batch_callback_ref(AIOContext *self) {
+    PyObject *callback;
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    callback = Py_XNewRef(self->batch_callback);
+    CAIO_END_CRITICAL_SECTION();
+    return callback;
+}
+
+
+/* Zeroes the part of an uninitialized read buffer past the first `filled`
+ * bytes (a short read's tail, or all of it on error / before submission),
+ * so payload never exposes stale heap or recycled buffer contents. */
+static void AIOOperation_settle_buffer(AIOOperation *self, int64_t filled) {
+    if (!self->dirty) return;
+    self->dirty = 0;
+    if (self->py_buffer == NULL) return;
+
+    Py_ssize_t size = PyMemoryView_GET_BUFFER(self->py_buffer)->len;
+    if (filled < 0) filled = 0;
+    if (filled < size)
+        memset(self->buffer + filled, 0, (size_t) (size - filled));
+}
+
+
 static void
 AIOContext_dealloc(AIOContext *self) {
     if (self->weakreflist != NULL)
@@ -205,6 +324,9 @@ AIOContext_dealloc(AIOContext *self) {
         self->fileno = -1;
     }
 
+    Py_CLEAR(self->batch_callback);
+    PyMem_Free(self->events);
+    self->events = NULL;
     Py_TYPE(self)->tp_free((PyObject *) self);
 }
 
@@ -329,6 +451,13 @@ static PyObject* AIOContext_submit(AIOContext *self, PyObject *args) {
 
         op->iocb.aio_flags |= IOCB_FLAG_RESFD;
         op->iocb.aio_resfd = self->fileno;
+        op->iocb.aio_reqprio = 0;
+        op->iocb.aio_flags &= ~IOCB_FLAG_IOPRIO;
+        if (CAIO_ATOMIC_LOAD(iocb_ioprio_supported)) {
+            op->iocb.aio_reqprio = caio_ioprio_value(op->priority);
+            if (op->iocb.aio_reqprio != 0)
+                op->iocb.aio_flags |= IOCB_FLAG_IOPRIO;
+        }
 
         claimed[to_submit] = op;
         iocbpp[to_submit] = &op->iocb;
@@ -343,6 +472,24 @@ static PyObject* AIOContext_submit(AIOContext *self, PyObject *args) {
 
     int result = io_submit(self->ctx, to_submit, iocbpp);
 
+    /* Once, on the first kernel found not to know IOCB_FLAG_IOPRIO: the
+     * same batch again without it. Only if that gets through was the flag
+     * the problem - otherwise it's reported as is. */
+    if (result < 0 && errno == EINVAL &&
+            (iocbpp[0]->aio_flags & IOCB_FLAG_IOPRIO) &&
+            CAIO_ATOMIC_LOAD(iocb_ioprio_supported)) {
+        for (Py_ssize_t i = 0; i < to_submit; i++) {
+            iocbpp[i]->aio_flags &= ~IOCB_FLAG_IOPRIO;
+            iocbpp[i]->aio_reqprio = 0;
+        }
+        result = io_submit(self->ctx, to_submit, iocbpp);
+        if (result >= 0) {
+            CAIO_ATOMIC_STORE(iocb_ioprio_supported, 0);
+        } else {
+            errno = EINVAL;
+        }
+    }
+
     if (io_submit_error(result) < 0) {
         /* Nothing reached the kernel - roll back every claim above so
          * each op is exactly as retryable as it was before this call. */
@@ -413,6 +560,9 @@ static PyObject* AIOContext_cancel(AIOContext *self, PyObject *args, PyObject *k
         op->error = -ev.res;
     }
 
+    AIOOperation_settle_buffer(op, ev.res);
+    if (op->target.obj != NULL) PyBuffer_Release(&op->target);
+
     /* io_cancel() succeeding delivers this event synchronously, right
      * here - it will never also show up via process_events()'s own
      * io_getevents() loop, so this op's submit()-time context reference
@@ -434,6 +584,14 @@ static PyObject* AIOContext_cancel(AIOContext *self, PyObject *args, PyObject *k
         }
         Py_DECREF(rv);
         Py_DECREF(callback);
+    } else if ((callback = AIOContext_batch_callback_ref(self)) != NULL) {
+        PyObject *rv = PyObject_CallFunction(callback, "[O]", op);
+        Py_DECREF(callback);
+        if (rv == NULL) {
+            Py_DECREF(op);
+            return NULL;
+        }
+        Py_DECREF(rv);
     }
 
     Py_DECREF(op);
@@ -441,6 +599,22 @@ static PyObject* AIOContext_cancel(AIOContext *self, PyObject *args, PyObject *k
     return (PyObject*) PyLong_FromSsize_t(ev.res);
 }
 
+/* Hands process_events()' buffer back for the next call, unless a
+ * re-entrant call already did with its own. */
+static void AIOContext_put_events(
+    AIOContext *self, struct io_event *events, uint32_t capacity
+) {
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    if (self->events == NULL) {
+        self->events = events;
+        self->events_capacity = capacity;
+        events = NULL;
+    }
+    CAIO_END_CRITICAL_SECTION();
+    PyMem_Free(events);
+}
+
+
 PyDoc_STRVAR(AIOContext_process_events_docstring,
     "Gather events for Context.\n\n"
     "    Context.process_events(max_requests=512, min_requests=0, timeout=0) -> int\n\n"
@@ -509,28 +683,72 @@ static PyObject* AIOContext_process_events(
         return NULL;
     }
 
-    struct io_event *events = PyMem_New(struct io_event, max_requests);
+    struct io_event *events;
+    uint32_t events_capacity;
+    int reaped = -1;
+
+    {
+        CAIO_BEGIN_CRITICAL_SECTION(self);
+        events = self->events;
+        events_capacity = self->events_capacity;
+        self->events = NULL;
+        self->events_capacity = 0;
+
+        if (events_capacity < max_requests) {
+            PyMem_Free(events);
+            events = PyMem_New(struct io_event, max_requests);
+            events_capacity = events != NULL ? max_requests : 0;
+        }
+
+        /* Completions already on the ring are copied off it here, while
+         * nothing else can be consuming: a thread only enters
+         * io_getevents() after counting itself in getevents_waiters
+         * inside this same section (the GIL, without free-threading). */
+        if (events != NULL &&
+                CAIO_ATOMIC_LOAD(self->getevents_waiters) == 0) {
+            reaped = aio_ring_reap(self->ctx, events, max_requests);
+        }
+        if (events != NULL && (reaped < 0 || (uint32_t) reaped < min_requests))
+            __atomic_add_fetch(&self->getevents_waiters, 1, __ATOMIC_ACQ_REL);
+        CAIO_END_CRITICAL_SECTION();
+    }
+
     if (events == NULL) {
         PyErr_NoMemory();
         return NULL;
     }
 
-    /* io_getevents() can block for up to `timeout` - release the GIL so
-     * this doesn't freeze every other thread in the interpreter for the
-     * duration, defeating the entire point of using this asynchronously. */
-    int result;
-    Py_BEGIN_ALLOW_THREADS
-    result = io_getevents(
-        self->ctx,
-        min_requests,
-        max_requests,
-        events,
-        timeout_arg
-    );
-    Py_END_ALLOW_THREADS
+    int result = reaped;
+    if (reaped < 0 || (uint32_t) reaped < min_requests) {
+        int offset = reaped > 0 ? reaped : 0;
+
+        /* io_getevents() can block for up to `timeout` - release the GIL
+         * so this doesn't freeze every other thread in the interpreter for
+         * the duration, defeating the entire point of using this
+         * asynchronously. */
+        Py_BEGIN_ALLOW_THREADS
+        result = io_getevents(
+            self->ctx,
+            min_requests - offset,
+            max_requests - offset,
+            events + offset,
+            timeout_arg
+        );
+        Py_END_ALLOW_THREADS
+        __atomic_sub_fetch(&self->getevents_waiters, 1, __ATOMIC_ACQ_REL);
+
+        if (result >= 0) {
+            result += offset;
+        } else if (offset > 0) {
+            /* The ring's share is consumed either way - deliver it */
+            result = offset;
+        }
+    }
 
     if (result < 0) {
-        PyMem_Free(events);
+        int error = errno;
+        AIOContext_put_events(self, events, events_capacity);
+        errno = error;
         PyErr_SetFromErrno(PyExc_SystemError);
         return NULL;
     }
@@ -552,6 +770,13 @@ static PyObject* AIOContext_process_events(
      * forever once genuinely submitted, matching thread_aio and the
      * (paused) Rust rewrite: a completed Operation must not be
      * resubmittable, only a fresh one constructed for a retry. */
+    /* Operations with no callback of their own are gathered here for one
+     * batch callback call at the end, when the Context has one. */
+    PyObject *batch_callback = AIOContext_batch_callback_ref(self);
+    PyObject *batch = batch_callback != NULL ? PyList_New(0) : NULL;
+    if (batch_callback != NULL && batch == NULL)
+        PyErr_WriteUnraisable(batch_callback);
+
     int32_t i;
     for (i = 0; i < result; i++) {
         ev = &events[i];
@@ -564,6 +789,10 @@ static PyObject* AIOContext_process_events(
             op->error = -ev->res;
         }
 
+        AIOOperation_settle_buffer(op, ev->res);
+        // readinto(): the kernel is done with the caller's buffer
+        if (op->target.obj != NULL) PyBuffer_Release(&op->target);
+
         Py_CLEAR(op->context);
         CAIO_ATOMIC_STORE(op->done, 1);
 
@@ -576,16 +805,59 @@ static PyObject* AIOContext_process_events(
                 Py_DECREF(rv);
             }
             Py_DECREF(callback);
+        } else if (batch != NULL &&
+                   PyList_Append(batch, (PyObject *) op) < 0) {
+            PyErr_WriteUnraisable(batch_callback);
         }
 
         Py_DECREF(op);
     }
 
-    PyMem_Free(events);
+    AIOContext_put_events(self, events, events_capacity);
+
+    /* Like a per-Operation callback, anything this raises is reported,
+     * not propagated - the completions are already consumed. */
+    if (batch != NULL && PyList_GET_SIZE(batch) > 0) {
+        PyObject *rv = PyObject_CallOneArg(batch_callback, batch);
+        if (rv == NULL) {
+            PyErr_WriteUnraisable(batch_callback);
+        } else {
+            Py_DECREF(rv);
+        }
+    }
+    Py_XDECREF(batch);
+    Py_XDECREF(batch_callback);
+
     return (PyObject*) PyLong_FromSsize_t(i);
 }
 
 
+PyDoc_STRVAR(AIOContext_set_batch_callback_docstring,
+    "Sets a callback for completions delivered all at once.\n\n"
+    "    Context.set_batch_callback(callback) -> None\n\n"
+    "    Every process_events() call hands the Operations it completed\n"
+    "    that have no callback of their own to callback(operations) - one\n"
+    "    call per batch instead of one per Operation. None removes it."
+);
+static PyObject* AIOContext_set_batch_callback(
+    AIOContext *self, PyObject *callback
+) {
+    if (callback != Py_None && !PyCallable_Check(callback)) {
+        PyErr_Format(PyExc_ValueError, "object %r is not callable", callback);
+        return NULL;
+    }
+
+    PyObject *old_callback;
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    old_callback = self->batch_callback;
+    self->batch_callback = callback == Py_None ? NULL : Py_NewRef(callback);
+    CAIO_END_CRITICAL_SECTION();
+    Py_XDECREF(old_callback);
+
+    Py_RETURN_NONE;
+}
+
+
 PyDoc_STRVAR(AIOContext_poll_docstring,
         "Read value from context file descriptor.\n\n"
         "    Context().poll() -> int"
@@ -657,6 +929,11 @@ static PyMethodDef AIOContext_methods[] = {
         (PyCFunction) AIOContext_poll, METH_NOARGS,
         AIOContext_poll_docstring
     },
+    {
+        "set_batch_callback",
+        (PyCFunction) AIOContext_set_batch_callback, METH_O,
+        AIOContext_set_batch_callback_docstring
+    },
     {NULL}  /* Sentinel */
 };
 
@@ -687,20 +964,51 @@ AIOOperation_traverse(AIOOperation *self, visitproc visit, void *arg) {
 }
 
 
+/* Releases readv()/writev()'s iovec array and, for writev(), the buffer
+ * exports it points into - never while in flight, submit() holds a
+ * reference to the Operation until its completion is reaped. */
+static void
+AIOOperation_release_iov(AIOOperation *self) {
+    if (self->views != NULL) {
+        for (int i = 0; i < self->iovcnt; i++)
+            PyBuffer_Release(&self->views[i]);
+        PyMem_Free(self->views);
+        self->views = NULL;
+    }
+    PyMem_Free(self->iov);
+    self->iov = NULL;
+    self->iovcnt = 0;
+}
+
+
 static int
 AIOOperation_clear(AIOOperation *self) {
     Py_CLEAR(self->context);
     Py_CLEAR(self->callback);
-
-    /* self->buffer is a separate PyMem_Calloc allocation py_buffer's own
-     * memoryview only views, not owns - clearing py_buffer alone would
-     * leak it (and, if this runs before this Operation's own eventual
-     * dealloc, that dealloc's identical free-then-NULL below prevents a
-     * double free only because this already set it to NULL). */
-    if (self->iocb.aio_lio_opcode == IOCB_CMD_PREAD && self->buffer != NULL) {
-        PyMem_Free(self->buffer);
+    AIOOperation_release_iov(self);
+    if (self->target.obj != NULL) PyBuffer_Release(&self->target);
+
+    /* self->buffer is a separate allocation py_buffer's own memoryview
+     * only views, not owns - clearing py_buffer alone would leak it (and,
+     * if this runs before this Operation's own eventual dealloc, that
+     * dealloc's identical free-then-NULL below prevents a double free
+     * only because this already set it to NULL). It goes back to the
+     * free list only if no memoryview handed out can still reach it. */
+    if ((self->iocb.aio_lio_opcode == IOCB_CMD_PREAD ||
+         self->iocb.aio_lio_opcode == IOCB_CMD_PREADV) &&
+            self->buffer != NULL) {
+        if (self->aligned) {
+            free(self->buffer);
+        } else if (caio_freelist_view_is_private(self->py_buffer)) {
+            caio_freelist_buffer_put(
+                &freelist, self->buffer, self->buffer_capacity
+            );
+        } else {
+            PyMem_Free(self->buffer);
+        }
         self->buffer = NULL;
     }
+    self->aligned = 0;
 
     Py_CLEAR(self->py_buffer);
     return 0;
@@ -715,16 +1023,51 @@ AIOOperation_dealloc(AIOOperation *self) {
         PyObject_ClearWeakRefs((PyObject *) self);
 
     AIOOperation_clear(self);
+
+    if (Py_TYPE(self) == AIOOperationTypeP &&
+            caio_freelist_object_put(&freelist, (PyObject *) self))
+        return;
+
     Py_TYPE(self)->tp_free((PyObject *) self);
 }
 
 
+/* Read buffer of `size` bytes, from the free list when a cached one of
+ * its size class is available - or, for a nonzero `alignment`, a private
+ * aligned allocation. Left uninitialized unless set_zero_fill() is on -
+ * the kernel is about to overwrite it anyway, and whatever it doesn't is
+ * zeroed by AIOOperation_settle_buffer() before anything can see it. */
+static char* AIOOperation_alloc_buffer(
+    AIOOperation *self, size_t size, size_t alignment
+) {
+    char* buffer;
+    if (alignment) {
+        buffer = caio_aligned_buffer_get(size, alignment);
+        self->buffer_capacity = size;
+        self->aligned = buffer != NULL;
+    } else {
+        buffer = caio_freelist_buffer_get(
+            &freelist, size, &self->buffer_capacity
+        );
+    }
+    if (buffer == NULL) return NULL;
+
+    if (zero_fill) {
+        memset(buffer, 0, size);
+    } else {
+        self->dirty = 1;
+    }
+    return buffer;
+}
+
+
 static PyObject* AIOOperation_repr(AIOOperation *self) {
     char* mode;
 
     switch (self->iocb.aio_lio_opcode) {
         case IOCB_CMD_PREAD:
-            mode = "read";
+            mode = self->buffer == NULL && self->py_buffer != NULL
+                ? "readinto" : "read";
             break;
 
         case IOCB_CMD_PWRITE:
@@ -738,6 +1081,14 @@ static PyObject* AIOOperation_repr(AIOOperation *self) {
         case IOCB_CMD_FDSYNC:
             mode = "fdsync";
             break;
+
+        case IOCB_CMD_PREADV:
+            mode = "readv";
+            break;
+
+        case IOCB_CMD_PWRITEV:
+            mode = "writev";
+            break;
         default:
             mode = "noop";
             break;
@@ -761,15 +1112,25 @@ PyDoc_STRVAR(AIOOperation_read_docstring,
     "        aio_context: Context,\n"
     "        fd: int, \n"
     "        offset: int,\n"
-    "        priority=0\n"
-    "    )"
+    "        priority=0,\n"
+    "        *,\n"
+    "        alignment=0,\n"
+    "        flags=0\n"
+    "    )\n\n"
+    "A nonzero alignment (a power of two) allocates the buffer on that\n"
+    "boundary, as O_DIRECT requires. flags are RWF_* request flags, see\n"
+    "caio.rwflags."
 );
 static PyObject* AIOOperation_read(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
-    static char *kwlist[] = {"nbytes", "fd", "offset", "priority", NULL};
+    static char *kwlist[] = {
+        "nbytes", "fd", "offset", "priority", "alignment", "flags", NULL
+    };
 
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
@@ -777,6 +1138,7 @@ static PyObject* AIOOperation_read(
     }
 
     memset(&self->iocb, 0, sizeof(struct iocb));
+    self->priority = 0;
 
     self->iocb.aio_data = (uint64_t)(uintptr_t) self;
     self->context = NULL;
@@ -787,26 +1149,34 @@ static PyObject* AIOOperation_read(
     self->weakreflist = NULL;
 
     uint64_t nbytes = 0;
+    Py_ssize_t alignment = 0;
+    int flags = 0;
 
     int argIsOk = PyArg_ParseTupleAndKeywords(
-        args, kwds, "KI|Lh", kwlist,
+        args, kwds, "KI|Lh$ni", kwlist,
         &nbytes,
         &(self->iocb.aio_fildes),
         &(self->iocb.aio_offset),
-        &(self->iocb.aio_reqprio)
+        &(self->priority),
+        &alignment,
+        &flags
     );
 
-    if (!argIsOk) {
+    if (!argIsOk || !caio_alignment_check(alignment) ||
+            !caio_rwflags_check(flags, CAIO_RWF_ALL)) {
         Py_DECREF(self);
         return NULL;
     }
+    self->iocb.aio_rw_flags = flags;
 
-    /* PyMem_Calloc can return NULL for a large enough (or just OOM-at-the-
+    /* The allocation can fail for a large enough (or just OOM-at-the-
      * time) nbytes - proceeding with a NULL buf would hand the kernel (via
      * aio_buf) and PyMemoryView_FromMemory a NULL pointer with a nonzero
      * declared size, corrupting memory instead of raising a catchable
      * error. */
-    self->buffer = PyMem_Calloc(nbytes, sizeof(char));
+    self->buffer = AIOOperation_alloc_buffer(
+        self, nbytes, (size_t) alignment
+    );
     if (self->buffer == NULL && nbytes > 0) {
         Py_DECREF(self);
         PyErr_NoMemory();
@@ -833,16 +1203,23 @@ PyDoc_STRVAR(AIOOperation_write_docstring,
     "        payload_bytes: bytes,\n"
     "        fd: int, \n"
     "        offset: int,\n"
-    "        priority=0\n"
-    "    )"
+    "        priority=0,\n"
+    "        *,\n"
+    "        flags=0\n"
+    "    )\n\n"
+    "flags are RWF_* request flags, see caio.rwflags."
 );
 
 static PyObject* AIOOperation_write(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
-    static char *kwlist[] = {"payload_bytes", "fd", "offset", "priority", NULL};
+    static char *kwlist[] = {
+        "payload_bytes", "fd", "offset", "priority", "flags", NULL
+    };
 
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
@@ -850,6 +1227,7 @@ static PyObject* AIOOperation_write(
     }
 
     memset(&self->iocb, 0, sizeof(struct iocb));
+    self->priority = 0;
 
     self->iocb.aio_data = (uint64_t)(uintptr_t) self;
 
@@ -868,19 +1246,22 @@ static PyObject* AIOOperation_write(
      * assigned (and incref'd) below once confirmed to actually be the
      * bytes object this Operation is going to own. */
     PyObject *payload_bytes = NULL;
+    int flags = 0;
 
     int argIsOk = PyArg_ParseTupleAndKeywords(
-        args, kwds, "OI|Lh", kwlist,
+        args, kwds, "OI|Lh$i", kwlist,
         &payload_bytes,
         &(self->iocb.aio_fildes),
         &(self->iocb.aio_offset),
-        &(self->iocb.aio_reqprio)
+        &(self->priority),
+        &flags
     );
 
-    if (!argIsOk) {
+    if (!argIsOk || !caio_rwflags_check(flags, CAIO_RWF_ALL)) {
         Py_DECREF(self);
         return NULL;
     }
+    self->iocb.aio_rw_flags = flags;
 
     if (!PyBytes_Check(payload_bytes)) {
         Py_DECREF(self);
@@ -916,6 +1297,312 @@ static PyObject* AIOOperation_write(
 }
 
 
+/* Validates the readv()/writev() iovec count and allocates the array.
+ * Returns NULL with an exception set if it's out of range. */
+static struct iovec* AIOOperation_alloc_iov(Py_ssize_t count) {
+    if (count < 1 || count > IOV_MAX) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "expected between 1 and %d buffers, got %zd", IOV_MAX, count
+        );
+        return NULL;
+    }
+
+    struct iovec* iov = PyMem_New(struct iovec, count);
+    if (iov == NULL) PyErr_NoMemory();
+    return iov;
+}
+
+
+/*
+   AIOOperation.readinto classmethod definition
+   */
+PyDoc_STRVAR(AIOOperation_readinto_docstring,
+    "Creates a new instance of Operation reading into a caller's buffer.\n\n"
+    "    Operation.readinto(\n"
+    "        buffer: writable buffer,\n"
+    "        fd: int, \n"
+    "        offset: int,\n"
+    "        priority=0\n"
+    "    )\n\n"
+    "    The kernel fills buffer directly; get_value() returns the number\n"
+    "    of bytes read. buffer stays exported until completion."
+);
+static PyObject* AIOOperation_readinto(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+
+    static char *kwlist[] = {"buffer", "fd", "offset", "priority", NULL};
+
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
+        return NULL;
+    }
+
+    memset(&self->iocb, 0, sizeof(struct iocb));
+    self->priority = 0;
+
+    self->iocb.aio_data = (uint64_t)(uintptr_t) self;
+    self->context = NULL;
+    self->buffer = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->weakreflist = NULL;
+
+    PyObject* buffer = NULL;
+
+    int argIsOk = PyArg_ParseTupleAndKeywords(
+        args, kwds, "OI|Lh", kwlist,
+        &buffer,
+        &(self->iocb.aio_fildes),
+        &(self->iocb.aio_offset),
+        &(self->priority)
+    );
+
+    if (!argIsOk) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    if (PyObject_GetBuffer(buffer, &self->target, PyBUF_WRITABLE)) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->py_buffer = buffer;
+    Py_INCREF(self->py_buffer);
+
+    self->iocb.aio_lio_opcode = IOCB_CMD_PREAD;
+    self->iocb.aio_buf = (uint64_t)(uintptr_t) self->target.buf;
+    self->iocb.aio_nbytes = self->target.len;
+
+    return (PyObject*) self;
+}
+
+
+/*
+   AIOOperation.readv classmethod definition
+   */
+PyDoc_STRVAR(AIOOperation_readv_docstring,
+    "Creates a new instance of Operation on vectored read mode.\n\n"
+    "    Operation.readv(\n"
+    "        sizes: Sequence[int],\n"
+    "        fd: int, \n"
+    "        offset: int,\n"
+    "        priority=0\n"
+    "    )\n\n"
+    "    get_value() returns one bytes object per entry of sizes."
+);
+static PyObject* AIOOperation_readv(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+
+    static char *kwlist[] = {"sizes", "fd", "offset", "priority", NULL};
+
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
+        return NULL;
+    }
+
+    memset(&self->iocb, 0, sizeof(struct iocb));
+    self->priority = 0;
+
+    self->iocb.aio_data = (uint64_t)(uintptr_t) self;
+    self->context = NULL;
+    self->buffer = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->weakreflist = NULL;
+
+    PyObject* sizes = NULL;
+
+    int argIsOk = PyArg_ParseTupleAndKeywords(
+        args, kwds, "OI|Lh", kwlist,
+        &sizes,
+        &(self->iocb.aio_fildes),
+        &(self->iocb.aio_offset),
+        &(self->priority)
+    );
+
+    if (!argIsOk) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->iocb.aio_lio_opcode = IOCB_CMD_PREADV;
+
+    PyObject* seq = PySequence_Fast(sizes, "sizes must be a sequence of ints");
+    if (seq == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+    self->iov = AIOOperation_alloc_iov(count);
+    if (self->iov == NULL) {
+        Py_DECREF(seq);
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->iovcnt = (int) count;
+
+    Py_ssize_t total = 0;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_ssize_t size = PyNumber_AsSsize_t(
+            PySequence_Fast_GET_ITEM(seq, i), PyExc_OverflowError
+        );
+        if (size == -1 && PyErr_Occurred()) {
+            Py_DECREF(seq);
+            Py_DECREF(self);
+            return NULL;
+        }
+        if (size < 0 || size > PY_SSIZE_T_MAX - total) {
+            Py_DECREF(seq);
+            Py_DECREF(self);
+            PyErr_Format(PyExc_ValueError, "invalid size at %zd", i);
+            return NULL;
+        }
+        self->iov[i].iov_len = (size_t) size;
+        total += size;
+    }
+    Py_DECREF(seq);
+
+    /* One contiguous buffer, as for read(), that the iovecs are
+     * consecutive slices of. */
+    self->buffer = AIOOperation_alloc_buffer(self, total, 0);
+    if (self->buffer == NULL && total > 0) {
+        Py_DECREF(self);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    char* base = self->buffer;
+    for (int i = 0; i < self->iovcnt; i++) {
+        self->iov[i].iov_base = base;
+        base += self->iov[i].iov_len;
+    }
+
+    self->iov_nbytes = total;
+    self->iocb.aio_buf = (uint64_t)(uintptr_t) self->iov;
+    self->iocb.aio_nbytes = self->iovcnt;
+    self->py_buffer = PyMemoryView_FromMemory(self->buffer, total, PyBUF_READ);
+    if (self->py_buffer == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    return (PyObject*) self;
+}
+
+
+/*
+   AIOOperation.writev classmethod definition
+   */
+PyDoc_STRVAR(AIOOperation_writev_docstring,
+    "Creates a new instance of Operation on vectored write mode.\n\n"
+    "    Operation.writev(\n"
+    "        buffers: Sequence[bytes],\n"
+    "        fd: int, \n"
+    "        offset: int,\n"
+    "        priority=0\n"
+    "    )\n\n"
+    "    Writes the bytes-like buffers back to back without joining them."
+);
+static PyObject* AIOOperation_writev(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+
+    static char *kwlist[] = {"buffers", "fd", "offset", "priority", NULL};
+
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
+        return NULL;
+    }
+
+    memset(&self->iocb, 0, sizeof(struct iocb));
+    self->priority = 0;
+
+    self->iocb.aio_data = (uint64_t)(uintptr_t) self;
+    self->context = NULL;
+    self->buffer = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->weakreflist = NULL;
+
+    PyObject* buffers = NULL;
+
+    int argIsOk = PyArg_ParseTupleAndKeywords(
+        args, kwds, "OI|Lh", kwlist,
+        &buffers,
+        &(self->iocb.aio_fildes),
+        &(self->iocb.aio_offset),
+        &(self->priority)
+    );
+
+    if (!argIsOk) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->iocb.aio_lio_opcode = IOCB_CMD_PWRITEV;
+
+    /* A private tuple rather than the caller's own sequence - a list
+     * mutated later must not drift from what the iovecs point at. */
+    self->py_buffer = PySequence_Tuple(buffers);
+    if (self->py_buffer == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    Py_ssize_t count = PyTuple_GET_SIZE(self->py_buffer);
+    self->iov = AIOOperation_alloc_iov(count);
+    if (self->iov == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->views = PyMem_New(Py_buffer, count);
+    if (self->views == NULL) {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+
+    Py_ssize_t total = 0;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_buffer* view = &self->views[i];
+        if (PyObject_GetBuffer(
+                PyTuple_GET_ITEM(self->py_buffer, i), view, PyBUF_SIMPLE)) {
+            Py_DECREF(self);
+            return NULL;
+        }
+        // Counted as soon as it's held, so a later failure releases it
+        self->iovcnt = (int) i + 1;
+
+        self->iov[i].iov_base = view->buf;
+        self->iov[i].iov_len = (size_t) view->len;
+        total += view->len;
+    }
+
+    self->iov_nbytes = total;
+    self->iocb.aio_buf = (uint64_t)(uintptr_t) self->iov;
+    self->iocb.aio_nbytes = self->iovcnt;
+
+    return (PyObject*) self;
+}
+
+
 /*
    AIOOperation.fsync classmethod definition
    */
@@ -930,7 +1617,9 @@ PyDoc_STRVAR(AIOOperation_fsync_docstring,
 static PyObject* AIOOperation_fsync(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
     static char *kwlist[] = {"fd", "priority", NULL};
 
@@ -940,6 +1629,7 @@ static PyObject* AIOOperation_fsync(
     }
 
     memset(&self->iocb, 0, sizeof(struct iocb));
+    self->priority = 0;
 
     self->iocb.aio_data = (uint64_t)(uintptr_t) self;
     self->context = NULL;
@@ -952,7 +1642,7 @@ static PyObject* AIOOperation_fsync(
     int argIsOk = PyArg_ParseTupleAndKeywords(
         args, kwds, "I|h", kwlist,
         &(self->iocb.aio_fildes),
-        &(self->iocb.aio_reqprio)
+        &(self->priority)
     );
 
     if (!argIsOk) {
@@ -981,7 +1671,9 @@ PyDoc_STRVAR(AIOOperation_fdsync_docstring,
 static PyObject* AIOOperation_fdsync(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
     static char *kwlist[] = {"fd", "priority", NULL};
 
@@ -991,6 +1683,7 @@ static PyObject* AIOOperation_fdsync(
     }
 
     memset(&self->iocb, 0, sizeof(struct iocb));
+    self->priority = 0;
 
     self->iocb.aio_data = (uint64_t)(uintptr_t) self;
     self->buffer = NULL;
@@ -1002,7 +1695,7 @@ static PyObject* AIOOperation_fdsync(
     int argIsOk = PyArg_ParseTupleAndKeywords(
             args, kwds, "I|h", kwlist,
             &(self->iocb.aio_fildes),
-            &(self->iocb.aio_reqprio)
+            &(self->priority)
             );
 
     if (!argIsOk) {
@@ -1018,6 +1711,30 @@ static PyObject* AIOOperation_fdsync(
 /*
    AIOOperation.get_value method definition
    */
+/* readv()'s result: the first `filled` bytes of the buffer, cut at the
+ * iovec boundaries - always one item per iovec. */
+static PyObject* AIOOperation_split_iov(AIOOperation *self, Py_ssize_t filled) {
+    PyObject* result = PyList_New(self->iovcnt);
+    if (result == NULL) return NULL;
+
+    for (int i = 0; i < self->iovcnt; i++) {
+        Py_ssize_t size = (Py_ssize_t) self->iov[i].iov_len;
+        if (size > filled) size = filled;
+        filled -= size;
+
+        PyObject* chunk = PyBytes_FromStringAndSize(
+            (const char*) self->iov[i].iov_base, size
+        );
+        if (chunk == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, chunk);
+    }
+    return result;
+}
+
+
 PyDoc_STRVAR(AIOOperation_get_value_docstring,
     "Method returns a bytes value of Operation's result or None.\n\n"
     "    Operation.get_value() -> Optional[bytes]"
@@ -1046,6 +1763,11 @@ static PyObject* AIOOperation_get_value(
         return NULL;
     }
 
+    /* readinto() - PREAD too, but into the caller's own buffer */
+    if (self->py_buffer != NULL && self->buffer == NULL &&
+            self->iocb.aio_lio_opcode == IOCB_CMD_PREAD)
+        return PyLong_FromUnsignedLongLong(self->iocb.aio_nbytes);
+
     switch (self->iocb.aio_lio_opcode) {
         case IOCB_CMD_PREAD:
             /* self->buffer can only be NULL here if tp_clear() already
@@ -1061,7 +1783,17 @@ static PyObject* AIOOperation_get_value(
                 self->buffer, self->iocb.aio_nbytes
             );
 
+        case IOCB_CMD_PREADV:
+            if (self->iov == NULL || self->buffer == NULL)
+                Py_RETURN_NONE;
+            return AIOOperation_split_iov(
+                self,
+                CAIO_ATOMIC_LOAD(self->done)
+                    ? self->iocb.aio_nbytes : self->iov_nbytes
+            );
+
         case IOCB_CMD_PWRITE:
+        case IOCB_CMD_PWRITEV:
             return PyLong_FromSsize_t(self->iocb.aio_nbytes);
     }
 
@@ -1129,16 +1861,32 @@ static PyObject *AIOOperation_payload_getter(AIOOperation *self, void *closure)
     if (self->py_buffer == NULL)
         Py_RETURN_NONE;
 
+    /* Not submitted (yet) - nothing was read into it */
+    AIOOperation_settle_buffer(self, 0);
+
     Py_INCREF(self->py_buffer);
     return self->py_buffer;
 }
 
 
+static PyObject *AIOOperation_nbytes_getter(AIOOperation *self, void *closure) {
+    /* Vectored ops keep iovcnt in aio_nbytes until the completion
+     * overwrites it with the transferred byte count. */
+    if (self->iov != NULL && !CAIO_ATOMIC_LOAD(self->done))
+        return PyLong_FromUnsignedLongLong(self->iov_nbytes);
+    return PyLong_FromUnsignedLongLong(self->iocb.aio_nbytes);
+}
+
+
 static PyGetSetDef AIOOperation_getset[] = {
     {
         "payload", (getter) AIOOperation_payload_getter, NULL,
         "payload", NULL
     },
+    {
+        "nbytes", (getter) AIOOperation_nbytes_getter, NULL,
+        "nbytes", NULL
+    },
     {NULL}
 };
 
@@ -1159,7 +1907,7 @@ static PyMemberDef AIOOperation_members[] = {
     },
     {
         "priority", T_USHORT,
-        offsetof(AIOOperation, iocb.aio_reqprio),
+        offsetof(AIOOperation, priority),
         READONLY, "request priority"
     },
     {
@@ -1167,11 +1915,6 @@ static PyMemberDef AIOOperation_members[] = {
         offsetof(AIOOperation, iocb.aio_offset),
         READONLY, "offset"
     },
-    {
-        "nbytes", T_ULONGLONG,
-        offsetof(AIOOperation, iocb.aio_nbytes),
-        READONLY, "nbytes"
-    },
     {NULL}  /* Sentinel */
 };
 
@@ -1203,6 +1946,24 @@ static PyMethodDef AIOOperation_methods[] = {
         METH_CLASS | METH_VARARGS | METH_KEYWORDS,
         AIOOperation_fdsync_docstring
     },
+    {
+        "readinto",
+        (PyCFunction) AIOOperation_readinto,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_readinto_docstring
+    },
+    {
+        "readv",
+        (PyCFunction) AIOOperation_readv,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_readv_docstring
+    },
+    {
+        "writev",
+        (PyCFunction) AIOOperation_writev,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_writev_docstring
+    },
     {
         "get_value",
         (PyCFunction) AIOOperation_get_value, METH_NOARGS,
@@ -1238,11 +1999,74 @@ AIOOperationType = {
 };
 
 
+PyDoc_STRVAR(set_zero_fill_docstring,
+    "Whether read buffers are zero-filled when allocated.\n\n"
+    "    set_zero_fill(enabled: bool) -> bool\n\n"
+    "    Off by default: only the part of a buffer a read did not fill is\n"
+    "    zeroed, after it completes. Returns the previous setting."
+);
+static PyObject* linux_aio_set_zero_fill(PyObject *module, PyObject *arg) {
+    int enabled = PyObject_IsTrue(arg);
+    if (enabled < 0) return NULL;
+
+    int previous = zero_fill;
+    zero_fill = enabled;
+    return PyBool_FromLong(previous);
+}
+
+
+PyDoc_STRVAR(freelist_info_docstring, CAIO_FREELIST_INFO_DOC);
+static PyObject* linux_aio_freelist_info(PyObject *module, PyObject *args) {
+    return caio_freelist_info(&freelist);
+}
+
+
+PyDoc_STRVAR(freelist_trim_docstring, CAIO_FREELIST_TRIM_DOC);
+static PyObject* linux_aio_freelist_trim(PyObject *module, PyObject *args) {
+    return PyLong_FromSize_t(caio_freelist_shrink(&freelist, 0, 0));
+}
+
+
+PyDoc_STRVAR(freelist_set_limits_docstring, CAIO_FREELIST_SET_LIMITS_DOC);
+static PyObject* linux_aio_freelist_set_limits(
+    PyObject *module, PyObject *args, PyObject *kwds
+) {
+    return caio_freelist_set_limits(&freelist, args, kwds);
+}
+
+
+static PyMethodDef linux_aio_methods[] = {
+    {
+        "set_zero_fill",
+        (PyCFunction) linux_aio_set_zero_fill, METH_O,
+        set_zero_fill_docstring
+    },
+    {
+        "freelist_info",
+        (PyCFunction) linux_aio_freelist_info, METH_NOARGS,
+        freelist_info_docstring
+    },
+    {
+        "freelist_trim",
+        (PyCFunction) linux_aio_freelist_trim, METH_NOARGS,
+        freelist_trim_docstring
+    },
+    {
+        "freelist_set_limits",
+        (PyCFunction) linux_aio_freelist_set_limits,
+        METH_VARARGS | METH_KEYWORDS,
+        freelist_set_limits_docstring
+    },
+    {NULL}  /* Sentinel */
+};
+
+
 static PyModuleDef linux_aio_module = {
     PyModuleDef_HEAD_INIT,
     .m_name = "linux_aio",
     .m_doc = "Linux AIO c API bindings.",
     .m_size = -1,
+    .m_methods = linux_aio_methods,
 };
 
 
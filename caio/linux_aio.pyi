@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from .abstract import AbstractContext, AbstractOperation
@@ -12,6 +12,12 @@ class Context(AbstractContext):
 
     def poll(self) -> int: ...
 
+    # Called with the list of completed Operations that have no callback
+    # of their own, once per drained batch; None removes it.
+    def set_batch_callback(
+        self, callback: Callable[[list[Operation]], Any] | None,
+    ) -> None: ...
+
     def process_events(
         self,
         max_requests: int = 512,
@@ -24,13 +30,14 @@ class Context(AbstractContext):
 class Operation(AbstractOperation):
     @classmethod
     def read(
-        cls, nbytes: int, fd: int, offset: int, priority=0
+        cls, nbytes: int, fd: int, offset: int, priority=0,
+        *, alignment: int = 0, flags: int = 0,
     ) -> AbstractOperation: ...
 
     @classmethod
     def write(
         cls, payload_bytes: bytes,
-        fd: int, offset: int, priority=0,
+        fd: int, offset: int, priority=0, *, flags: int = 0,
     ) -> AbstractOperation: ...
 
     @classmethod
@@ -39,7 +46,22 @@ class Operation(AbstractOperation):
     @classmethod
     def fdsync(cls, fd: int, priority=0) -> AbstractOperation: ...
 
-    def get_value(self) -> bytes | int | None: ...
+    @classmethod
+    def readinto(
+        cls, buffer: Any, fd: int, offset: int, priority=0,
+    ) -> AbstractOperation: ...
+
+    @classmethod
+    def readv(
+        cls, sizes: Sequence[int], fd: int, offset: int, priority=0,
+    ) -> AbstractOperation: ...
+
+    @classmethod
+    def writev(
+        cls, buffers: Sequence[bytes], fd: int, offset: int, priority=0,
+    ) -> AbstractOperation: ...
+
+    def get_value(self) -> bytes | list[bytes] | int | None: ...
 
     @property
     def fileno(self) -> int: ...
@@ -48,7 +70,7 @@ class Operation(AbstractOperation):
     def offset(self) -> int: ...
 
     @property
-    def payload(self) -> bytes | memoryview | None: ...
+    def payload(self) -> Any: ...
 
     @property
     def nbytes(self) -> int: ...
@@ -61,3 +83,14 @@ class Operation(AbstractOperation):
 
     def set_callback(self, callback: Callable[[int], Any]) -> bool: ...
 
+
+
+# Zero read buffers up front rather than only what a read left unfilled
+def set_zero_fill(enabled: bool) -> bool: ...
+
+# Per-module cache of recycled Operation objects and read buffers
+def freelist_info() -> dict[str, Any]: ...
+def freelist_trim() -> int: ...
+def freelist_set_limits(
+    max_bytes: int | None = None, max_objects: int | None = None,
+) -> None: ...
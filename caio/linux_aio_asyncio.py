@@ -21,7 +21,16 @@ class AsyncioContext(AsyncioContextBase):
         # for the whole batch - call_soon() defers to the next _run_once()
         # pass, after every currently-ready submit() has queued its op, so
         # one submit() call handles all of them together.
-        self._pending.append((op, future))
+        self._defer_submit([(op, future)])
+
+    def _submit_ops(self, ops, futures):
+        if not self.deferred:
+            super()._submit_ops(ops, futures)
+            return
+        self._defer_submit(zip(ops, futures))
+
+    def _defer_submit(self, pending):
+        self._pending.extend(pending)
         if not self._submit_scheduled:
             self._submit_scheduled = True
             self.loop.call_soon(self._deferred_submit)
@@ -12,6 +12,7 @@
 #include <time.h>
 #include <unistd.h>
 #include <sys/mman.h>
+#include <sys/uio.h>
 #include <sys/eventfd.h>
 #include <sys/syscall.h>
 #include <sys/utsname.h>
@@ -22,6 +23,10 @@
 #include <Python.h>
 #include <structmember.h>
 
+#include "src/freelist/freelist.h"
+#include "src/ioprio/ioprio.h"
+#include "src/rwflags/rwflags.h"
+
 #if PY_VERSION_HEX >= 0x030D0000 && defined(Py_GIL_DISABLED)
 #define CAIO_BEGIN_CRITICAL_SECTION(object) \
     PyCriticalSection caio_critical_section; \
@@ -93,6 +98,11 @@ enum URING_OP {
     URING_WRITE  = 1,
     URING_FSYNC  = 2,
     URING_FDSYNC = 3,
+    URING_READ_FIXED  = 4,
+    URING_WRITE_FIXED = 5,
+    URING_READV  = 6,
+    URING_WRITEV = 7,
+    URING_READINTO = 8,
 };
 
 /* user_data sentinel for cancel/internal SQEs (not an AIOOperation pointer) */
@@ -101,9 +111,32 @@ enum URING_OP {
 static const uint32_t CTX_MAX_REQUESTS_DEFAULT = 32;
 static const uint32_t EV_MAX_REQUESTS_DEFAULT  = 512;
 
+/* Kernel-side limits for IORING_REGISTER_BUFFERS (io_uring/rsrc.c):
+ * IORING_MAX_REG_BUFFERS iovecs, each at most 1 GiB. */
+static const uint32_t FIXED_BUFFERS_MAX     = 1U << 14;
+static const uint64_t FIXED_BUFFER_SIZE_MAX = 1ULL << 30;
+
+/* IORING_MAX_FIXED_FILES (io_uring/rsrc.h) - the kernel additionally caps
+ * the table at RLIMIT_NOFILE, which it reports as EMFILE on its own. */
+static const uint32_t FIXED_FILES_MAX = 1U << 20;
+
+/* UIO_MAXIOV - the kernel rejects readv/writev with more iovecs (EINVAL) */
+#ifndef IOV_MAX
+#define IOV_MAX 1024
+#endif
+
 static PyTypeObject AIOOperationType;
 static PyTypeObject AIOContextType;
 
+/* Recycled Operation objects, see freelist.h. Reads return PyBytes the
+ * kernel filled in place, so there are no read buffers of our own to
+ * cache here - the buffer side of it stays empty. */
+static caio_freelist_t freelist = CAIO_FREELIST_INIT;
+
+/* set_zero_fill(): zero read buffers up front instead of only the part
+ * the kernel didn't fill, once the read completes */
+static int zero_fill = 0;
+
 
 /* ================================================================
    AIOOperation
@@ -122,6 +155,21 @@ typedef struct {
     int32_t     error;
     Py_ssize_t  buf_size;
     char       *buf;
+    uint16_t    buf_index;   /* registered buffer slot (READ/WRITE_FIXED) */
+    uint8_t     fixed_file;  /* fileno is a register_files() index */
+    uint16_t    priority;    /* as passed - see src/ioprio/ioprio.h */
+    uint8_t     dirty;       /* READ/READV: py_buffer left uninitialized
+                              * and not yet settled */
+    uint8_t     aligned;     /* READ: buf is caio_aligned_buffer_get()'s,
+                              * py_buffer only a memoryview over it */
+    int32_t     rw_flags;    /* READ/WRITE: RWF_*, see src/rwflags */
+    Py_ssize_t  buf_offset;  /* slot's byte offset into that pool, set by
+                              * submit() - what get_value()/payload slice */
+    struct iovec *iov;       /* READV/WRITEV: iovcnt entries */
+    Py_buffer  *views;       /* WRITEV: one held export per iovec */
+    int         iovcnt;
+    Py_buffer   target;      /* READINTO: caller's buffer, held until
+                              * completion (target.obj != NULL) */
     uint8_t     in_progress;
     uint8_t     done;   /* genuine completion reached - unlike in_progress
                           * (sticky forever, guards resubmission), this is
@@ -137,12 +185,37 @@ static int AIOOperation_traverse(AIOOperation *self, visitproc visit, void *arg)
 }
 
 
+/* Releases READV/WRITEV's iovec array and, for WRITEV, the buffer exports
+ * it points into. Never runs while the kernel may still read them - an op
+ * in flight is kept alive by the reference submit() took. */
+static void AIOOperation_release_iov(AIOOperation *self) {
+    if (self->views != NULL) {
+        for (int i = 0; i < self->iovcnt; i++)
+            PyBuffer_Release(&self->views[i]);
+        PyMem_Free(self->views);
+        self->views = NULL;
+    }
+    PyMem_Free(self->iov);
+    self->iov = NULL;
+    self->iovcnt = 0;
+}
+
+
 static int AIOOperation_clear(AIOOperation *self) {
     Py_CLEAR(self->callback);
     Py_CLEAR(self->context);
+    AIOOperation_release_iov(self);
+    if (self->target.obj != NULL)
+        PyBuffer_Release(&self->target);
     /* buf points into py_buffer's internal storage for reads — do NOT free
-     * it separately; Py_CLEAR(py_buffer) handles the memory. */
+     * it separately; Py_CLEAR(py_buffer) handles the memory. Aligned reads
+     * are the exception: py_buffer only views buf there. */
     Py_CLEAR(self->py_buffer);
+    if (self->aligned) {
+        free(self->buf);
+        self->buf = NULL;
+        self->aligned = 0;
+    }
     return 0;
 }
 
@@ -156,6 +229,34 @@ static PyObject *AIOOperation_callback_ref(AIOOperation *self) {
 }
 
 
+/* Zeroes the part of an uninitialized read result past the first `filled`
+ * bytes (a short read's tail, or all of it on error / before submission),
+ * so neither payload nor get_value() can expose stale heap contents. */
+static void AIOOperation_settle_buffer(AIOOperation *self, int64_t filled) {
+    if (!self->dirty) return;
+    self->dirty = 0;
+    if (self->py_buffer == NULL) return;
+
+    Py_ssize_t size = self->aligned
+        ? PyMemoryView_GET_BUFFER(self->py_buffer)->len
+        : PyBytes_GET_SIZE(self->py_buffer);
+    if (filled < 0) filled = 0;
+    if (filled < size)
+        memset(self->buf + filled, 0, (size_t) (size - filled));
+}
+
+
+/* Zero-fills a freshly allocated read result now if set_zero_fill() is
+ * on, otherwise marks it for AIOOperation_settle_buffer() on completion. */
+static void AIOOperation_init_buffer(AIOOperation *self) {
+    if (zero_fill) {
+        memset(self->buf, 0, (size_t) self->buf_size);
+    } else {
+        self->dirty = 1;
+    }
+}
+
+
 static void AIOOperation_dealloc(AIOOperation *self) {
     PyObject_GC_UnTrack(self);
 
@@ -163,6 +264,11 @@ static void AIOOperation_dealloc(AIOOperation *self) {
         PyObject_ClearWeakRefs((PyObject *) self);
 
     AIOOperation_clear(self);
+
+    if (Py_TYPE(self) == &AIOOperationType &&
+            caio_freelist_object_put(&freelist, (PyObject *) self))
+        return;
+
     Py_TYPE(self)->tp_free((PyObject *) self);
 }
 
@@ -174,11 +280,17 @@ static PyObject *AIOOperation_repr(AIOOperation *self) {
         case URING_WRITE:  mode = "write";  break;
         case URING_FSYNC:  mode = "fsync";  break;
         case URING_FDSYNC: mode = "fdsync"; break;
+        case URING_READ_FIXED:  mode = "read_fixed";  break;
+        case URING_WRITE_FIXED: mode = "write_fixed"; break;
+        case URING_READV:  mode = "readv";  break;
+        case URING_WRITEV: mode = "writev"; break;
+        case URING_READINTO: mode = "readinto"; break;
         default:           mode = "noop";   break;
     }
     return PyUnicode_FromFormat(
-        "<%s at %p: mode=\"%s\", fd=%u, offset=%llu, result=%d, buffer=%p>",
+        "<%s at %p: mode=\"%s\", %s=%u, offset=%llu, result=%d, buffer=%p>",
         Py_TYPE(self)->tp_name, self, mode,
+        self->fixed_file ? "file_index" : "fd",
         self->fileno, (unsigned long long) self->offset,
         self->result, self->buf
     );
@@ -187,14 +299,25 @@ static PyObject *AIOOperation_repr(AIOOperation *self) {
 
 PyDoc_STRVAR(AIOOperation_read_docstring,
     "Creates a new Operation for reading.\n\n"
-    "    Operation.read(nbytes, fd, offset, priority=0) -> Operation"
+    "    Operation.read(nbytes, fd, offset, priority=0, *, fixed_file=False, alignment=0, flags=0) -> Operation\n\n"
+    "    fixed_file=True makes fd an index into the submitting Context's\n"
+    "    register_files() table instead of a file descriptor (same for every\n"
+    "    other constructor).\n\n"
+    "    A nonzero alignment (a power of two) reads into a buffer on that\n"
+    "    boundary, as O_DIRECT requires - get_value() then copies it out.\n\n"
+    "    flags are RWF_* request flags, see caio.rwflags (same for write())."
 );
 static PyObject *AIOOperation_read(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    static char *kwlist[] = {"nbytes", "fd", "offset", "priority", NULL};
+    static char *kwlist[] = {
+        "nbytes", "fd", "offset", "priority", "fixed_file", "alignment",
+        "flags", NULL
+    };
 
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
         return NULL;
@@ -210,21 +333,51 @@ static PyObject *AIOOperation_read(
     self->error = 0;
 
     uint64_t nbytes = 0;
-    uint16_t priority = 0;
+    self->priority = 0;
+    int fixed_file = 0;
+    Py_ssize_t alignment = 0;
+    self->rw_flags = 0;
 
     if (!PyArg_ParseTupleAndKeywords(
-            args, kwds, "KI|KH", kwlist,
-            &nbytes, &self->fileno, &self->offset, &priority)) {
+            args, kwds, "KI|KH$pni", kwlist,
+            &nbytes, &self->fileno, &self->offset, &self->priority,
+            &fixed_file, &alignment, &self->rw_flags) ||
+            !caio_alignment_check(alignment) ||
+            !caio_rwflags_check(self->rw_flags, CAIO_RWF_ALL)) {
         Py_DECREF(self);
         return NULL;
     }
+    self->fixed_file = (uint8_t) fixed_file;
+
+    /* A bytes object's storage can't be aligned on request - the kernel
+     * reads into a separate allocation instead, copied out on get_value(). */
+    if (alignment) {
+        self->buf = caio_aligned_buffer_get(nbytes, (size_t) alignment);
+        if (self->buf == NULL) {
+            Py_DECREF(self);
+            return PyErr_NoMemory();
+        }
+        self->aligned = 1;
+        self->buf_size = (Py_ssize_t) nbytes;
+        self->py_buffer = PyMemoryView_FromMemory(
+            self->buf, self->buf_size, PyBUF_READ
+        );
+        if (self->py_buffer == NULL) {
+            Py_DECREF(self);
+            return NULL;
+        }
+        AIOOperation_init_buffer(self);
+        self->opcode = URING_READ;
+        return (PyObject *) self;
+    }
 
     /* Allocate the result bytes object directly — the kernel writes into
      * its internal buffer, so get_value() can return it with no copy.
      * PyBytes_FromStringAndSize(NULL, n) leaves the memory uninitialized
      * (documented CPython behavior) - a short read's untouched tail must
      * read as zero, not whatever heap garbage happened to be there
-     * (a real information-disclosure risk, not just cosmetic). */
+     * (a real information-disclosure risk, not just cosmetic). Only that
+     * tail is zeroed, on completion, unless set_zero_fill() is on. */
     self->py_buffer = PyBytes_FromStringAndSize(NULL, (Py_ssize_t) nbytes);
     if (self->py_buffer == NULL) {
         Py_DECREF(self);
@@ -232,7 +385,7 @@ static PyObject *AIOOperation_read(
     }
     self->buf      = PyBytes_AS_STRING(self->py_buffer);
     self->buf_size = (Py_ssize_t) nbytes;
-    memset(self->buf, 0, (size_t) nbytes);
+    AIOOperation_init_buffer(self);
     self->opcode   = URING_READ;
 
     return (PyObject *) self;
@@ -241,14 +394,19 @@ static PyObject *AIOOperation_read(
 
 PyDoc_STRVAR(AIOOperation_write_docstring,
     "Creates a new Operation for writing.\n\n"
-    "    Operation.write(payload_bytes, fd, offset, priority=0) -> Operation"
+    "    Operation.write(payload_bytes, fd, offset, priority=0, *, fixed_file=False, flags=0) -> Operation"
 );
 static PyObject *AIOOperation_write(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    static char *kwlist[] = {"payload_bytes", "fd", "offset", "priority", NULL};
+    static char *kwlist[] = {
+        "payload_bytes", "fd", "offset", "priority", "fixed_file", "flags",
+        NULL
+    };
 
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
         return NULL;
@@ -263,7 +421,7 @@ static PyObject *AIOOperation_write(
     self->callback = NULL;
     self->error = 0;
 
-    uint16_t priority = 0;
+    self->priority = 0;
 
     /* Parsed into a plain local first, not directly into self->py_buffer:
      * "O" hands back a borrowed reference, and self->py_buffer must never
@@ -271,13 +429,18 @@ static PyObject *AIOOperation_write(
      * assigned (and incref'd) below once confirmed to actually be the
      * bytes object this Operation is going to own. */
     PyObject *payload_bytes = NULL;
+    int fixed_file = 0;
+    self->rw_flags = 0;
 
     if (!PyArg_ParseTupleAndKeywords(
-            args, kwds, "OI|KH", kwlist,
-            &payload_bytes, &self->fileno, &self->offset, &priority)) {
+            args, kwds, "OI|KH$pi", kwlist,
+            &payload_bytes, &self->fileno, &self->offset, &self->priority,
+            &fixed_file, &self->rw_flags) ||
+            !caio_rwflags_check(self->rw_flags, CAIO_RWF_ALL)) {
         Py_DECREF(self);
         return NULL;
     }
+    self->fixed_file = (uint8_t) fixed_file;
 
     if (!PyBytes_Check(payload_bytes)) {
         Py_DECREF(self);
@@ -298,16 +461,373 @@ static PyObject *AIOOperation_write(
 }
 
 
+/* Shared by read_fixed()/write_fixed(): neither owns any memory of its
+ * own - the data lives in slot `buf_index` of whichever Context's
+ * register_buffers() pool this ends up submitted to, so the address is
+ * only resolved (and bounds-checked against that pool) in submit(). */
+static PyObject *AIOOperation_new_fixed(
+    PyTypeObject *type, PyObject *args, PyObject *kwds, uint8_t opcode
+) {
+    static char *kwlist[] = {
+        "nbytes", "fd", "offset", "buf_index", "priority", "fixed_file", NULL
+    };
+
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
+        return NULL;
+    }
+
+    self->buf = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->context = NULL;
+    self->weakreflist = NULL;
+    self->callback = NULL;
+    self->error = 0;
+
+    uint64_t nbytes = 0;
+    self->priority = 0;
+    int fixed_file = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "KIKH|H$p", kwlist,
+            &nbytes, &self->fileno, &self->offset,
+            &self->buf_index, &self->priority, &fixed_file)) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->fixed_file = (uint8_t) fixed_file;
+
+    if (nbytes > FIXED_BUFFER_SIZE_MAX) {
+        Py_DECREF(self);
+        PyErr_Format(
+            PyExc_ValueError,
+            "nbytes must not exceed %llu",
+            (unsigned long long) FIXED_BUFFER_SIZE_MAX
+        );
+        return NULL;
+    }
+
+    self->buf_size = (Py_ssize_t) nbytes;
+    self->opcode   = opcode;
+    return (PyObject *) self;
+}
+
+
+PyDoc_STRVAR(AIOOperation_read_fixed_docstring,
+    "Creates a new Operation reading into a registered buffer slot.\n\n"
+    "    Operation.read_fixed(nbytes, fd, offset, buf_index, priority=0, *,\n"
+    "                         fixed_file=False) -> Operation\n\n"
+    "    The Context it is submitted to must have called register_buffers()\n"
+    "    with at least buf_index + 1 slots of at least nbytes each. The data\n"
+    "    lands in that slot; get_value() returns a memoryview over the part\n"
+    "    actually filled, valid until the slot is reused."
+);
+static PyObject *AIOOperation_read_fixed(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    return AIOOperation_new_fixed(type, args, kwds, URING_READ_FIXED);
+}
+
+
+PyDoc_STRVAR(AIOOperation_write_fixed_docstring,
+    "Creates a new Operation writing from a registered buffer slot.\n\n"
+    "    Operation.write_fixed(nbytes, fd, offset, buf_index, priority=0, *,\n"
+    "                          fixed_file=False) -> Operation\n\n"
+    "    Writes the first nbytes of slot buf_index (see\n"
+    "    Context.get_buffer()) of the Context it is submitted to."
+);
+static PyObject *AIOOperation_write_fixed(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    return AIOOperation_new_fixed(type, args, kwds, URING_WRITE_FIXED);
+}
+
+
+/* Validates the readv()/writev() iovec count and allocates the array.
+ * Returns NULL with an exception set if it's out of range. */
+static struct iovec *AIOOperation_alloc_iov(Py_ssize_t count) {
+    if (count < 1 || count > IOV_MAX) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "expected between 1 and %d buffers, got %zd", IOV_MAX, count
+        );
+        return NULL;
+    }
+
+    struct iovec *iov = PyMem_New(struct iovec, count);
+    if (iov == NULL)
+        PyErr_NoMemory();
+    return iov;
+}
+
+
+PyDoc_STRVAR(AIOOperation_readv_docstring,
+    "Creates a new Operation for a vectored read (IORING_OP_READV).\n\n"
+    "    Operation.readv(sizes, fd, offset, priority=0, *, fixed_file=False) -> Operation\n\n"
+    "    Reads sum(sizes) contiguous bytes; get_value() returns them split\n"
+    "    into one bytes object per entry of sizes (trailing ones short or\n"
+    "    empty on a short read)."
+);
+static PyObject *AIOOperation_readv(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    static char *kwlist[] = {
+        "sizes", "fd", "offset", "priority", "fixed_file", NULL
+    };
+
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
+        return NULL;
+    }
+
+    self->buf = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->context = NULL;
+    self->weakreflist = NULL;
+    self->callback = NULL;
+    self->error = 0;
+
+    PyObject *sizes = NULL;
+    self->priority = 0;
+    int fixed_file = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "OI|KH$p", kwlist,
+            &sizes, &self->fileno, &self->offset, &self->priority, &fixed_file)) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->fixed_file = (uint8_t) fixed_file;
+    self->opcode = URING_READV;
+
+    PyObject *seq = PySequence_Fast(sizes, "sizes must be a sequence of ints");
+    if (seq == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+    self->iov = AIOOperation_alloc_iov(count);
+    if (self->iov == NULL) {
+        Py_DECREF(seq);
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->iovcnt = (int) count;
+
+    Py_ssize_t total = 0;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_ssize_t size = PyNumber_AsSsize_t(
+            PySequence_Fast_GET_ITEM(seq, i), PyExc_OverflowError
+        );
+        if (size == -1 && PyErr_Occurred()) {
+            Py_DECREF(seq);
+            Py_DECREF(self);
+            return NULL;
+        }
+        if (size < 0 || size > PY_SSIZE_T_MAX - total) {
+            Py_DECREF(seq);
+            Py_DECREF(self);
+            PyErr_Format(PyExc_ValueError, "invalid size at %zd", i);
+            return NULL;
+        }
+        self->iov[i].iov_len = (size_t) size;
+        total += size;
+    }
+    Py_DECREF(seq);
+
+    /* One contiguous bytes object (same as read(), tail zeroed the same
+     * way) that the iovecs are consecutive slices of - get_value() only
+     * has to cut it back up at the same boundaries. */
+    self->py_buffer = PyBytes_FromStringAndSize(NULL, total);
+    if (self->py_buffer == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->buf      = PyBytes_AS_STRING(self->py_buffer);
+    self->buf_size = total;
+    AIOOperation_init_buffer(self);
+
+    char *base = self->buf;
+    for (int i = 0; i < self->iovcnt; i++) {
+        self->iov[i].iov_base = base;
+        base += self->iov[i].iov_len;
+    }
+
+    return (PyObject *) self;
+}
+
+
+PyDoc_STRVAR(AIOOperation_writev_docstring,
+    "Creates a new Operation for a vectored write (IORING_OP_WRITEV).\n\n"
+    "    Operation.writev(buffers, fd, offset, priority=0, *, fixed_file=False) -> Operation\n\n"
+    "    Writes the bytes-like objects in buffers back to back, without\n"
+    "    joining them first. Each one stays exported (and so can't be\n"
+    "    resized) until the Operation is gone."
+);
+static PyObject *AIOOperation_writev(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    static char *kwlist[] = {
+        "buffers", "fd", "offset", "priority", "fixed_file", NULL
+    };
+
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
+        return NULL;
+    }
+
+    self->buf = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->context = NULL;
+    self->weakreflist = NULL;
+    self->callback = NULL;
+    self->error = 0;
+
+    PyObject *buffers = NULL;
+    self->priority = 0;
+    int fixed_file = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "OI|KH$p", kwlist,
+            &buffers, &self->fileno, &self->offset, &self->priority, &fixed_file)) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->fixed_file = (uint8_t) fixed_file;
+    self->opcode = URING_WRITEV;
+
+    /* A private tuple, not the caller's sequence - payload hands it back,
+     * and a list mutated after the fact would no longer match what the
+     * iovecs below point at. */
+    self->py_buffer = PySequence_Tuple(buffers);
+    if (self->py_buffer == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    Py_ssize_t count = PyTuple_GET_SIZE(self->py_buffer);
+    self->iov = AIOOperation_alloc_iov(count);
+    if (self->iov == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->views = PyMem_New(Py_buffer, count);
+    if (self->views == NULL) {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+
+    Py_ssize_t total = 0;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_buffer *view = &self->views[i];
+        if (PyObject_GetBuffer(
+                PyTuple_GET_ITEM(self->py_buffer, i), view, PyBUF_SIMPLE)) {
+            Py_DECREF(self);
+            return NULL;
+        }
+        /* Counted as soon as it's held, so a later failure releases it */
+        self->iovcnt = (int) i + 1;
+
+        self->iov[i].iov_base = view->buf;
+        self->iov[i].iov_len  = (size_t) view->len;
+        total += view->len;
+    }
+    self->buf_size = total;
+
+    return (PyObject *) self;
+}
+
+
+PyDoc_STRVAR(AIOOperation_readinto_docstring,
+    "Creates a new Operation reading straight into a caller's buffer.\n\n"
+    "    Operation.readinto(buffer, fd, offset, priority=0, *, fixed_file=False) -> Operation\n\n"
+    "    buffer is any writable, contiguous buffer-protocol object\n"
+    "    (bytearray, memoryview slice, mmap, ...); up to len(buffer) bytes\n"
+    "    land in it directly, no intermediate allocation. get_value()\n"
+    "    returns the number of bytes read. The buffer stays exported (so\n"
+    "    can't be resized) until the Operation completes."
+);
+static PyObject *AIOOperation_readinto(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    static char *kwlist[] = {
+        "buffer", "fd", "offset", "priority", "fixed_file", NULL
+    };
+
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
+        return NULL;
+    }
+
+    self->buf = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->context = NULL;
+    self->weakreflist = NULL;
+    self->callback = NULL;
+    self->error = 0;
+
+    PyObject *buffer = NULL;
+    self->priority = 0;
+    int fixed_file = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "OI|KH$p", kwlist,
+            &buffer, &self->fileno, &self->offset, &self->priority, &fixed_file)) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->fixed_file = (uint8_t) fixed_file;
+    self->opcode = URING_READINTO;
+
+    if (PyObject_GetBuffer(buffer, &self->target, PyBUF_WRITABLE)) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    /* py_buffer is only what payload hands back - the kernel writes
+     * through target, which is what pins the memory. */
+    self->py_buffer = Py_NewRef(buffer);
+    self->buf       = self->target.buf;
+    self->buf_size  = self->target.len;
+
+    return (PyObject *) self;
+}
+
+
 PyDoc_STRVAR(AIOOperation_fsync_docstring,
     "Creates a new Operation for fsync.\n\n"
-    "    Operation.fsync(fd, priority=0) -> Operation"
+    "    Operation.fsync(fd, priority=0, *, fixed_file=False) -> Operation"
 );
 static PyObject *AIOOperation_fsync(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    static char *kwlist[] = {"fd", "priority", NULL};
+    static char *kwlist[] = {"fd", "priority", "fixed_file", NULL};
 
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
         return NULL;
@@ -322,13 +842,16 @@ static PyObject *AIOOperation_fsync(
     self->callback = NULL;
     self->error = 0;
 
-    uint16_t priority = 0;
+    self->priority = 0;
+    int fixed_file = 0;
 
     if (!PyArg_ParseTupleAndKeywords(
-            args, kwds, "I|H", kwlist, &self->fileno, &priority)) {
+            args, kwds, "I|H$p", kwlist,
+            &self->fileno, &self->priority, &fixed_file)) {
         Py_DECREF(self);
         return NULL;
     }
+    self->fixed_file = (uint8_t) fixed_file;
 
     self->opcode = URING_FSYNC;
     return (PyObject *) self;
@@ -337,14 +860,16 @@ static PyObject *AIOOperation_fsync(
 
 PyDoc_STRVAR(AIOOperation_fdsync_docstring,
     "Creates a new Operation for fdatasync.\n\n"
-    "    Operation.fdsync(fd, priority=0) -> Operation"
+    "    Operation.fdsync(fd, priority=0, *, fixed_file=False) -> Operation"
 );
 static PyObject *AIOOperation_fdsync(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    static char *kwlist[] = {"fd", "priority", NULL};
+    static char *kwlist[] = {"fd", "priority", "fixed_file", NULL};
 
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "cannot allocate memory");
         return NULL;
@@ -359,22 +884,68 @@ static PyObject *AIOOperation_fdsync(
     self->callback = NULL;
     self->error = 0;
 
-    uint16_t priority = 0;
+    self->priority = 0;
+    int fixed_file = 0;
 
     if (!PyArg_ParseTupleAndKeywords(
-            args, kwds, "I|H", kwlist, &self->fileno, &priority)) {
+            args, kwds, "I|H$p", kwlist,
+            &self->fileno, &self->priority, &fixed_file)) {
         Py_DECREF(self);
         return NULL;
     }
+    self->fixed_file = (uint8_t) fixed_file;
 
     self->opcode = URING_FDSYNC;
     return (PyObject *) self;
 }
 
 
+/* memoryview over this op's own slice of the registered buffer pool -
+ * py_buffer holds the pool object itself (not a view of it) for fixed
+ * ops, so the slice keeps the pool alive on its own even if the Context
+ * that registered it is gone by then. */
+static PyObject *AIOOperation_fixed_view(AIOOperation *self) {
+    PyObject *view = PyMemoryView_FromObject(self->py_buffer);
+    if (view == NULL)
+        return NULL;
+
+    PyObject *slice = PySequence_GetSlice(
+        view, self->buf_offset, self->buf_offset + self->buf_size
+    );
+    Py_DECREF(view);
+    return slice;
+}
+
+
+/* readv()'s result: the first `filled` bytes of buf, cut at the iovec
+ * boundaries. Always one item per iovec, so results line up with sizes. */
+static PyObject *AIOOperation_split_iov(AIOOperation *self, Py_ssize_t filled) {
+    PyObject *result = PyList_New(self->iovcnt);
+    if (result == NULL)
+        return NULL;
+
+    for (int i = 0; i < self->iovcnt; i++) {
+        Py_ssize_t size = (Py_ssize_t) self->iov[i].iov_len;
+        if (size > filled)
+            size = filled;
+        filled -= size;
+
+        PyObject *chunk = PyBytes_FromStringAndSize(
+            (const char *) self->iov[i].iov_base, size
+        );
+        if (chunk == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, chunk);
+    }
+    return result;
+}
+
+
 PyDoc_STRVAR(AIOOperation_get_value_docstring,
     "Returns the result of the completed Operation.\n\n"
-    "    Operation.get_value() -> Optional[Union[bytes, int]]"
+    "    Operation.get_value() -> Optional[Union[bytes, List[bytes], int]]"
 );
 static PyObject *AIOOperation_get_value(
     AIOOperation *self, PyObject *args, PyObject *kwds
@@ -405,6 +976,9 @@ static PyObject *AIOOperation_get_value(
             if (self->py_buffer == NULL)
                 Py_RETURN_NONE;
 
+            if (self->aligned)
+                return PyBytes_FromStringAndSize(self->buf, self->buf_size);
+
             /* Fast path: kernel filled the whole buffer — return py_buffer
              * directly with no copy.  Partial reads (e.g. EOF) fall back to
              * a slice. */
@@ -413,7 +987,18 @@ static PyObject *AIOOperation_get_value(
                 return self->py_buffer;
             }
             return PyBytes_FromStringAndSize(self->buf, self->buf_size);
+        case URING_READ_FIXED:
+            if (self->py_buffer == NULL)
+                Py_RETURN_NONE;
+            return AIOOperation_fixed_view(self);
+        case URING_READV:
+            if (self->iov == NULL)
+                Py_RETURN_NONE;
+            return AIOOperation_split_iov(self, self->buf_size);
         case URING_WRITE:
+        case URING_WRITE_FIXED:
+        case URING_WRITEV:
+        case URING_READINTO:
             return PyLong_FromSsize_t(self->result);
     }
 
@@ -464,6 +1049,12 @@ static PyObject *AIOOperation_payload_getter(AIOOperation *self, void *closure)
     if (self->py_buffer == NULL)
         Py_RETURN_NONE;
 
+    if (self->opcode == URING_READ_FIXED || self->opcode == URING_WRITE_FIXED)
+        return AIOOperation_fixed_view(self);
+
+    /* Not submitted (yet) - nothing was read into it */
+    AIOOperation_settle_buffer(self, 0);
+
     Py_INCREF(self->py_buffer);
     return self->py_buffer;
 }
@@ -487,6 +1078,10 @@ static PyMemberDef AIOOperation_members[] = {
         "fileno",  T_UINT,
         offsetof(AIOOperation, fileno),    READONLY, "file descriptor"
     },
+    {
+        "priority", T_USHORT,
+        offsetof(AIOOperation, priority),  READONLY, "request priority"
+    },
     {
         "offset",  T_ULONGLONG,
         offsetof(AIOOperation, offset),    READONLY, "offset"
@@ -503,6 +1098,11 @@ static PyMemberDef AIOOperation_members[] = {
         "error",   T_INT,
         offsetof(AIOOperation, error),     READONLY, "error"
     },
+    {
+        "fixed_file", T_BOOL,
+        offsetof(AIOOperation, fixed_file), READONLY,
+        "fileno is an index into the registered file table"
+    },
     {NULL}
 };
 
@@ -532,10 +1132,40 @@ static PyMethodDef AIOOperation_methods[] = {
         AIOOperation_fdsync_docstring
     },
     {
-        "get_value",
-        (PyCFunction) AIOOperation_get_value,
-        METH_NOARGS,
-        AIOOperation_get_value_docstring
+        "read_fixed",
+        (PyCFunction) AIOOperation_read_fixed,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_read_fixed_docstring
+    },
+    {
+        "write_fixed",
+        (PyCFunction) AIOOperation_write_fixed,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_write_fixed_docstring
+    },
+    {
+        "readinto",
+        (PyCFunction) AIOOperation_readinto,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_readinto_docstring
+    },
+    {
+        "readv",
+        (PyCFunction) AIOOperation_readv,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_readv_docstring
+    },
+    {
+        "writev",
+        (PyCFunction) AIOOperation_writev,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_writev_docstring
+    },
+    {
+        "get_value",
+        (PyCFunction) AIOOperation_get_value,
+        METH_NOARGS,
+        AIOOperation_get_value_docstring
     },
     {
         "set_callback",
@@ -600,14 +1230,56 @@ typedef struct {
     uint8_t  no_sqarray;   /* IORING_SETUP_NO_SQARRAY was used */
     uint8_t  sqpoll;       /* IORING_SETUP_SQPOLL was used */
 
+    /* IORING_REGISTER_BUFFERS pool: one anonymous mmap (page-aligned,
+     * zero-filled) split into fixed_count slots of fixed_size bytes.
+     * fixed_view is an export held for as long as it stays registered -
+     * mmap refuses close()/resize() while any export exists, so the
+     * kernel's pinned pages can never be pulled out from under it. */
+    PyObject *fixed_buffers;
+    Py_buffer fixed_view;
+    uint32_t  fixed_count;
+    uint32_t  fixed_size;
+
+    /* IORING_REGISTER_FILES table size, 0 when none is registered. Only
+     * the size is kept - the kernel holds its own reference to every file
+     * in it, so the caller may close the original descriptors. */
+    uint32_t  files_count;
+
+    PyObject *batch_callback;   /* set_batch_callback(), or NULL */
     PyObject *weakreflist;
 } AIOContext;
 
 
+static PyObject *AIOContext_batch_callback_ref(AIOContext *self) {
+    PyObject *callback;
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    callback = Py_XNewRef(self->batch_callback);
+    CAIO_END_CRITICAL_SECTION();
+    return callback;
+}
+
+
+static void AIOContext_release_buffers(AIOContext *self) {
+    if (self->fixed_buffers == NULL)
+        return;
+
+    PyBuffer_Release(&self->fixed_view);
+    Py_CLEAR(self->fixed_buffers);
+    self->fixed_count = 0;
+    self->fixed_size  = 0;
+}
+
+
 static void AIOContext_dealloc(AIOContext *self) {
     if (self->weakreflist != NULL)
         PyObject_ClearWeakRefs((PyObject *) self);
 
+    /* Only the Python-side export/reference - closing uring_fd below is
+     * what actually unregisters the pool from the kernel. In-flight fixed
+     * ops hold their own reference to the pool object (see submit()), so
+     * its memory outlives this either way. */
+    AIOContext_release_buffers(self);
+
     if (self->sq_ring_ptr != MAP_FAILED && self->sq_ring_ptr != NULL)
         munmap(self->sq_ring_ptr, self->sq_ring_size);
     if (self->sqes != MAP_FAILED && self->sqes != NULL)
@@ -621,6 +1293,7 @@ static void AIOContext_dealloc(AIOContext *self) {
     if (self->eventfd_fd >= 0)
         close(self->eventfd_fd);
 
+    Py_CLEAR(self->batch_callback);
     Py_TYPE(self)->tp_free((PyObject *) self);
 }
 
@@ -636,6 +1309,10 @@ static PyObject *AIOContext_new(PyTypeObject *type, PyObject *args, PyObject *kw
         self->sqes        = MAP_FAILED;
         self->no_sqarray  = 0;
         self->sqpoll      = 0;
+        self->fixed_buffers = NULL;
+        self->fixed_count   = 0;
+        self->fixed_size    = 0;
+        self->files_count   = 0;
     }
     return (PyObject *) self;
 }
@@ -896,11 +1573,19 @@ static int uring_drain_cq(AIOContext *self, uint32_t max) {
          * to keep the Context alive on its behalf. */
         AIOOperation *op = (AIOOperation *)(uintptr_t) cqe->user_data;
         op->result = cqe->res;
+        AIOOperation_settle_buffer(op, cqe->res);
         if (cqe->res < 0) {
             op->error = -cqe->res;
-        } else if (op->opcode == URING_READ) {
+        } else if (op->opcode == URING_READ ||
+                   op->opcode == URING_READ_FIXED ||
+                   op->opcode == URING_READV ||
+                   op->opcode == URING_READINTO) {
             op->buf_size = cqe->res;
         }
+        /* The kernel is done with the caller's buffer - let it be
+         * resized again without waiting for this Operation to die. */
+        if (op->target.obj != NULL)
+            PyBuffer_Release(&op->target);
         Py_CLEAR(op->context);
         CAIO_ATOMIC_STORE(op->done, 1);
 
@@ -914,6 +1599,15 @@ static int uring_drain_cq(AIOContext *self, uint32_t max) {
     __atomic_store_n(self->cq_head, head, __ATOMIC_RELEASE);
     CAIO_END_CRITICAL_SECTION();
 
+    /* Operations with no callback of their own are gathered here for one
+     * batch callback call at the end, when the Context has one. */
+    PyObject *batch_callback = (
+        count ? AIOContext_batch_callback_ref(self) : NULL
+    );
+    PyObject *batch = batch_callback != NULL ? PyList_New(0) : NULL;
+    if (batch_callback != NULL && batch == NULL)
+        PyErr_WriteUnraisable(batch_callback);
+
     for (uint32_t i = 0; i < count; i++) {
         AIOOperation *op = ops[i];
         PyObject *callback = AIOOperation_callback_ref(op);
@@ -932,6 +1626,9 @@ static int uring_drain_cq(AIOContext *self, uint32_t max) {
                 }
             }
             Py_DECREF(callback);
+        } else if (batch != NULL &&
+                   PyList_Append(batch, (PyObject *) op) < 0) {
+            PyErr_WriteUnraisable(batch_callback);
         }
 
         Py_DECREF(op);
@@ -939,15 +1636,27 @@ static int uring_drain_cq(AIOContext *self, uint32_t max) {
 
     PyMem_Free(ops);
     PyMem_Free(results);
+
+    /* Like a per-Operation callback, anything this raises is reported,
+     * not propagated - the completions are already consumed. */
+    if (batch != NULL && PyList_GET_SIZE(batch) > 0) {
+        PyObject *rv = PyObject_CallOneArg(batch_callback, batch);
+        if (rv == NULL) {
+            PyErr_WriteUnraisable(batch_callback);
+        } else {
+            Py_DECREF(rv);
+        }
+    }
+    Py_XDECREF(batch);
+    Py_XDECREF(batch_callback);
+
     return (int) count;
 }
 
 
-PyDoc_STRVAR(AIOContext_submit_docstring,
-    "Submits Operations to the io_uring SQ.\n\n"
-    "    Context.submit(op1, op2, ...) -> int"
-);
-static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
+/* submit() and submit_chain(). `link` stages the whole tuple or nothing,
+ * each SQE but the last carrying IOSQE_IO_LINK. */
+static PyObject *AIOContext_stage(AIOContext *self, PyObject *args, int link) {
     if (self->uring_fd < 0) {
         PyErr_SetString(PyExc_RuntimeError, "context not initialized");
         return NULL;
@@ -972,12 +1681,95 @@ static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
 
     CAIO_BEGIN_CRITICAL_SECTION(self);  /* serializes tail/SQE writes */
 
+    /* Fixed-buffer ops are checked against this Context's own pool up
+     * front, inside the same critical section unregister_buffers() takes -
+     * like the type check above, a bad op later in the batch must not
+     * leave earlier ones already staged. */
+    for (Py_ssize_t i = 0; i < nr; i++) {
+        AIOOperation *op = (AIOOperation *) PyTuple_GET_ITEM(args, i);
+        if (op->opcode != URING_READ_FIXED && op->opcode != URING_WRITE_FIXED)
+            continue;
+
+        if (self->fixed_buffers == NULL) {
+            CAIO_END_CRITICAL_SECTION();
+            PyErr_Format(
+                PyExc_ValueError,
+                "argument %zd needs registered buffers, "
+                "call register_buffers() first", i
+            );
+            return NULL;
+        }
+        if (op->buf_index >= self->fixed_count ||
+                (uint64_t) op->buf_size > self->fixed_size) {
+            CAIO_END_CRITICAL_SECTION();
+            PyErr_Format(
+                PyExc_ValueError,
+                "argument %zd does not fit the registered buffers "
+                "(buf_index=%u, nbytes=%zd, count=%u, size=%u)",
+                i, (unsigned) op->buf_index, op->buf_size,
+                self->fixed_count, self->fixed_size
+            );
+            return NULL;
+        }
+    }
+
+    /* Same for fixed_file ops against the registered file table. The
+     * kernel would fail an out-of-range index with EBADF on its own, but
+     * only asynchronously, as a completion - this catches it up front. */
+    for (Py_ssize_t i = 0; i < nr; i++) {
+        AIOOperation *op = (AIOOperation *) PyTuple_GET_ITEM(args, i);
+        if (!op->fixed_file || op->fileno < self->files_count)
+            continue;
+
+        CAIO_END_CRITICAL_SECTION();
+        if (self->files_count == 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "argument %zd needs registered files, "
+                "call register_files() first", i
+            );
+        } else {
+            PyErr_Format(
+                PyExc_ValueError,
+                "argument %zd file index %u out of range [0, %u)",
+                i, op->fileno, self->files_count
+            );
+        }
+        return NULL;
+    }
+
     uint32_t tail     = __atomic_load_n(self->sq_tail, __ATOMIC_RELAXED);
     uint32_t head     = __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE);
     uint32_t mask     = *self->sq_ring_mask;
     uint32_t capacity = *self->sq_ring_entries;
     uint32_t submitted = 0;
 
+    /* A chain can't skip a member the way submit() skips an op already in
+     * flight, or get cut short by a full ring - check and claim them all
+     * before staging any. */
+    if (link) {
+        if ((uint64_t) nr > capacity - (tail - head)) {
+            CAIO_END_CRITICAL_SECTION();
+            PyErr_SetString(PyExc_OverflowError, "io_uring SQ ring full");
+            return NULL;
+        }
+        for (Py_ssize_t i = 0; i < nr; i++) {
+            AIOOperation *op = (AIOOperation *) PyTuple_GET_ITEM(args, i);
+            if (!CAIO_ATOMIC_LOAD_STORE(op->in_progress, 1)) continue;
+
+            for (Py_ssize_t k = 0; k < i; k++) {
+                AIOOperation *claimed = (AIOOperation *) PyTuple_GET_ITEM(args, k);
+                CAIO_ATOMIC_STORE(claimed->in_progress, 0);
+            }
+            CAIO_END_CRITICAL_SECTION();
+            PyErr_Format(
+                PyExc_ValueError,
+                "argument %zd is already submitted", i
+            );
+            return NULL;
+        }
+    }
+
     for (Py_ssize_t i = 0; i < nr; i++) {
         AIOOperation *op = (AIOOperation *) PyTuple_GET_ITEM(args, i);
 
@@ -985,7 +1777,7 @@ static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
          * Operation must not both stage an SQE for it. Claimed up front
          * so the check-and-set is one atomic step - the exit paths below
          * that can still skip a freshly-claimed op undo the claim. */
-        if (CAIO_ATOMIC_LOAD_STORE(op->in_progress, 1)) continue;
+        if (!link && CAIO_ATOMIC_LOAD_STORE(op->in_progress, 1)) continue;
 
         if ((tail - head) >= capacity) {
             /* Not staged - give the claim back. Commit whatever WAS
@@ -1005,17 +1797,22 @@ static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
         sqe->fd        = (int32_t) op->fileno;
         sqe->off       = op->offset;
         sqe->user_data = (uint64_t)(uintptr_t) op;
+        if (op->fixed_file)
+            sqe->flags |= IOSQE_FIXED_FILE;
 
         switch (op->opcode) {
             case URING_READ:
-                sqe->opcode = IORING_OP_READ;
-                sqe->addr   = (uint64_t)(uintptr_t) op->buf;
-                sqe->len    = (uint32_t) op->buf_size;
+            case URING_READINTO:
+                sqe->opcode   = IORING_OP_READ;
+                sqe->addr     = (uint64_t)(uintptr_t) op->buf;
+                sqe->len      = (uint32_t) op->buf_size;
+                sqe->rw_flags = op->rw_flags;
                 break;
             case URING_WRITE:
-                sqe->opcode = IORING_OP_WRITE;
-                sqe->addr   = (uint64_t)(uintptr_t) op->buf;
-                sqe->len    = (uint32_t) op->buf_size;
+                sqe->opcode   = IORING_OP_WRITE;
+                sqe->addr     = (uint64_t)(uintptr_t) op->buf;
+                sqe->len      = (uint32_t) op->buf_size;
+                sqe->rw_flags = op->rw_flags;
                 break;
             case URING_FSYNC:
                 sqe->opcode = IORING_OP_FSYNC;
@@ -1024,6 +1821,29 @@ static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
                 sqe->opcode       = IORING_OP_FSYNC;
                 sqe->fsync_flags  = IORING_FSYNC_DATASYNC;
                 break;
+            case URING_READ_FIXED:
+            case URING_WRITE_FIXED:
+                /* Bounds already checked above. The op keeps the pool
+                 * object itself alive from here on - a later
+                 * unregister_buffers() or a dropped Context must not free
+                 * memory the kernel may still be writing into. */
+                op->buf_offset = (Py_ssize_t) op->buf_index * self->fixed_size;
+                op->buf = (char *) self->fixed_view.buf + op->buf_offset;
+                Py_XSETREF(op->py_buffer, Py_NewRef(self->fixed_buffers));
+
+                sqe->opcode    = op->opcode == URING_READ_FIXED
+                    ? IORING_OP_READ_FIXED : IORING_OP_WRITE_FIXED;
+                sqe->addr      = (uint64_t)(uintptr_t) op->buf;
+                sqe->len       = (uint32_t) op->buf_size;
+                sqe->buf_index = op->buf_index;
+                break;
+            case URING_READV:
+            case URING_WRITEV:
+                sqe->opcode = op->opcode == URING_READV
+                    ? IORING_OP_READV : IORING_OP_WRITEV;
+                sqe->addr   = (uint64_t)(uintptr_t) op->iov;
+                sqe->len    = (uint32_t) op->iovcnt;
+                break;
             default:
                 /* Unrecognized opcode: give the claim back, this op was
                  * never staged. */
@@ -1031,6 +1851,14 @@ static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
                 continue;
         }
 
+        /* Read/write only - older kernels fail any other SQE that
+         * carries a nonzero ioprio with EINVAL. */
+        if (sqe->opcode != IORING_OP_FSYNC)
+            sqe->ioprio = caio_ioprio_value(op->priority);
+
+        if (link && i + 1 < nr)
+            sqe->flags |= IOSQE_IO_LINK;
+
         if (!self->no_sqarray)
             self->sq_array[index] = index;
         tail++;
@@ -1063,6 +1891,28 @@ static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
 }
 
 
+PyDoc_STRVAR(AIOContext_submit_docstring,
+    "Submits Operations to the io_uring SQ.\n\n"
+    "    Context.submit(op1, op2, ...) -> int"
+);
+static PyObject *AIOContext_submit(AIOContext *self, PyObject *args) {
+    return AIOContext_stage(self, args, 0);
+}
+
+
+PyDoc_STRVAR(AIOContext_submit_chain_docstring,
+    "Submits Operations as one linked chain: the kernel starts each only "
+    "once the previous one completed in full. If one fails (or transfers "
+    "fewer bytes than requested), the rest complete with -ECANCELED.\n\n"
+    "All or nothing - raises ValueError if any of them is already "
+    "submitted, OverflowError if the SQ ring can't take them all.\n\n"
+    "    Context.submit_chain(op1, op2, ...) -> int"
+);
+static PyObject *AIOContext_submit_chain(AIOContext *self, PyObject *args) {
+    return AIOContext_stage(self, args, 1);
+}
+
+
 PyDoc_STRVAR(AIOContext_flush_docstring,
     "Submit all pending SQEs to the kernel in one io_uring_enter call,\n"
     "then drain any completions that finished inline.\n\n"
@@ -1341,6 +2191,482 @@ static PyObject *AIOContext_poll(AIOContext *self, PyObject *args) {
 }
 
 
+PyDoc_STRVAR(AIOContext_register_buffers_docstring,
+    "Registers a pool of fixed buffers with the ring (IORING_REGISTER_BUFFERS).\n\n"
+    "    Context.register_buffers(count, size) -> None\n\n"
+    "    Allocates count page-aligned slots of size bytes each, pinned by the\n"
+    "    kernel once here instead of on every operation. Use get_buffer() to\n"
+    "    reach a slot and Operation.read_fixed()/write_fixed() to do I/O on it."
+);
+static PyObject *AIOContext_register_buffers(
+    AIOContext *self, PyObject *args, PyObject *kwds
+) {
+    static char *kwlist[] = {"count", "size", NULL};
+
+    uint32_t count = 0;
+    uint32_t size  = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "II", kwlist, &count, &size))
+        return NULL;
+
+    if (self->uring_fd < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "context not initialized");
+        return NULL;
+    }
+
+    if (count == 0 || count > FIXED_BUFFERS_MAX) {
+        PyErr_Format(
+            PyExc_ValueError, "count must be between 1 and %u",
+            FIXED_BUFFERS_MAX
+        );
+        return NULL;
+    }
+
+    if (size == 0 || size > FIXED_BUFFER_SIZE_MAX) {
+        PyErr_Format(
+            PyExc_ValueError, "size must be between 1 and %llu",
+            (unsigned long long) FIXED_BUFFER_SIZE_MAX
+        );
+        return NULL;
+    }
+
+    if ((uint64_t) count * size > (uint64_t) PY_SSIZE_T_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "count * size is too large");
+        return NULL;
+    }
+
+    /* Plain anonymous mmap.mmap rather than PyMem_Malloc: page-aligned (so
+     * the same slots also work for O_DIRECT), zero-filled, and a real
+     * buffer-protocol object get_buffer()/get_value() can hand out views
+     * of without any of them dangling once this Context is gone. */
+    PyObject *mmap_module = PyImport_ImportModule("mmap");
+    if (mmap_module == NULL)
+        return NULL;
+
+    PyObject *pool = PyObject_CallMethod(
+        mmap_module, "mmap", "in", -1, (Py_ssize_t) count * size
+    );
+    Py_DECREF(mmap_module);
+    if (pool == NULL)
+        return NULL;
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(pool, &view, PyBUF_WRITABLE) < 0) {
+        Py_DECREF(pool);
+        return NULL;
+    }
+
+    struct iovec *iovecs = PyMem_New(struct iovec, count);
+    if (iovecs == NULL) {
+        PyBuffer_Release(&view);
+        Py_DECREF(pool);
+        return PyErr_NoMemory();
+    }
+
+    for (uint32_t i = 0; i < count; i++) {
+        iovecs[i].iov_base = (char *) view.buf + (size_t) i * size;
+        iovecs[i].iov_len  = size;
+    }
+
+    int ret = -1;
+    int saved_errno = 0;
+    int busy = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    if (self->fixed_buffers != NULL) {
+        busy = 1;
+    } else {
+        Py_BEGIN_ALLOW_THREADS
+        ret = io_uring_register(
+            self->uring_fd, IORING_REGISTER_BUFFERS, iovecs, count
+        );
+        saved_errno = errno;
+        Py_END_ALLOW_THREADS
+
+        if (ret >= 0) {
+            self->fixed_buffers = pool;
+            self->fixed_view    = view;
+            self->fixed_count   = count;
+            self->fixed_size    = size;
+        }
+    }
+    CAIO_END_CRITICAL_SECTION();
+
+    PyMem_Free(iovecs);
+
+    if (ret < 0) {
+        PyBuffer_Release(&view);
+        Py_DECREF(pool);
+
+        if (busy) {
+            PyErr_SetString(
+                PyExc_RuntimeError,
+                "buffers are already registered, "
+                "call unregister_buffers() first"
+            );
+        } else {
+            errno = saved_errno;
+            PyErr_SetFromErrno(PyExc_SystemError);
+        }
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+
+PyDoc_STRVAR(AIOContext_unregister_buffers_docstring,
+    "Unregisters the pool set up by register_buffers(). Idempotent.\n\n"
+    "    Context.unregister_buffers() -> None\n\n"
+    "    Memoryviews already handed out stay valid; only new fixed\n"
+    "    operations are rejected until the next register_buffers()."
+);
+static PyObject *AIOContext_unregister_buffers(
+    AIOContext *self, PyObject *Py_UNUSED(ignored)
+) {
+    if (self->uring_fd < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "context not initialized");
+        return NULL;
+    }
+
+    int ret = 0;
+    int saved_errno = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    if (self->fixed_buffers != NULL) {
+        /* The kernel waits for in-flight fixed ops to drop their own
+         * references before this returns - GIL released for that. */
+        Py_BEGIN_ALLOW_THREADS
+        ret = io_uring_register(
+            self->uring_fd, IORING_UNREGISTER_BUFFERS, NULL, 0
+        );
+        saved_errno = errno;
+        Py_END_ALLOW_THREADS
+
+        if (ret >= 0)
+            AIOContext_release_buffers(self);
+    }
+    CAIO_END_CRITICAL_SECTION();
+
+    if (ret < 0) {
+        errno = saved_errno;
+        PyErr_SetFromErrno(PyExc_SystemError);
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+
+PyDoc_STRVAR(AIOContext_get_buffer_docstring,
+    "Returns a writable memoryview of one registered buffer slot.\n\n"
+    "    Context.get_buffer(buf_index) -> memoryview"
+);
+static PyObject *AIOContext_get_buffer(AIOContext *self, PyObject *arg) {
+    Py_ssize_t index = PyNumber_AsSsize_t(arg, PyExc_IndexError);
+    if (index == -1 && PyErr_Occurred())
+        return NULL;
+
+    PyObject *pool = NULL;
+    Py_ssize_t size = 0;
+    uint32_t count = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    pool  = Py_XNewRef(self->fixed_buffers);
+    size  = (Py_ssize_t) self->fixed_size;
+    count = self->fixed_count;
+    CAIO_END_CRITICAL_SECTION();
+
+    if (pool == NULL) {
+        PyErr_SetString(
+            PyExc_RuntimeError,
+            "no buffers registered, call register_buffers() first"
+        );
+        return NULL;
+    }
+
+    if (index < 0 || index >= (Py_ssize_t) count) {
+        Py_DECREF(pool);
+        PyErr_Format(
+            PyExc_IndexError, "buf_index %zd out of range [0, %u)",
+            index, count
+        );
+        return NULL;
+    }
+
+    PyObject *view = PyMemoryView_FromObject(pool);
+    Py_DECREF(pool);
+    if (view == NULL)
+        return NULL;
+
+    PyObject *slot = PySequence_GetSlice(view, index * size, (index + 1) * size);
+    Py_DECREF(view);
+    return slot;
+}
+
+
+/* Converts register_files()/update_files() input into the int32 array the
+ * kernel expects: either an int (that many empty, -1 slots) or a sequence
+ * of file descriptors, where -1 leaves (or makes) a slot empty. Returns a
+ * PyMem buffer the caller frees, or NULL with an exception set. */
+static int32_t *AIOContext_files_array(
+    PyObject *files, int allow_count, uint32_t *count
+) {
+    int32_t *fds = NULL;
+
+    if (allow_count && PyLong_Check(files)) {
+        unsigned long size = PyLong_AsUnsignedLong(files);
+        if (size == (unsigned long) -1 && PyErr_Occurred())
+            return NULL;
+        if (size == 0 || size > FIXED_FILES_MAX) {
+            PyErr_Format(
+                PyExc_ValueError, "files count must be between 1 and %u",
+                FIXED_FILES_MAX
+            );
+            return NULL;
+        }
+
+        fds = PyMem_New(int32_t, size);
+        if (fds == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        for (unsigned long i = 0; i < size; i++)
+            fds[i] = -1;
+
+        *count = (uint32_t) size;
+        return fds;
+    }
+
+    PyObject *seq = PySequence_Fast(files, "files must be a sequence of fds");
+    if (seq == NULL)
+        return NULL;
+
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    if (size == 0 || size > (Py_ssize_t) FIXED_FILES_MAX) {
+        Py_DECREF(seq);
+        PyErr_Format(
+            PyExc_ValueError, "files length must be between 1 and %u",
+            FIXED_FILES_MAX
+        );
+        return NULL;
+    }
+
+    fds = PyMem_New(int32_t, size);
+    if (fds == NULL) {
+        Py_DECREF(seq);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+        long fd = -1;
+
+        if (item != Py_None) {
+            fd = PyLong_AsLong(item);
+            if (fd == -1 && PyErr_Occurred()) {
+                PyMem_Free(fds);
+                Py_DECREF(seq);
+                return NULL;
+            }
+        }
+
+        if (fd < -1 || fd > INT32_MAX) {
+            PyMem_Free(fds);
+            Py_DECREF(seq);
+            PyErr_Format(
+                PyExc_ValueError, "invalid file descriptor %ld at %zd", fd, i
+            );
+            return NULL;
+        }
+        fds[i] = (int32_t) fd;
+    }
+
+    Py_DECREF(seq);
+    *count = (uint32_t) size;
+    return fds;
+}
+
+
+PyDoc_STRVAR(AIOContext_register_files_docstring,
+    "Registers a file descriptor table with the ring (IORING_REGISTER_FILES).\n\n"
+    "    Context.register_files(files) -> None\n\n"
+    "    files is a sequence of fds (None or -1 leaves a slot empty) or an\n"
+    "    int, for a table of that many empty slots to fill in later with\n"
+    "    update_files(). Operations created with fixed_file=True then pass\n"
+    "    a slot index as fd, which skips the per-operation fd lookup."
+);
+static PyObject *AIOContext_register_files(AIOContext *self, PyObject *files) {
+    if (self->uring_fd < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "context not initialized");
+        return NULL;
+    }
+
+    uint32_t count = 0;
+    int32_t *fds = AIOContext_files_array(files, 1, &count);
+    if (fds == NULL)
+        return NULL;
+
+    int ret = -1;
+    int saved_errno = 0;
+    int busy = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    if (self->files_count != 0) {
+        busy = 1;
+    } else {
+        Py_BEGIN_ALLOW_THREADS
+        ret = io_uring_register(
+            self->uring_fd, IORING_REGISTER_FILES, fds, count
+        );
+        saved_errno = errno;
+        Py_END_ALLOW_THREADS
+
+        if (ret >= 0)
+            self->files_count = count;
+    }
+    CAIO_END_CRITICAL_SECTION();
+
+    PyMem_Free(fds);
+
+    if (ret < 0) {
+        if (busy) {
+            PyErr_SetString(
+                PyExc_RuntimeError,
+                "files are already registered, "
+                "call unregister_files() first"
+            );
+        } else {
+            errno = saved_errno;
+            PyErr_SetFromErrno(PyExc_SystemError);
+        }
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+
+PyDoc_STRVAR(AIOContext_update_files_docstring,
+    "Replaces slots of the registered file table (IORING_REGISTER_FILES_UPDATE).\n\n"
+    "    Context.update_files(offset, files) -> int\n\n"
+    "    Slot offset + i gets files[i]; None or -1 empties it. Operations\n"
+    "    already in flight keep the file they started with. Returns the\n"
+    "    number of slots updated."
+);
+static PyObject *AIOContext_update_files(
+    AIOContext *self, PyObject *args, PyObject *kwds
+) {
+    static char *kwlist[] = {"offset", "files", NULL};
+
+    uint32_t offset = 0;
+    PyObject *files = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "IO", kwlist, &offset, &files))
+        return NULL;
+
+    if (self->uring_fd < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "context not initialized");
+        return NULL;
+    }
+
+    uint32_t count = 0;
+    int32_t *fds = AIOContext_files_array(files, 0, &count);
+    if (fds == NULL)
+        return NULL;
+
+    struct io_uring_files_update update;
+    memset(&update, 0, sizeof(update));
+    update.offset = offset;
+    update.fds    = (uint64_t)(uintptr_t) fds;
+
+    int ret = -1;
+    int saved_errno = 0;
+    uint32_t files_count = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    files_count = self->files_count;
+    if (files_count != 0 && (uint64_t) offset + count <= files_count) {
+        Py_BEGIN_ALLOW_THREADS
+        ret = io_uring_register(
+            self->uring_fd, IORING_REGISTER_FILES_UPDATE, &update, count
+        );
+        saved_errno = errno;
+        Py_END_ALLOW_THREADS
+    }
+    CAIO_END_CRITICAL_SECTION();
+
+    PyMem_Free(fds);
+
+    if (files_count == 0) {
+        PyErr_SetString(
+            PyExc_RuntimeError,
+            "no files registered, call register_files() first"
+        );
+        return NULL;
+    }
+
+    if ((uint64_t) offset + count > files_count) {
+        PyErr_Format(
+            PyExc_IndexError,
+            "slots [%u, %llu) out of range [0, %u)",
+            offset, (unsigned long long) offset + count, files_count
+        );
+        return NULL;
+    }
+
+    if (ret < 0) {
+        errno = saved_errno;
+        PyErr_SetFromErrno(PyExc_SystemError);
+        return NULL;
+    }
+
+    return PyLong_FromLong(ret);
+}
+
+
+PyDoc_STRVAR(AIOContext_unregister_files_docstring,
+    "Unregisters the table set up by register_files(). Idempotent.\n\n"
+    "    Context.unregister_files() -> None"
+);
+static PyObject *AIOContext_unregister_files(
+    AIOContext *self, PyObject *Py_UNUSED(ignored)
+) {
+    if (self->uring_fd < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "context not initialized");
+        return NULL;
+    }
+
+    int ret = 0;
+    int saved_errno = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    if (self->files_count != 0) {
+        Py_BEGIN_ALLOW_THREADS
+        ret = io_uring_register(
+            self->uring_fd, IORING_UNREGISTER_FILES, NULL, 0
+        );
+        saved_errno = errno;
+        Py_END_ALLOW_THREADS
+
+        if (ret >= 0)
+            self->files_count = 0;
+    }
+    CAIO_END_CRITICAL_SECTION();
+
+    if (ret < 0) {
+        errno = saved_errno;
+        PyErr_SetFromErrno(PyExc_SystemError);
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+
 static PyMemberDef AIOContext_members[] = {
     {
         "fileno",       T_INT,
@@ -1354,9 +2680,51 @@ static PyMemberDef AIOContext_members[] = {
         "sqpoll", T_UBYTE,
         offsetof(AIOContext, sqpoll), READONLY, "SQPOLL mode active"
     },
+    {
+        "buffers_count", T_UINT,
+        offsetof(AIOContext, fixed_count), READONLY,
+        "number of registered buffer slots"
+    },
+    {
+        "buffers_size", T_UINT,
+        offsetof(AIOContext, fixed_size), READONLY,
+        "size of each registered buffer slot"
+    },
+    {
+        "files_count", T_UINT,
+        offsetof(AIOContext, files_count), READONLY,
+        "number of registered file table slots"
+    },
     {NULL}
 };
 
+PyDoc_STRVAR(AIOContext_set_batch_callback_docstring,
+    "Sets a callback for completions delivered all at once.\n\n"
+    "    Context.set_batch_callback(callback) -> None\n\n"
+    "    Every CQ drain (process_events(), or flush() completing inline)\n"
+    "    hands the Operations it completed that have no callback of their\n"
+    "    own to callback(operations) - one call per batch instead of one\n"
+    "    per Operation. None removes it."
+);
+static PyObject *AIOContext_set_batch_callback(
+    AIOContext *self, PyObject *callback
+) {
+    if (callback != Py_None && !PyCallable_Check(callback)) {
+        PyErr_Format(PyExc_ValueError, "object %r is not callable", callback);
+        return NULL;
+    }
+
+    PyObject *old_callback;
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    old_callback = self->batch_callback;
+    self->batch_callback = callback == Py_None ? NULL : Py_NewRef(callback);
+    CAIO_END_CRITICAL_SECTION();
+    Py_XDECREF(old_callback);
+
+    Py_RETURN_NONE;
+}
+
+
 static PyMethodDef AIOContext_methods[] = {
     {
         "submit",
@@ -1364,6 +2732,12 @@ static PyMethodDef AIOContext_methods[] = {
         METH_VARARGS,
         AIOContext_submit_docstring
     },
+    {
+        "submit_chain",
+        (PyCFunction) AIOContext_submit_chain,
+        METH_VARARGS,
+        AIOContext_submit_chain_docstring
+    },
     {
         "flush",
         (PyCFunction) AIOContext_flush,
@@ -1388,6 +2762,48 @@ static PyMethodDef AIOContext_methods[] = {
         METH_NOARGS,
         AIOContext_poll_docstring
     },
+    {
+        "set_batch_callback",
+        (PyCFunction) AIOContext_set_batch_callback,
+        METH_O,
+        AIOContext_set_batch_callback_docstring
+    },
+    {
+        "register_buffers",
+        (PyCFunction) AIOContext_register_buffers,
+        METH_VARARGS | METH_KEYWORDS,
+        AIOContext_register_buffers_docstring
+    },
+    {
+        "unregister_buffers",
+        (PyCFunction) AIOContext_unregister_buffers,
+        METH_NOARGS,
+        AIOContext_unregister_buffers_docstring
+    },
+    {
+        "get_buffer",
+        (PyCFunction) AIOContext_get_buffer,
+        METH_O,
+        AIOContext_get_buffer_docstring
+    },
+    {
+        "register_files",
+        (PyCFunction) AIOContext_register_files,
+        METH_O,
+        AIOContext_register_files_docstring
+    },
+    {
+        "update_files",
+        (PyCFunction) AIOContext_update_files,
+        METH_VARARGS | METH_KEYWORDS,
+        AIOContext_update_files_docstring
+    },
+    {
+        "unregister_files",
+        (PyCFunction) AIOContext_unregister_files,
+        METH_NOARGS,
+        AIOContext_unregister_files_docstring
+    },
     {NULL}
 };
 
@@ -1412,11 +2828,77 @@ static PyTypeObject AIOContextType = {
    Module
    ================================================================ */
 
+PyDoc_STRVAR(set_zero_fill_docstring,
+    "Whether read buffers are zero-filled when allocated.\n\n"
+    "    set_zero_fill(enabled: bool) -> bool\n\n"
+    "    Off by default: only the part of a buffer a read did not fill is\n"
+    "    zeroed, after it completes. Returns the previous setting."
+);
+static PyObject *linux_uring_set_zero_fill(PyObject *module, PyObject *arg) {
+    int enabled = PyObject_IsTrue(arg);
+    if (enabled < 0) return NULL;
+
+    int previous = zero_fill;
+    zero_fill = enabled;
+    return PyBool_FromLong(previous);
+}
+
+
+PyDoc_STRVAR(freelist_info_docstring, CAIO_FREELIST_INFO_DOC);
+static PyObject *linux_uring_freelist_info(PyObject *module, PyObject *args) {
+    return caio_freelist_info(&freelist);
+}
+
+
+PyDoc_STRVAR(freelist_trim_docstring, CAIO_FREELIST_TRIM_DOC);
+static PyObject *linux_uring_freelist_trim(PyObject *module, PyObject *args) {
+    return PyLong_FromSize_t(caio_freelist_shrink(&freelist, 0, 0));
+}
+
+
+PyDoc_STRVAR(freelist_set_limits_docstring, CAIO_FREELIST_SET_LIMITS_DOC);
+static PyObject *linux_uring_freelist_set_limits(
+    PyObject *module, PyObject *args, PyObject *kwds
+) {
+    return caio_freelist_set_limits(&freelist, args, kwds);
+}
+
+
+static PyMethodDef linux_uring_methods[] = {
+    {
+        "set_zero_fill",
+        (PyCFunction) linux_uring_set_zero_fill,
+        METH_O,
+        set_zero_fill_docstring
+    },
+    {
+        "freelist_info",
+        (PyCFunction) linux_uring_freelist_info,
+        METH_NOARGS,
+        freelist_info_docstring
+    },
+    {
+        "freelist_trim",
+        (PyCFunction) linux_uring_freelist_trim,
+        METH_NOARGS,
+        freelist_trim_docstring
+    },
+    {
+        "freelist_set_limits",
+        (PyCFunction) linux_uring_freelist_set_limits,
+        METH_VARARGS | METH_KEYWORDS,
+        freelist_set_limits_docstring
+    },
+    {NULL}
+};
+
+
 static PyModuleDef linux_uring_module = {
     PyModuleDef_HEAD_INIT,
     .m_name = "linux_uring",
     .m_doc  = "io_uring based AIO backend (Linux 5.6+).",
     .m_size = -1,
+    .m_methods = linux_uring_methods,
 };
 
 
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from .abstract import AbstractContext, AbstractOperation
@@ -16,6 +16,12 @@ class Context(AbstractContext):
 
     def poll(self) -> int: ...
 
+    # Called with the list of completed Operations that have no callback
+    # of their own, once per drained batch; None removes it.
+    def set_batch_callback(
+        self, callback: Callable[[list[Operation]], Any] | None,
+    ) -> None: ...
+
     def process_events(
         self,
         max_requests: int = 512,
@@ -25,29 +31,91 @@ class Context(AbstractContext):
 
     def flush(self) -> int: ...
 
+    # Submits the operations as one IOSQE_IO_LINK chain
+    def submit_chain(self, *aio_operations: Operation) -> int: ...
+
     @property
     def sqpoll(self) -> bool: ...
 
+    def register_buffers(self, count: int, size: int) -> None: ...
+
+    def unregister_buffers(self) -> None: ...
+
+    def get_buffer(self, buf_index: int) -> memoryview: ...
+
+    @property
+    def buffers_count(self) -> int: ...
+
+    @property
+    def buffers_size(self) -> int: ...
+
+    def register_files(self, files: int | Sequence[int | None]) -> None: ...
+
+    def update_files(
+        self, offset: int, files: Sequence[int | None],
+    ) -> int: ...
+
+    def unregister_files(self) -> None: ...
+
+    @property
+    def files_count(self) -> int: ...
+
 
 # noinspection PyPropertyDefinition
 class Operation(AbstractOperation):
     @classmethod
     def read(
         cls, nbytes: int, fd: int, offset: int, priority: int = 0,
+        *, fixed_file: bool = False, alignment: int = 0, flags: int = 0,
     ) -> Operation: ...
 
     @classmethod
     def write(
         cls, payload_bytes: bytes, fd: int, offset: int, priority: int = 0,
+        *, fixed_file: bool = False, flags: int = 0,
     ) -> Operation: ...
 
     @classmethod
-    def fsync(cls, fd: int, priority: int = 0) -> Operation: ...
+    def read_fixed(
+        cls, nbytes: int, fd: int, offset: int, buf_index: int,
+        priority: int = 0, *, fixed_file: bool = False,
+    ) -> Operation: ...
 
     @classmethod
-    def fdsync(cls, fd: int, priority: int = 0) -> Operation: ...
+    def write_fixed(
+        cls, nbytes: int, fd: int, offset: int, buf_index: int,
+        priority: int = 0, *, fixed_file: bool = False,
+    ) -> Operation: ...
 
-    def get_value(self) -> bytes | int | None: ...
+    @classmethod
+    def readinto(
+        cls, buffer: Any, fd: int, offset: int, priority: int = 0,
+        *, fixed_file: bool = False,
+    ) -> Operation: ...
+
+    @classmethod
+    def readv(
+        cls, sizes: Sequence[int], fd: int, offset: int, priority: int = 0,
+        *, fixed_file: bool = False,
+    ) -> Operation: ...
+
+    @classmethod
+    def writev(
+        cls, buffers: Sequence[bytes], fd: int, offset: int,
+        priority: int = 0, *, fixed_file: bool = False,
+    ) -> Operation: ...
+
+    @classmethod
+    def fsync(
+        cls, fd: int, priority: int = 0, *, fixed_file: bool = False,
+    ) -> Operation: ...
+
+    @classmethod
+    def fdsync(
+        cls, fd: int, priority: int = 0, *, fixed_file: bool = False,
+    ) -> Operation: ...
+
+    def get_value(self) -> bytes | memoryview | list[bytes] | int | None: ...
 
     def set_callback(self, callback: Callable[[int], Any]) -> bool: ...
 
@@ -58,16 +126,33 @@ class Operation(AbstractOperation):
     def offset(self) -> int: ...
 
     @property
-    def payload(self) -> bytes | memoryview | None: ...
+    def payload(self) -> Any: ...
 
     @property
     def nbytes(self) -> int: ...
 
+    @property
+    def priority(self) -> int: ...
+
     @property
     def result(self) -> int: ...
 
     @property
     def error(self) -> int: ...
 
+    @property
+    def fixed_file(self) -> bool: ...
+
     @property
     def context(self) -> AbstractContext | None: ...
+
+
+# Zero read buffers up front rather than only what a read left unfilled
+def set_zero_fill(enabled: bool) -> bool: ...
+
+# Per-module cache of recycled Operation objects and read buffers
+def freelist_info() -> dict[str, Any]: ...
+def freelist_trim() -> int: ...
+def freelist_set_limits(
+    max_bytes: int | None = None, max_objects: int | None = None,
+) -> None: ...
@@ -1,3 +1,5 @@
+import typing
+
 from .asyncio_base import AsyncioContextBase
 from .linux_uring import SQPOLL_ALLOWED, Context, Operation
 
@@ -48,6 +50,106 @@ class AsyncioContext(AsyncioContextBase):
             self._flush_scheduled = True
             self.loop.call_soon(self._deferred_flush)
 
+    # fixed_file=True: `fd` is a slot of `self.context.register_files()`'s
+    # table rather than a file descriptor.
+    def read(
+        self, nbytes: int, fd: int, offset: int, priority: int = 0,
+        *, fixed_file: bool = False, alignment: int = 0, flags: int = 0,
+    ) -> typing.Awaitable[bytes]:
+        if not fixed_file:
+            return super().read(
+                nbytes, fd, offset, priority,
+                alignment=alignment, flags=flags,
+            )
+        return self.submit(
+            Operation.read(
+                nbytes, fd, offset, priority, fixed_file=fixed_file,
+                alignment=alignment, flags=flags,
+            ),
+        )
+
+    def write(
+        self, payload: bytes, fd: int, offset: int, priority: int = 0,
+        *, fixed_file: bool = False, flags: int = 0,
+    ) -> typing.Awaitable[int]:
+        if not fixed_file:
+            return super().write(payload, fd, offset, priority, flags=flags)
+        return self.submit(
+            Operation.write(
+                payload, fd, offset, priority, fixed_file=fixed_file,
+                flags=flags,
+            ),
+        )
+
+    def readinto(
+        self, buffer: typing.Any, fd: int, offset: int,
+        priority: int = 0, *, fixed_file: bool = False,
+    ) -> typing.Awaitable[int]:
+        return self.submit(
+            Operation.readinto(
+                buffer, fd, offset, priority, fixed_file=fixed_file,
+            ),
+        )
+
+    def readv(
+        self, sizes: typing.Sequence[int], fd: int, offset: int,
+        priority: int = 0, *, fixed_file: bool = False,
+    ) -> typing.Awaitable[list[bytes]]:
+        return self.submit(
+            Operation.readv(
+                sizes, fd, offset, priority, fixed_file=fixed_file,
+            ),
+        )
+
+    def writev(
+        self, buffers: typing.Sequence[bytes], fd: int, offset: int,
+        priority: int = 0, *, fixed_file: bool = False,
+    ) -> typing.Awaitable[int]:
+        if not fixed_file:
+            return super().writev(buffers, fd, offset, priority)
+        return self.submit(
+            Operation.writev(
+                buffers, fd, offset, priority, fixed_file=fixed_file,
+            ),
+        )
+
+    # group_commit shares syncs per file descriptor - fixed_file slots
+    # always get their own.
+    def fsync(self, fd: int, *, fixed_file: bool = False) -> typing.Awaitable:
+        if self.group_commit and not fixed_file:
+            return self._group_sync(fd, full=True)
+        return self.submit(Operation.fsync(fd, fixed_file=fixed_file))
+
+    def fdsync(self, fd: int, *, fixed_file: bool = False) -> typing.Awaitable:
+        if self.group_commit and not fixed_file:
+            return self._group_sync(fd, full=False)
+        return self.submit(Operation.fdsync(fd, fixed_file=fixed_file))
+
+    def read_fixed(
+        self, nbytes: int, fd: int, offset: int,
+        buf_index: int, priority: int = 0, *, fixed_file: bool = False,
+    ) -> typing.Awaitable[memoryview]:
+        """Reads into slot `buf_index` of `self.context.register_buffers()`'s
+        pool - the returned memoryview aliases that slot, so it's only valid
+        until the slot is handed to another operation."""
+        return self.submit(
+            Operation.read_fixed(
+                nbytes, fd, offset, buf_index, priority,
+                fixed_file=fixed_file,
+            ),
+        )
+
+    def write_fixed(
+        self, nbytes: int, fd: int, offset: int,
+        buf_index: int, priority: int = 0, *, fixed_file: bool = False,
+    ) -> typing.Awaitable[int]:
+        return self.submit(
+            Operation.write_fixed(
+                nbytes, fd, offset, buf_index, priority,
+                fixed_file=fixed_file,
+            ),
+        )
+
     def _deferred_flush(self):
         self._flush_scheduled = False
         self.context.flush()
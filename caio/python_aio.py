@@ -1,8 +1,11 @@
+import errno
+import heapq
+import itertools
 import operator
 import os
 import sys
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from enum import IntEnum, unique
 from multiprocessing.pool import ThreadPool
 from threading import Lock, RLock
@@ -11,9 +14,23 @@ from typing import Any
 from weakref import WeakValueDictionary
 
 from .abstract import AbstractContext, AbstractOperation
+from .buffers import aligned_buffer, check_alignment
+from .ioprio import queue_level
+from .rwflags import RWFlag
 
 fdsync = getattr(os, "fdatasync", os.fsync)
 NATIVE_PREAD_PWRITE = hasattr(os, "pread") and hasattr(os, "pwrite")
+NATIVE_PREADV_PWRITEV = hasattr(os, "preadv") and hasattr(os, "pwritev")
+
+# UIO_MAXIOV, the same limit the native backends enforce
+IOV_MAX = 1024
+
+# RWF_* flags need preadv2()/pwritev2(), which os.preadv()/os.pwritev()
+# call when given any
+RWF_SUPPORTED = (
+    sum(RWFlag) if NATIVE_PREADV_PWRITEV and hasattr(os, "RWF_NOWAIT")
+    else 0
+)
 
 
 @unique
@@ -22,6 +39,9 @@ class OpCode(IntEnum):
     WRITE = 1
     FSYNC = 2
     FDSYNC = 3
+    READV = 4
+    WRITEV = 5
+    READINTO = 6
     NOOP = -1
 
 
@@ -39,7 +59,10 @@ class Context(AbstractContext):
 
     MAX_POOL_SIZE = 128
 
-    def __init__(self, max_requests: int = 32, pool_size: int = 8):
+    def __init__(
+        self, max_requests: int = 32, pool_size: int = 8,
+        inline_reads: bool = False,
+    ):
         # Set before any validation that can raise: __del__ runs even on a
         # partially-constructed object, and close() below relies on _state
         # existing and being non-OPEN to safely no-op before ever touching
@@ -57,9 +80,18 @@ class Context(AbstractContext):
             )
 
         self.__max_requests = max_requests
+        # submit() first tries reads with RWF_NOWAIT on the calling thread,
+        # see _try_inline() - needs preadv2(), a no-op without it.
+        self.inline_reads = bool(inline_reads)
         self.pool = ThreadPool(pool_size)
         self._in_progress = 0
         self._lock = Lock()
+        # Submitted operations waiting for a worker, a heap of
+        # (priority, submit order, operation). Every submit() queues one
+        # _run_next() job on the pool, and each job runs whatever is most
+        # urgent by then rather than the operation it was queued for.
+        self._pending: list = []
+        self._sequence = itertools.count()
         self._state = ContextState.OPEN
 
         if not NATIVE_PREAD_PWRITE:
@@ -98,42 +130,51 @@ class Context(AbstractContext):
         with self._lock:
             self._in_progress -= 1
 
-    def _rollback_claim(self, operation: "Operation"):
-        """
-        Undoes a claim that was never actually scheduled (e.g. a
-        concurrent close() tore down the pool between the capacity
-        reservation and apply_async()) - unlike genuine completion, this
-        must reset operation.in_progress, since the operation never
-        actually ran and must stay retryable.
-        """
-        with operation._lock, self._lock:
-            operation.in_progress = False
-            self._in_progress -= 1
-
-    def _execute(self, operation: "Operation") -> bool:
+    def _run_next(self):
         """
-        Returns True if actually scheduled, False if skipped because
-        ``operation`` was already in progress - matches the other three
-        backends, which all silently skip (rather than raise on, or
-        dispatch twice) a resubmit of an Operation still in flight.
+        Pool job: runs the most urgent pending entry - one operation, or a
+        whole submit_chain() in order, where an operation that fails or
+        transfers less than it asked for cancels the rest.
         """
-        handler = self._OP_MAP[operation.opcode]
-
-        # operation.in_progress is deliberately NOT reset on genuine
-        # completion below - one-shot forever once actually scheduled,
-        # matching all three native backends: a completed Operation must
-        # not be resubmittable, only a fresh one constructed for a retry.
-        def on_error(exc):
-            self._release_slot()
-            operation.exception = exc
-            operation.written = 0
-            self._invoke_callback(operation, None)
-
-        def on_success(result):
+        with self._lock:
+            _, _, operations = heapq.heappop(self._pending)
+
+        outcomes = []
+        cancelled = False
+        for operation in operations:
+            if cancelled:
+                outcomes.append((
+                    operation, None,
+                    OSError(errno.ECANCELED, os.strerror(errno.ECANCELED)),
+                ))
+                continue
+            try:
+                result = self._OP_MAP[operation.opcode](self, operation)
+            except Exception as exc:  # noqa: BLE001 (delivered to the callback, as apply_async()'s error_callback used to)
+                outcomes.append((operation, None, exc))
+                cancelled = True
+                continue
+            outcomes.append((operation, result, None))
+            cancelled = result is not None and result != operation.nbytes
+        return outcomes
+
+    def _on_done(self, outcomes):
+        for operation, result, exc in outcomes:
             self._release_slot()
-            operation.written = result
-            self._invoke_callback(operation, result)
-
+            if exc is not None:
+                operation.exception = exc
+                operation.written = 0
+                self._invoke_callback(operation, None)
+            else:
+                operation.written = result
+                self._invoke_callback(operation, result)
+
+    def _claim(self, operation: "Operation") -> bool:
+        # operation.in_progress is deliberately NOT reset on genuine
+        # completion - one-shot forever once actually scheduled, matching
+        # all three native backends: a completed Operation must not be
+        # resubmittable, only a fresh one constructed for a retry.
+        #
         # operation.in_progress is the Operation's own lock, not this
         # Context's - two different Contexts submitting the same Operation
         # only ever share the Operation, never a Context, so a per-Context
@@ -152,13 +193,56 @@ class Context(AbstractContext):
 
             operation.in_progress = True
             self._in_progress += 1
+        return True
 
-        try:
-            self.pool.apply_async(
-                handler, args=(self, operation),
-                callback=on_success,
-                error_callback=on_error,
+    def _rollback_claim(self, operation: "Operation"):
+        """
+        Undoes a claim that was never actually scheduled (e.g. a
+        concurrent close() tore down the pool between the capacity
+        reservation and apply_async()) - unlike genuine completion, this
+        must reset operation.in_progress, since the operation never
+        actually ran and must stay retryable.
+        """
+        with operation._lock, self._lock:
+            operation.in_progress = False
+            self._in_progress -= 1
+
+    def _schedule(self, operations: tuple):
+        with self._lock:
+            entry = (
+                queue_level(operations[0].priority),
+                next(self._sequence),
+                operations,
             )
+            heapq.heappush(self._pending, entry)
+
+            # Still under self._lock, so no _run_next() can have popped
+            # `entry` yet - a failure only ever has to undo our own push.
+            try:
+                self.pool.apply_async(self._run_next, callback=self._on_done)
+            except BaseException:
+                self._pending.remove(entry)
+                heapq.heapify(self._pending)
+                raise
+
+    def _execute(self, operation: "Operation") -> bool:
+        """
+        Returns True if actually scheduled, False if skipped because
+        ``operation`` was already in progress - matches the other three
+        backends, which all silently skip (rather than raise on, or
+        dispatch twice) a resubmit of an Operation still in flight.
+        """
+        if not self._claim(operation):
+            return False
+
+        if self.inline_reads:
+            result = self._try_inline(operation)
+            if result is not None:
+                self._on_done([(operation, result, None)])
+                return True
+
+        try:
+            self._schedule((operation,))
         except BaseException:
             # Scheduling itself failed (e.g. a concurrent close() already
             # tore down the pool) - the slot reserved above was never
@@ -169,6 +253,62 @@ class Context(AbstractContext):
 
         return True
 
+    def _try_inline(self, operation: "Operation") -> int | None:
+        """
+        Runs a read right here with RWF_NOWAIT, which the kernel only
+        serves from the page cache - EAGAIN rather than ever blocking on
+        the device. Returns its result, or None when it has to go to the
+        pool after all: on any error, and on a short read that didn't
+        reach the end of file either, i.e. only partly cached.
+        """
+        if not RWF_SUPPORTED:
+            return None
+
+        flags = operation.flags | os.RWF_NOWAIT
+        try:
+            if operation.opcode == OpCode.READ:
+                data = self.__preadv(operation, flags)
+                size = len(data)
+            elif operation.opcode == OpCode.READINTO:
+                # Not through a `with` - the pool still needs the target
+                # should this come up short.
+                size = os.preadv(
+                    operation.fileno, [operation.target], operation.offset,
+                    flags,
+                )
+            else:
+                return None
+            # Short because it ran into the end of file, or only partly
+            # cached
+            if 0 < size < operation.nbytes and (
+                operation.offset + size < os.fstat(operation.fileno).st_size
+            ):
+                return None
+        except OSError:
+            return None
+
+        if operation.opcode == OpCode.READ:
+            operation.buffer = data
+        else:
+            operation.target.release()
+        return size
+
+    def __preadv(self, operation: "Operation", flags: int) -> bytes:
+        if operation.alignment:
+            # O_DIRECT needs the destination aligned, which the bytes
+            # os.read() allocates never are - read into a mapping instead.
+            with aligned_buffer(
+                operation.nbytes, operation.alignment,
+            ) as view:
+                size = os.preadv(
+                    operation.fileno, [view], operation.offset, flags,
+                )
+                return bytes(view[:size])
+
+        buffer = bytearray(operation.nbytes)
+        size = os.preadv(operation.fileno, [buffer], operation.offset, flags)
+        return bytes(memoryview(buffer)[:size])
+
     if NATIVE_PREAD_PWRITE:
         def __pread(self, fd, size, offset):
             return os.pread(fd, size, offset)
@@ -207,19 +347,65 @@ class Context(AbstractContext):
         # returns exactly the bytes object get_value()/payload need to hand
         # back, and buffering it through BytesIO.write() just to unwrap it
         # again later cost a full extra copy per read for no benefit.
-        data = self.__pread(
-            operation.fileno, operation.nbytes, operation.offset,
-        )
+        if NATIVE_PREADV_PWRITEV and (operation.alignment or operation.flags):
+            data = self.__preadv(operation, operation.flags)
+        else:
+            data = self.__pread(
+                operation.fileno, operation.nbytes, operation.offset,
+            )
         operation.buffer = data
         return len(data)
 
     def _handle_write(self, operation: "Operation"):
         # operation.buffer is the caller's own payload bytes, unwrapped -
         # no BytesIO round-trip needed to hand it to pwrite() either.
+        if operation.flags:
+            return os.pwritev(
+                operation.fileno, [operation.buffer], operation.offset,
+                operation.flags,
+            )
         return self.__pwrite(
             operation.fileno, operation.buffer, operation.offset,
         )
 
+    def _handle_readinto(self, operation: "Operation"):
+        # Released once done, like the C backends drop their export on
+        # completion - the caller may resize its bytearray afterwards.
+        with operation.target as target:
+            if NATIVE_PREADV_PWRITEV:
+                return os.preadv(operation.fileno, [target], operation.offset)
+            data = self.__pread(
+                operation.fileno, operation.nbytes, operation.offset,
+            )
+            target[:len(data)] = data
+            return len(data)
+
+    def _handle_readv(self, operation: "Operation"):
+        # Read as one contiguous buffer, same as _handle_read() -
+        # get_value() cuts it back up at the sizes boundaries.
+        if not NATIVE_PREADV_PWRITEV:
+            return self._handle_read(operation)
+
+        buffer = bytearray(operation.nbytes)
+        view = memoryview(buffer)
+        slices, start = [], 0
+        for size in operation.vectors:
+            slices.append(view[start:start + size])
+            start += size
+
+        filled = os.preadv(operation.fileno, slices, operation.offset)
+        operation.buffer = bytes(view[:filled])
+        return filled
+
+    def _handle_writev(self, operation: "Operation"):
+        if NATIVE_PREADV_PWRITEV:
+            return os.pwritev(
+                operation.fileno, operation.vectors, operation.offset,
+            )
+        return self.__pwrite(
+            operation.fileno, b"".join(operation.vectors), operation.offset,
+        )
+
     def _handle_fsync(self, operation: "Operation"):
         return os.fsync(operation.fileno)
 
@@ -241,6 +427,35 @@ class Context(AbstractContext):
 
         return count
 
+    def submit_chain(self, *aio_operations) -> int:
+        """
+        Submits Operations as one chain: a single worker thread runs them
+        in order, each only once the previous one transferred everything
+        it asked for - otherwise the rest fail with ECANCELED.
+
+        All or nothing - raises ValueError if any of them is already
+        submitted.
+        """
+        for operation in aio_operations:
+            if not isinstance(operation, Operation):
+                raise ValueError(f"Invalid Operation {operation!r}")  # noqa: TRY004 (same exception type as submit())
+        if not aio_operations:
+            return 0
+
+        claimed = []
+        try:
+            for index, operation in enumerate(aio_operations):
+                if not self._claim(operation):
+                    raise ValueError(f"argument {index} is already submitted")
+                claimed.append(operation)
+            self._schedule(aio_operations)
+        except BaseException:
+            for operation in claimed:
+                self._rollback_claim(operation)
+            raise
+
+        return len(aio_operations)
+
     def cancel(self, *aio_operations) -> int:
         """
         Cancels multiple Operations. Returns
@@ -269,6 +484,9 @@ class Context(AbstractContext):
         OpCode.WRITE: _handle_write,
         OpCode.FSYNC: _handle_fsync,
         OpCode.FDSYNC: _handle_fdsync,
+        OpCode.READV: _handle_readv,
+        OpCode.READINTO: _handle_readinto,
+        OpCode.WRITEV: _handle_writev,
         OpCode.NOOP: _handle_noop,
     })
 
@@ -286,6 +504,10 @@ class Operation(AbstractOperation):
         opcode: OpCode,
         payload: bytes | None = None,
         priority: int | None = None,
+        vectors: Sequence | None = None,
+        target: Any = None,
+        alignment: int = 0,
+        flags: int = 0,
     ):
         # Validated eagerly, at construction time - matching the other 3
         # backends, which reject a non-int-like fd/nbytes/offset/priority
@@ -303,6 +525,15 @@ class Operation(AbstractOperation):
             offset = operator.index(offset)
         if priority is not None:
             priority = operator.index(priority)
+        alignment = operator.index(alignment)
+        if alignment:
+            check_alignment(alignment)
+        flags = operator.index(flags)
+        if flags & ~RWF_SUPPORTED:
+            raise ValueError(
+                f"unsupported flags {flags:#x}, expected a combination "
+                f"of {RWF_SUPPORTED:#x}",
+            )
 
         # Plain bytes, not a BytesIO wrapper - for a write this is the
         # caller's own payload, handed to pwrite() as-is; for a read it
@@ -317,6 +548,38 @@ class Operation(AbstractOperation):
         else:
             buffer = b""
 
+        # readv()'s sizes / writev()'s buffers, frozen into a tuple so a
+        # caller mutating its own list afterwards can't change what runs.
+        # Same eager validation as the C constructors' PySequence_Fast +
+        # PyObject_GetBuffer: ints >= 0 for sizes, bytes-like for buffers.
+        self.vectors: tuple = ()
+        if opcode in (OpCode.READV, OpCode.WRITEV):
+            items = tuple(vectors or ())
+            if not (0 < len(items) <= IOV_MAX):
+                raise ValueError(
+                    f"expected between 1 and {IOV_MAX} buffers, "
+                    f"got {len(items)}",
+                )
+            if opcode == OpCode.READV:
+                items = tuple(map(operator.index, items))
+                if any(size < 0 for size in items):
+                    raise ValueError(f"invalid sizes {items!r}")
+                nbytes = sum(items)
+            else:
+                nbytes = sum(memoryview(item).nbytes for item in items)
+            self.vectors = items
+
+        # readinto()'s destination as a flat, writable byte view - the same
+        # requirements PyBUF_WRITABLE puts on it in the C backends.
+        self.target: Any = None
+        self._target_obj = target
+        if opcode == OpCode.READINTO:
+            view = memoryview(target)
+            if view.readonly:
+                raise BufferError("Object is not writable.")
+            self.target = view.cast("B")
+            nbytes = self.target.nbytes
+
         self.callback: Callable[[int], Any] | None = None
         self.in_progress = False
         self._lock = Lock()
@@ -330,19 +593,28 @@ class Operation(AbstractOperation):
         self.__priority = priority or 0
         self.exception = None
         self.written = 0
+        self.alignment = alignment
+        self.flags = flags
 
     @classmethod
     def read(
-        cls, nbytes: int, fd: int, offset: int, priority=0,
+        cls, nbytes: int, fd: int, offset: int, priority=0, *,
+        alignment: int = 0, flags: int = 0,
     ) -> "Operation":
         """
-        Creates a new instance of Operation on read mode.
+        Creates a new instance of Operation on read mode. A nonzero
+        ``alignment`` reads into a buffer on that boundary, as O_DIRECT
+        requires. ``flags`` are RWF_* request flags, see caio.rwflags.
         """
-        return cls(fd, nbytes, offset, opcode=OpCode.READ, priority=priority)
+        return cls(
+            fd, nbytes, offset, opcode=OpCode.READ, priority=priority,
+            alignment=alignment, flags=flags,
+        )
 
     @classmethod
     def write(
-        cls, payload_bytes: bytes, fd: int, offset: int, priority=0,
+        cls, payload_bytes: bytes, fd: int, offset: int, priority=0, *,
+        flags: int = 0,
     ) -> "Operation":
         """
         Creates a new instance of AIOOperation on write mode.
@@ -354,6 +626,44 @@ class Operation(AbstractOperation):
             payload=payload_bytes,
             opcode=OpCode.WRITE,
             priority=priority,
+            flags=flags,
+        )
+
+    @classmethod
+    def readinto(
+        cls, buffer: Any, fd: int, offset: int, priority=0,
+    ) -> "Operation":
+        """
+        Creates a new instance of Operation reading straight into
+        ``buffer``, any writable buffer-protocol object.
+        """
+        return cls(
+            fd, None, offset, opcode=OpCode.READINTO,
+            priority=priority, target=buffer,
+        )
+
+    @classmethod
+    def readv(
+        cls, sizes: Sequence[int], fd: int, offset: int, priority=0,
+    ) -> "Operation":
+        """
+        Creates a new instance of Operation on vectored read mode.
+        """
+        return cls(
+            fd, None, offset, opcode=OpCode.READV,
+            priority=priority, vectors=sizes,
+        )
+
+    @classmethod
+    def writev(
+        cls, buffers: Sequence[bytes], fd: int, offset: int, priority=0,
+    ) -> "Operation":
+        """
+        Creates a new instance of Operation on vectored write mode.
+        """
+        return cls(
+            fd, None, offset, opcode=OpCode.WRITEV,
+            priority=priority, vectors=buffers,
         )
 
     @classmethod
@@ -372,16 +682,23 @@ class Operation(AbstractOperation):
         """
         return cls(fd, None, None, opcode=OpCode.FDSYNC, priority=priority)
 
-    def get_value(self) -> bytes | int | None:
+    def get_value(self) -> bytes | list[bytes] | int | None:
         """
         Method returns a bytes value of AIOOperation's result or None.
         """
         if self.exception:
             raise self.exception
 
-        if self.opcode == OpCode.WRITE:
+        if self.opcode in (OpCode.WRITE, OpCode.WRITEV, OpCode.READINTO):
             return self.written
 
+        if self.opcode == OpCode.READV:
+            chunks, start = [], 0
+            for size in self.vectors:
+                chunks.append(self.buffer[start:start + size])
+                start += size
+            return chunks
+
         if self.opcode in (OpCode.FSYNC, OpCode.FDSYNC):
             return None
 
@@ -396,13 +713,21 @@ class Operation(AbstractOperation):
         return self.__offset
 
     @property
-    def payload(self) -> memoryview | None:
+    def payload(self) -> Any:
+        if self.opcode == OpCode.WRITEV:
+            return self.vectors
+        if self.opcode == OpCode.READINTO:
+            return self._target_obj
         return memoryview(self.buffer)
 
     @property
     def nbytes(self) -> int:
         return self.__nbytes
 
+    @property
+    def priority(self) -> int:
+        return self.__priority
+
     def set_callback(self, callback: Callable[[int], Any]) -> bool:
         if not callable(callback):
             raise ValueError(f"callback must be callable, got {callback!r}")  # noqa: TRY004 (pre-existing public exception type, not changing it here)
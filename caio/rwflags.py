@@ -0,0 +1,37 @@
+"""
+Per-request flags for the ``flags`` argument of ``Operation.read()`` and
+``Operation.write()`` - the kernel's ``RWF_*``, the same values
+``preadv2()``/``pwritev2()`` take:
+
+    >>> from caio.rwflags import RWF_NOWAIT
+    >>> op = Operation.read(4096, fd, 0, flags=RWF_NOWAIT)
+
+With ``RWF_NOWAIT`` a read that would have to wait for the device (the
+data isn't in the page cache) fails with ``EAGAIN`` instead. ``RWF_DSYNC``
+and ``RWF_SYNC`` make one write durable like ``O_DSYNC``/``O_SYNC``,
+``RWF_APPEND`` writes at the end of file whatever the offset.
+``RWF_HIPRI`` asks for polled completion - ``linux_aio`` ignores it, and
+``linux_uring`` fails it with ``EINVAL``, its rings aren't set up for
+polling.
+
+``linux_uring`` and ``linux_aio`` pass the flags to the kernel with the
+request. ``thread_aio`` and ``python_aio`` call ``preadv2()``/
+``pwritev2()`` with them, and reject any on systems without those.
+"""
+from enum import IntFlag, unique
+
+
+@unique
+class RWFlag(IntFlag):
+    HIPRI = 0x01
+    DSYNC = 0x02
+    SYNC = 0x04
+    NOWAIT = 0x08
+    APPEND = 0x10
+
+
+RWF_HIPRI = RWFlag.HIPRI
+RWF_DSYNC = RWFlag.DSYNC
+RWF_SYNC = RWFlag.SYNC
+RWF_NOWAIT = RWFlag.NOWAIT
+RWF_APPEND = RWFlag.APPEND
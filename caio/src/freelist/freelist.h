@@ -0,0 +1,427 @@
+/*
+ * Size-classed free lists for read buffers and Operation objects.
+ *
+ * Header-only and included by each C backend, so every extension module
+ * gets its own private instance (a `static caio_freelist_t`) - nothing is
+ * shared across modules, and ops/buffers never migrate between them.
+ *
+ * Buffers: power-of-two size classes from 4 KiB to 1 MiB. A request is
+ * rounded up to its class (anything from half the smallest class up) and
+ * served from that class's list when possible; larger or much smaller
+ * requests bypass the cache entirely. Cached buffers are linked through
+ * their own first bytes, so an idle cache costs no extra memory. The
+ * total cached is capped at max_bytes - a buffer released over the cap is
+ * simply freed.
+ *
+ * Objects: a LIFO stack of dead Operation objects (GC-untracked, already
+ * cleared) to re-initialize instead of going back through tp_alloc /
+ * tp_free. Disabled on free-threaded builds, where object headers carry
+ * per-thread ownership state that a plain re-init can't reset safely.
+ *
+ * Every entry point needs the GIL (an attached thread state on
+ * free-threaded builds, where a PyMutex serializes the lists instead).
+ */
+#ifndef CAIO_FREELIST_H
+#define CAIO_FREELIST_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define CAIO_FREELIST_MIN_SHIFT   12      /* 4 KiB */
+#define CAIO_FREELIST_MAX_SHIFT   20      /* 1 MiB */
+#define CAIO_FREELIST_CLASSES \
+    (CAIO_FREELIST_MAX_SHIFT - CAIO_FREELIST_MIN_SHIFT + 1)
+
+#define CAIO_FREELIST_MAX_BYTES_DEFAULT   ((size_t) 32 << 20)
+#define CAIO_FREELIST_MAX_OBJECTS_DEFAULT ((size_t) 1024)
+
+#if PY_VERSION_HEX >= 0x030D0000 && defined(Py_GIL_DISABLED)
+#define CAIO_FREELIST_LOCK(fl)   PyMutex_Lock(&(fl)->mutex)
+#define CAIO_FREELIST_UNLOCK(fl) PyMutex_Unlock(&(fl)->mutex)
+#define CAIO_FREELIST_RECYCLE_OBJECTS 0
+#else
+#define CAIO_FREELIST_LOCK(fl)
+#define CAIO_FREELIST_UNLOCK(fl)
+#define CAIO_FREELIST_RECYCLE_OBJECTS 1
+#endif
+
+
+typedef struct caio_freelist_node {
+    struct caio_freelist_node *next;
+} caio_freelist_node;
+
+
+typedef struct {
+    caio_freelist_node *buffers[CAIO_FREELIST_CLASSES];
+    size_t buffer_counts[CAIO_FREELIST_CLASSES];
+    size_t cached_bytes;
+    size_t max_bytes;
+
+    PyObject **objects;          /* max_objects slots, allocated lazily */
+    size_t object_count;
+    size_t max_objects;
+
+    uint64_t hits;
+    uint64_t misses;
+#if PY_VERSION_HEX >= 0x030D0000 && defined(Py_GIL_DISABLED)
+    PyMutex mutex;
+#endif
+} caio_freelist_t;
+
+#define CAIO_FREELIST_INIT { \
+    .max_bytes = CAIO_FREELIST_MAX_BYTES_DEFAULT, \
+    .max_objects = CAIO_FREELIST_MAX_OBJECTS_DEFAULT, \
+}
+
+
+/* Class index for a buffer of `size` bytes, or -1 if it isn't cached. */
+static inline int caio_freelist_class(size_t size) {
+    if (size > ((size_t) 1 << CAIO_FREELIST_MAX_SHIFT) ||
+            size <= ((size_t) 1 << (CAIO_FREELIST_MIN_SHIFT - 1)))
+        return -1;
+
+    int index = 0;
+    while (((size_t) 1 << (CAIO_FREELIST_MIN_SHIFT + index)) < size)
+        index++;
+    return index;
+}
+
+
+/*
+ * Returns an uninitialized buffer of at least `size` bytes and stores its
+ * real size in *capacity - pass that back to caio_freelist_buffer_put().
+ * NULL (no exception set) only when out of memory.
+ */
+static inline void *caio_freelist_buffer_get(
+    caio_freelist_t *fl, size_t size, size_t *capacity
+) {
+    int index = caio_freelist_class(size);
+    if (index < 0) {
+        *capacity = size;
+        /* PyMem_Malloc(0) may return NULL - callers treat a NULL buffer
+         * with a zero size as valid, so only a real request can fail. */
+        return PyMem_Malloc(size ? size : 1);
+    }
+
+    size_t class_size = (size_t) 1 << (CAIO_FREELIST_MIN_SHIFT + index);
+    *capacity = class_size;
+
+    caio_freelist_node *node;
+    CAIO_FREELIST_LOCK(fl);
+    node = fl->buffers[index];
+    if (node != NULL) {
+        fl->buffers[index] = node->next;
+        fl->buffer_counts[index]--;
+        fl->cached_bytes -= class_size;
+        fl->hits++;
+    } else {
+        fl->misses++;
+    }
+    CAIO_FREELIST_UNLOCK(fl);
+
+    if (node != NULL)
+        return node;
+    return PyMem_Malloc(class_size);
+}
+
+
+/* Hands a buffer from caio_freelist_buffer_get() back - cached if its
+ * class has room under max_bytes, freed otherwise. */
+static inline void caio_freelist_buffer_put(
+    caio_freelist_t *fl, void *buffer, size_t capacity
+) {
+    if (buffer == NULL)
+        return;
+
+    int index = caio_freelist_class(capacity);
+    if (index >= 0 &&
+            capacity == ((size_t) 1 << (CAIO_FREELIST_MIN_SHIFT + index))) {
+        int cached = 0;
+        CAIO_FREELIST_LOCK(fl);
+        if (fl->cached_bytes + capacity <= fl->max_bytes) {
+            caio_freelist_node *node = (caio_freelist_node *) buffer;
+            node->next = fl->buffers[index];
+            fl->buffers[index] = node;
+            fl->buffer_counts[index]++;
+            fl->cached_bytes += capacity;
+            cached = 1;
+        }
+        CAIO_FREELIST_UNLOCK(fl);
+        if (cached)
+            return;
+    }
+
+    PyMem_Free(buffer);
+}
+
+
+/* Whether `alignment` can be passed to caio_aligned_buffer_get() -
+ * zero means no alignment. Sets ValueError when it can't. */
+static inline int caio_alignment_check(Py_ssize_t alignment) {
+    if (alignment < 0 || (alignment & (alignment - 1)) != 0) {
+        PyErr_SetString(PyExc_ValueError, "alignment must be a power of two");
+        return 0;
+    }
+    return 1;
+}
+
+
+/*
+ * Read buffer of `size` bytes starting on an `alignment` boundary, as
+ * O_DIRECT needs. Never taken from or handed back to the free list -
+ * release it with free(). NULL when out of memory.
+ */
+static inline void *caio_aligned_buffer_get(size_t size, size_t alignment) {
+    /* posix_memalign() rejects anything below a pointer's size */
+    if (alignment < sizeof(void *))
+        alignment = sizeof(void *);
+
+    void *buffer = NULL;
+    if (posix_memalign(&buffer, alignment, size ? size : 1) != 0)
+        return NULL;
+    return buffer;
+}
+
+
+/*
+ * Whether the memoryview an Operation built over its read buffer is the
+ * only thing that can still reach that memory - i.e. recycling the buffer
+ * can't be observed. Slices of a memoryview share its managed buffer
+ * rather than referencing the view itself, hence the mbuf export count.
+ */
+static inline int caio_freelist_view_is_private(PyObject *view) {
+    if (view == NULL)
+        return 1;
+    if (Py_REFCNT(view) != 1 || !PyMemoryView_Check(view))
+        return 0;
+
+    PyMemoryViewObject *mv = (PyMemoryViewObject *) view;
+    return mv->exports == 0 && (mv->mbuf == NULL || mv->mbuf->exports <= 1);
+}
+
+
+/*
+ * tp_alloc replacement for Operation constructors: reuses a dead object
+ * of exactly `type` when one is cached, zeroed past the object header
+ * and GC-tracked again - indistinguishable from PyType_GenericAlloc().
+ */
+static inline PyObject *caio_freelist_object_new(
+    caio_freelist_t *fl, PyTypeObject *type
+) {
+#if CAIO_FREELIST_RECYCLE_OBJECTS
+    PyObject *obj = NULL;
+    if (fl->object_count > 0) {
+        obj = fl->objects[--fl->object_count];
+        fl->hits++;
+    } else {
+        fl->misses++;
+    }
+
+    if (obj != NULL) {
+        memset(
+            (char *) obj + sizeof(PyObject), 0,
+            (size_t) type->tp_basicsize - sizeof(PyObject)
+        );
+        PyObject_Init(obj, type);
+        PyObject_GC_Track(obj);
+        return obj;
+    }
+#endif
+    return type->tp_alloc(type, 0);
+}
+
+
+/*
+ * Called at the very end of tp_dealloc, after untracking and clearing.
+ * Returns 1 if `obj` was cached (tp_free must then NOT be called), 0 if
+ * the caller should free it as usual.
+ */
+static inline int caio_freelist_object_put(
+    caio_freelist_t *fl, PyObject *obj
+) {
+#if CAIO_FREELIST_RECYCLE_OBJECTS
+    if (fl->object_count >= fl->max_objects)
+        return 0;
+
+    if (fl->objects == NULL) {
+        fl->objects = PyMem_New(PyObject *, fl->max_objects);
+        if (fl->objects == NULL)
+            return 0;
+    }
+
+    fl->objects[fl->object_count++] = obj;
+    return 1;
+#else
+    (void) fl;
+    (void) obj;
+    return 0;
+#endif
+}
+
+
+/* Frees cached buffers down to `max_bytes` and objects down to
+ * `max_objects`. Returns the number of buffer bytes released. */
+static inline size_t caio_freelist_shrink(
+    caio_freelist_t *fl, size_t max_bytes, size_t max_objects
+) {
+    size_t released = 0;
+    caio_freelist_node *victims = NULL;
+
+    CAIO_FREELIST_LOCK(fl);
+    /* Largest classes first - fewest frees for the most memory back */
+    for (int index = CAIO_FREELIST_CLASSES - 1;
+            index >= 0 && fl->cached_bytes > max_bytes; index--) {
+        size_t class_size = (size_t) 1 << (CAIO_FREELIST_MIN_SHIFT + index);
+        while (fl->buffers[index] != NULL && fl->cached_bytes > max_bytes) {
+            caio_freelist_node *node = fl->buffers[index];
+            fl->buffers[index] = node->next;
+            fl->buffer_counts[index]--;
+            fl->cached_bytes -= class_size;
+            released += class_size;
+
+            node->next = victims;
+            victims = node;
+        }
+    }
+    CAIO_FREELIST_UNLOCK(fl);
+
+    while (victims != NULL) {
+        caio_freelist_node *next = victims->next;
+        PyMem_Free(victims);
+        victims = next;
+    }
+
+    while (fl->object_count > max_objects) {
+        PyObject *obj = fl->objects[--fl->object_count];
+        Py_TYPE(obj)->tp_free(obj);
+    }
+
+    return released;
+}
+
+
+static inline PyObject *caio_freelist_info(caio_freelist_t *fl) {
+    PyObject *classes = PyDict_New();
+    if (classes == NULL)
+        return NULL;
+
+    size_t cached_bytes, counts[CAIO_FREELIST_CLASSES];
+    CAIO_FREELIST_LOCK(fl);
+    cached_bytes = fl->cached_bytes;
+    memcpy(counts, fl->buffer_counts, sizeof(counts));
+    CAIO_FREELIST_UNLOCK(fl);
+
+    for (int index = 0; index < CAIO_FREELIST_CLASSES; index++) {
+        PyObject *key = PyLong_FromSize_t(
+            (size_t) 1 << (CAIO_FREELIST_MIN_SHIFT + index)
+        );
+        PyObject *value = PyLong_FromSize_t(counts[index]);
+        int failed = (
+            key == NULL || value == NULL ||
+            PyDict_SetItem(classes, key, value) < 0
+        );
+        Py_XDECREF(key);
+        Py_XDECREF(value);
+        if (failed) {
+            Py_DECREF(classes);
+            return NULL;
+        }
+    }
+
+    return Py_BuildValue(
+        "{s:n,s:n,s:N,s:n,s:n,s:K,s:K}",
+        "cached_bytes", (Py_ssize_t) cached_bytes,
+        "max_bytes", (Py_ssize_t) fl->max_bytes,
+        "buffers", classes,
+        "objects", (Py_ssize_t) fl->object_count,
+        "max_objects", (Py_ssize_t) fl->max_objects,
+        "hits", (unsigned long long) fl->hits,
+        "misses", (unsigned long long) fl->misses
+    );
+}
+
+
+/*
+ * Shared bodies of each module's freelist_*() functions. Only the
+ * docstrings and the module-level caio_freelist_t instance differ.
+ */
+#define CAIO_FREELIST_INFO_DOC \
+    "Returns the read buffer / Operation free list state.\n\n" \
+    "    freelist_info() -> dict\n\n" \
+    "    cached_bytes/max_bytes: buffer memory held and its cap; buffers:\n" \
+    "    cached buffer count per size class; objects/max_objects: cached\n" \
+    "    Operation objects and their cap; hits/misses: allocations served\n" \
+    "    from / not from the cache."
+
+#define CAIO_FREELIST_TRIM_DOC \
+    "Frees every cached buffer and Operation object.\n\n" \
+    "    freelist_trim() -> int\n\n" \
+    "    Returns the number of buffer bytes released."
+
+#define CAIO_FREELIST_SET_LIMITS_DOC \
+    "Changes the free list caps, shrinking the cache to fit right away.\n\n" \
+    "    freelist_set_limits(max_bytes=None, max_objects=None) -> None\n\n" \
+    "    0 disables caching for that kind; None keeps the current cap."
+
+
+static inline PyObject *caio_freelist_set_limits(
+    caio_freelist_t *fl, PyObject *args, PyObject *kwds
+) {
+    static char *kwlist[] = {"max_bytes", "max_objects", NULL};
+
+    PyObject *max_bytes_obj = Py_None;
+    PyObject *max_objects_obj = Py_None;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "|OO", kwlist, &max_bytes_obj, &max_objects_obj))
+        return NULL;
+
+    size_t max_bytes = fl->max_bytes;
+    size_t max_objects = fl->max_objects;
+
+    if (max_bytes_obj != Py_None) {
+        max_bytes = PyLong_AsSize_t(max_bytes_obj);
+        if (max_bytes == (size_t) -1 && PyErr_Occurred())
+            return NULL;
+    }
+    if (max_objects_obj != Py_None) {
+        max_objects = PyLong_AsSize_t(max_objects_obj);
+        if (max_objects == (size_t) -1 && PyErr_Occurred())
+            return NULL;
+        if (max_objects > ((size_t) 1 << 20)) {
+            PyErr_SetString(
+                PyExc_ValueError, "max_objects must not exceed 1048576"
+            );
+            return NULL;
+        }
+    }
+
+    caio_freelist_shrink(fl, max_bytes, max_objects);
+
+    /* The object stack is sized to max_objects - reallocate it for the
+     * new cap (it already holds at most that many after the shrink). */
+    if (max_objects != fl->max_objects && fl->objects != NULL) {
+        PyObject **objects = NULL;
+        if (max_objects > 0) {
+            objects = PyMem_New(PyObject *, max_objects);
+            if (objects == NULL)
+                return PyErr_NoMemory();
+            memcpy(
+                objects, fl->objects, fl->object_count * sizeof(PyObject *)
+            );
+        }
+        PyMem_Free(fl->objects);
+        fl->objects = objects;
+    }
+
+    CAIO_FREELIST_LOCK(fl);
+    fl->max_bytes = max_bytes;
+    CAIO_FREELIST_UNLOCK(fl);
+    fl->max_objects = max_objects;
+
+    Py_RETURN_NONE;
+}
+
+#endif /* CAIO_FREELIST_H */
@@ -0,0 +1,67 @@
+/*
+ * Operation `priority` argument handling, shared by the C backends - the
+ * same rules as caio/ioprio.py.
+ *
+ * 0, the default, asks for nothing in particular: the kernel backends set
+ * no ioprio, so the request keeps the submitting thread's own - level
+ * CAIO_IOPRIO_NORM of the best-effort class unless changed - and
+ * thread_aio queues it at that same level. Any other value below
+ * 1 << CAIO_IOPRIO_CLASS_SHIFT is that level of the best-effort class, 1
+ * (most urgent) to 7 - larger levels count as 7. Anything above carries
+ * an I/O scheduling class too, as built by caio.ioprio.ioprio_value():
+ * IOPRIO_PRIO_VALUE(class, level) from <linux/ioprio.h>.
+ *
+ * linux_aio/linux_uring hand the kernel the resulting value, thread_aio
+ * maps it onto its worker queue levels instead.
+ */
+#ifndef CAIO_IOPRIO_H
+#define CAIO_IOPRIO_H
+
+#include <stdint.h>
+
+#define CAIO_IOPRIO_CLASS_SHIFT  13
+#define CAIO_IOPRIO_LEVELS       8
+/* The kernel's IOPRIO_NORM: the best-effort level of a nice 0 thread */
+#define CAIO_IOPRIO_NORM         4
+
+enum {
+    CAIO_IOPRIO_CLASS_NONE = 0,
+    CAIO_IOPRIO_CLASS_RT   = 1,
+    CAIO_IOPRIO_CLASS_BE   = 2,
+    CAIO_IOPRIO_CLASS_IDLE = 3,
+};
+
+static inline uint16_t caio_ioprio_clamp_level(uint16_t level) {
+    return level < CAIO_IOPRIO_LEVELS ? level : CAIO_IOPRIO_LEVELS - 1;
+}
+
+/* The kernel ioprio for a priority argument - 0 for "don't set one". */
+static inline uint16_t caio_ioprio_value(uint16_t priority) {
+    if ((priority >> CAIO_IOPRIO_CLASS_SHIFT) != CAIO_IOPRIO_CLASS_NONE)
+        return priority;
+    if (priority == 0)
+        return 0;
+    return (uint16_t) (
+        (CAIO_IOPRIO_CLASS_BE << CAIO_IOPRIO_CLASS_SHIFT) |
+        caio_ioprio_clamp_level(priority)
+    );
+}
+
+/* The worker queue level (0 runs first) for a priority argument:
+ * realtime ahead of everything, idle behind everything. */
+static inline int caio_ioprio_queue_level(uint16_t priority) {
+    uint16_t level = priority & ((1 << CAIO_IOPRIO_CLASS_SHIFT) - 1);
+
+    if (priority == 0) return CAIO_IOPRIO_NORM;
+
+    switch (priority >> CAIO_IOPRIO_CLASS_SHIFT) {
+        case CAIO_IOPRIO_CLASS_RT:
+            return 0;
+        case CAIO_IOPRIO_CLASS_IDLE:
+            return CAIO_IOPRIO_LEVELS - 1;
+        default:
+            return caio_ioprio_clamp_level(level);
+    }
+}
+
+#endif /* CAIO_IOPRIO_H */
@@ -0,0 +1,39 @@
+/*
+ * Operation `flags` argument handling, shared by the C backends: the
+ * kernel's per-request RWF_* flags from <linux/fs.h>, the values
+ * preadv2()/pwritev2() take and caio.rwflags names.
+ *
+ * linux_aio and linux_uring hand them to the kernel with the request
+ * (iocb.aio_rw_flags, sqe->rw_flags). thread_aio calls preadv2()/
+ * pwritev2() instead of pread()/pwrite() when any are set, so it only
+ * accepts them where those exist.
+ */
+#ifndef CAIO_RWFLAGS_H
+#define CAIO_RWFLAGS_H
+
+#define CAIO_RWF_HIPRI      0x01
+#define CAIO_RWF_DSYNC      0x02
+#define CAIO_RWF_SYNC       0x04
+#define CAIO_RWF_NOWAIT     0x08
+#define CAIO_RWF_APPEND     0x10
+
+#define CAIO_RWF_ALL ( \
+    CAIO_RWF_HIPRI | CAIO_RWF_DSYNC | CAIO_RWF_SYNC | \
+    CAIO_RWF_NOWAIT | CAIO_RWF_APPEND \
+)
+
+/* Whether `flags` has only bits out of `supported`. Sets ValueError
+ * when it doesn't. Needs Python.h included first. */
+static inline int caio_rwflags_check(int flags, int supported) {
+    if ((flags & ~supported) != 0) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "unsupported flags 0x%x, expected a combination of 0x%x",
+            flags, supported
+        );
+        return 0;
+    }
+    return 1;
+}
+
+#endif /* CAIO_RWFLAGS_H */
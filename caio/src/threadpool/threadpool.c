@@ -29,14 +29,36 @@
 /**
  * @file threadpool.c
  * @brief Threadpool implementation file
+ *
+ * The task queue is a bounded lock-free MPMC ring (Dmitry Vyukov's
+ * design): every cell carries a sequence number telling producers and
+ * consumers whether it's free for the lap they're on, so neither side
+ * takes a lock - just one CAS on enqueue_pos/dequeue_pos. Idle workers
+ * park on a futex (a condition variable where there's no futex) and are
+ * only woken when a producer sees that someone is actually parked.
+ *
+ * There is one such ring per priority level. Workers always take from
+ * the lowest-numbered non-empty one, so a task added at level 0 runs
+ * before anything already waiting at a higher level. Only level 0 is
+ * allocated up front - the others on first use.
  */
 
+#include <limits.h>
+#include <stdint.h>
 #include <stdlib.h>
 #include <pthread.h>
+#include <sched.h>
 #include <unistd.h>
 
+#ifdef __linux__
+#include <linux/futex.h>
+#include <sys/syscall.h>
+#endif
+
 #include "threadpool.h"
 
+#define THREADPOOL_CACHE_LINE 64
+
 typedef enum {
     immediate_shutdown = 1,
     graceful_shutdown  = 2
@@ -55,33 +77,71 @@ typedef struct {
     void *argument;
 } threadpool_task_t;
 
+/**
+ *  @struct threadpool_cell
+ *  @brief one slot of the ring
+ *
+ *  @var sequence Equal to the position a producer may write next, or to
+ *                that position + 1 once the task is ready for a consumer.
+ *  @var task     The task itself.
+ */
+typedef struct {
+    size_t sequence;
+    threadpool_task_t task;
+} threadpool_cell_t;
+
+/**
+ *  @struct threadpool_ring
+ *  @brief One priority level's task queue
+ *
+ *  @var cells        Array containing the task queue.
+ *  @var mask         Ring capacity (a power of two) minus one.
+ *  @var enqueue_pos  Next position producers claim.
+ *  @var dequeue_pos  Next position consumers claim.
+ */
+typedef struct {
+  threadpool_cell_t *cells;
+  size_t mask;
+  /* Producer and consumer positions live on their own cache lines -
+     otherwise every submit and every dequeue bounce the same line. */
+  char pad0[THREADPOOL_CACHE_LINE];
+  size_t enqueue_pos;
+  char pad1[THREADPOOL_CACHE_LINE - sizeof(size_t)];
+  size_t dequeue_pos;
+  char pad2[THREADPOOL_CACHE_LINE - sizeof(size_t)];
+} threadpool_ring_t;
+
 /**
  *  @struct threadpool
  *  @brief The threadpool struct
  *
- *  @var notify       Condition variable to notify worker threads.
  *  @var threads      Array containing worker threads ID.
  *  @var thread_count Number of threads
- *  @var queue        Array containing the task queue.
- *  @var queue_size   Size of the task queue.
- *  @var head         Index of the first element.
- *  @var tail         Index of the next element.
- *  @var count        Number of pending tasks
+ *  @var rings        One task queue per priority level, NULL until used.
+ *  @var capacity     Cells per ring.
+ *  @var queue_size   Maximum number of pending tasks, all levels together.
  *  @var shutdown     Flag indicating if the pool is shutting down
  *  @var started      Number of started threads
+ *  @var count        Pending tasks, reserved before they are enqueued.
+ *  @var idle         Number of workers parked (or about to park).
+ *  @var wake_seq     Futex word, bumped on every wakeup.
  */
 struct threadpool_t {
-  pthread_mutex_t lock;
-  pthread_cond_t notify;
   pthread_t *threads;
-  threadpool_task_t *queue;
+  threadpool_ring_t *rings[THREADPOOL_PRIORITIES];
+  size_t capacity;
   int thread_count;
   int queue_size;
-  int head;
-  int tail;
-  int count;
   int shutdown;
   int started;
+#ifndef __linux__
+  pthread_mutex_t lock;
+  pthread_cond_t notify;
+#endif
+  char pad0[THREADPOOL_CACHE_LINE];
+  int count;
+  int idle;
+  uint32_t wake_seq;
 };
 
 /**
@@ -93,9 +153,61 @@ static void *threadpool_thread(void *threadpool);
 
 int threadpool_free(threadpool_t *pool);
 
+static threadpool_ring_t *threadpool_ring_new(size_t capacity)
+{
+    threadpool_ring_t *ring;
+    size_t i;
+
+    if((ring = (threadpool_ring_t *)calloc(1, sizeof(threadpool_ring_t))) == NULL) {
+        return NULL;
+    }
+    if((ring->cells = (threadpool_cell_t *)malloc
+        (sizeof(threadpool_cell_t) * capacity)) == NULL) {
+        free(ring);
+        return NULL;
+    }
+
+    ring->mask = capacity - 1;
+    for(i = 0; i < capacity; i++) {
+        ring->cells[i].sequence = i;
+    }
+    return ring;
+}
+
+static void threadpool_ring_free(threadpool_ring_t *ring)
+{
+    if(ring) {
+        free(ring->cells);
+        free(ring);
+    }
+}
+
+/* Returns the ring for `level`, allocating it on first use. */
+static threadpool_ring_t *threadpool_ring(threadpool_t *pool, int level)
+{
+    threadpool_ring_t *ring = __atomic_load_n(&pool->rings[level],
+                                              __ATOMIC_ACQUIRE);
+    threadpool_ring_t *expected = NULL;
+
+    if(ring != NULL) {
+        return ring;
+    }
+    if((ring = threadpool_ring_new(pool->capacity)) == NULL) {
+        return NULL;
+    }
+    if(!__atomic_compare_exchange_n(&pool->rings[level], &expected, ring,
+                                    0, __ATOMIC_ACQ_REL, __ATOMIC_ACQUIRE)) {
+        /* Another producer got there first */
+        threadpool_ring_free(ring);
+        ring = expected;
+    }
+    return ring;
+}
+
 threadpool_t *threadpool_create(int thread_count, int queue_size, int flags)
 {
     threadpool_t *pool;
+    size_t capacity = 2;
     int i;
     (void) flags;
 
@@ -103,26 +215,36 @@ threadpool_t *threadpool_create(int thread_count, int queue_size, int flags)
         return NULL;
     }
 
-    if((pool = (threadpool_t *)malloc(sizeof(threadpool_t))) == NULL) {
+    if((pool = (threadpool_t *)calloc(1, sizeof(threadpool_t))) == NULL) {
         goto err;
     }
 
+    /* The ring needs a power-of-two capacity (and at least two cells, or
+       a cell's "free" and "ready" sequence values would collide); the
+       exact queue_size limit is enforced through `count` instead. */
+    while(capacity < (size_t) queue_size) {
+        capacity <<= 1;
+    }
+
     /* Initialize */
     pool->thread_count = 0;
     pool->queue_size = queue_size;
-    pool->head = pool->tail = pool->count = 0;
+    pool->capacity = capacity;
     pool->shutdown = pool->started = 0;
 
-    /* Allocate thread and task queue */
+#ifndef __linux__
+    if((pthread_mutex_init(&(pool->lock), NULL) != 0) ||
+       (pthread_cond_init(&(pool->notify), NULL) != 0)) {
+        free(pool);
+        return NULL;
+    }
+#endif
+
+    /* Allocate thread and default priority task queue */
     pool->threads = (pthread_t *)malloc(sizeof(pthread_t) * thread_count);
-    pool->queue = (threadpool_task_t *)malloc
-        (sizeof(threadpool_task_t) * queue_size);
+    pool->rings[0] = threadpool_ring_new(capacity);
 
-    /* Initialize mutex and conditional variable first */
-    if((pthread_mutex_init(&(pool->lock), NULL) != 0) ||
-       (pthread_cond_init(&(pool->notify), NULL) != 0) ||
-       (pool->threads == NULL) ||
-       (pool->queue == NULL)) {
+    if((pool->threads == NULL) || (pool->rings[0] == NULL)) {
         goto err;
     }
 
@@ -134,7 +256,7 @@ threadpool_t *threadpool_create(int thread_count, int queue_size, int flags)
             return NULL;
         }
         pool->thread_count++;
-        pool->started++;
+        __atomic_fetch_add(&pool->started, 1, __ATOMIC_RELAXED);
     }
 
     return pool;
@@ -146,92 +268,235 @@ threadpool_t *threadpool_create(int thread_count, int queue_size, int flags)
     return NULL;
 }
 
-int threadpool_add(threadpool_t *pool, void (*function)(void *),
-                   void *argument, int flags)
+/* Clamps a task priority to a ring index. */
+static inline int threadpool_level(int priority)
 {
-    int err = 0;
-    int next;
-    (void) flags;
-
-    if(pool == NULL || function == NULL) {
-        return threadpool_invalid;
+    if(priority < 0) {
+        return 0;
     }
+    return priority < THREADPOOL_PRIORITIES ?
+        priority : THREADPOOL_PRIORITIES - 1;
+}
+
+/* Claims up to n of the queue_size slots. Returns how many. */
+static int threadpool_reserve(threadpool_t *pool, int n)
+{
+    int count = __atomic_load_n(&pool->count, __ATOMIC_RELAXED);
+    int take;
 
-    if(pthread_mutex_lock(&(pool->lock)) != 0) {
-        return threadpool_lock_failure;
+    do {
+        if(count >= pool->queue_size) {
+            return 0;
+        }
+        take = pool->queue_size - count;
+        if(n < take) {
+            take = n;
+        }
+    } while(!__atomic_compare_exchange_n(&pool->count, &count, count + take,
+                                         1, __ATOMIC_RELAXED,
+                                         __ATOMIC_RELAXED));
+    return take;
+}
+
+/* Pushes one task into a slot already claimed by threadpool_reserve(). */
+static void threadpool_push(threadpool_ring_t *ring, void (*function)(void *),
+                            void *argument)
+{
+    threadpool_cell_t *cell;
+    size_t pos = __atomic_load_n(&ring->enqueue_pos, __ATOMIC_RELAXED);
+    size_t seq;
+    intptr_t dif;
+
+    for(;;) {
+        cell = &ring->cells[pos & ring->mask];
+        seq = __atomic_load_n(&cell->sequence, __ATOMIC_ACQUIRE);
+        dif = (intptr_t) seq - (intptr_t) pos;
+
+        if(dif == 0) {
+            if(__atomic_compare_exchange_n(&ring->enqueue_pos, &pos, pos + 1,
+                                           1, __ATOMIC_RELAXED,
+                                           __ATOMIC_RELAXED)) {
+                break;
+            }
+        } else {
+            /* dif < 0: the reservation guarantees room, so this cell is
+               only still being vacated by a consumer that has claimed it
+               but not yet released it - a short wait, not a full queue. */
+            if(dif < 0) {
+                sched_yield();
+            }
+            pos = __atomic_load_n(&ring->enqueue_pos, __ATOMIC_RELAXED);
+        }
     }
 
-    next = (pool->tail + 1) % pool->queue_size;
+    cell->task.function = function;
+    cell->task.argument = argument;
+    __atomic_store_n(&cell->sequence, pos + 1, __ATOMIC_RELEASE);
+}
 
-    do {
-        /* Are we full ? */
-        if(pool->count == pool->queue_size) {
-            err = threadpool_queue_full;
-            break;
+/* Takes the oldest ready task of one level. Returns 0 when there is none. */
+static int threadpool_ring_pop(threadpool_ring_t *ring, threadpool_task_t *task)
+{
+    threadpool_cell_t *cell;
+    size_t pos = __atomic_load_n(&ring->dequeue_pos, __ATOMIC_RELAXED);
+    size_t seq;
+    intptr_t dif;
+
+    for(;;) {
+        cell = &ring->cells[pos & ring->mask];
+        seq = __atomic_load_n(&cell->sequence, __ATOMIC_ACQUIRE);
+        dif = (intptr_t) seq - (intptr_t) (pos + 1);
+
+        if(dif == 0) {
+            if(__atomic_compare_exchange_n(&ring->dequeue_pos, &pos, pos + 1,
+                                           1, __ATOMIC_RELAXED,
+                                           __ATOMIC_RELAXED)) {
+                break;
+            }
+        } else if(dif < 0) {
+            return 0;
+        } else {
+            pos = __atomic_load_n(&ring->dequeue_pos, __ATOMIC_RELAXED);
         }
+    }
 
-        /* Are we shutting down ? */
-        if(pool->shutdown) {
-            err = threadpool_shutdown;
-            break;
+    *task = cell->task;
+    __atomic_store_n(&cell->sequence, pos + ring->mask + 1, __ATOMIC_RELEASE);
+    return 1;
+}
+
+/* Takes the oldest ready task of the most urgent non-empty level. */
+static int threadpool_pop(threadpool_t *pool, threadpool_task_t *task)
+{
+    threadpool_ring_t *ring;
+    int level;
+
+    for(level = 0; level < THREADPOOL_PRIORITIES; level++) {
+        ring = __atomic_load_n(&pool->rings[level], __ATOMIC_ACQUIRE);
+        if(ring != NULL && threadpool_ring_pop(ring, task)) {
+            __atomic_fetch_sub(&pool->count, 1, __ATOMIC_RELAXED);
+            return 1;
         }
+    }
+    return 0;
+}
 
-        /* Add task to queue */
-        pool->queue[pool->tail].function = function;
-        pool->queue[pool->tail].argument = argument;
-        pool->tail = next;
-        pool->count += 1;
+/* Wakes up to n parked workers. `force` skips the idle check (shutdown). */
+static void threadpool_wake(threadpool_t *pool, int n, int force)
+{
+    /* Pairs with the fence in threadpool_thread(): either this sees the
+       worker's idle increment, or the worker's retry sees our task. */
+    __atomic_thread_fence(__ATOMIC_SEQ_CST);
+    if(!force && __atomic_load_n(&pool->idle, __ATOMIC_RELAXED) == 0) {
+        return;
+    }
 
-        /* pthread_cond_broadcast */
-        if(pthread_cond_signal(&(pool->notify)) != 0) {
-            err = threadpool_lock_failure;
-            break;
+    __atomic_fetch_add(&pool->wake_seq, 1, __ATOMIC_SEQ_CST);
+#ifdef __linux__
+    syscall(SYS_futex, &pool->wake_seq, FUTEX_WAKE_PRIVATE, n, NULL, NULL, 0);
+#else
+    pthread_mutex_lock(&(pool->lock));
+    if(n == 1) {
+        pthread_cond_signal(&(pool->notify));
+    } else {
+        pthread_cond_broadcast(&(pool->notify));
+    }
+    pthread_mutex_unlock(&(pool->lock));
+#endif
+}
+
+/* Sleeps until wake_seq moves past `seq` (or spuriously). */
+static void threadpool_park(threadpool_t *pool, uint32_t seq)
+{
+#ifdef __linux__
+    syscall(SYS_futex, &pool->wake_seq, FUTEX_WAIT_PRIVATE, seq, NULL, NULL, 0);
+#else
+    pthread_mutex_lock(&(pool->lock));
+    while(__atomic_load_n(&pool->wake_seq, __ATOMIC_ACQUIRE) == seq) {
+        pthread_cond_wait(&(pool->notify), &(pool->lock));
+    }
+    pthread_mutex_unlock(&(pool->lock));
+#endif
+}
+
+int threadpool_add(threadpool_t *pool, void (*function)(void *),
+                   void *argument, int flags)
+{
+    int added = threadpool_add_batch(pool, function, &argument, NULL, 1,
+                                     flags);
+
+    if(added < 0) {
+        return added;
+    }
+    return added == 1 ? 0 : threadpool_queue_full;
+}
+
+int threadpool_add_batch(threadpool_t *pool, void (*function)(void *),
+                         void **arguments, const int *priorities,
+                         int count, int flags)
+{
+    threadpool_ring_t *ring;
+    int i, level, added;
+    (void) flags;
+
+    if(pool == NULL || function == NULL || count < 0) {
+        return threadpool_invalid;
+    }
+
+    if(__atomic_load_n(&pool->shutdown, __ATOMIC_ACQUIRE)) {
+        return threadpool_shutdown;
+    }
+
+    /* Allocate any level used for the first time before reserving, so
+       nothing reserved can fail to be pushed. */
+    if(priorities != NULL) {
+        for(i = 0; i < count; i++) {
+            level = threadpool_level(priorities[i]);
+            if(threadpool_ring(pool, level) == NULL) {
+                return threadpool_memory_failure;
+            }
         }
-    } while(0);
+    }
 
-    if(pthread_mutex_unlock(&pool->lock) != 0) {
-        err = threadpool_lock_failure;
+    added = threadpool_reserve(pool, count);
+    for(i = 0; i < added; i++) {
+        level = priorities ? threadpool_level(priorities[i]) : 0;
+        ring = __atomic_load_n(&pool->rings[level], __ATOMIC_ACQUIRE);
+        threadpool_push(ring, function, arguments[i]);
     }
 
-    return err;
+    if(added > 0) {
+        threadpool_wake(pool, added, 0);
+    }
+    return added;
 }
 
 int threadpool_destroy(threadpool_t *pool, int flags)
 {
     int i, err = 0;
+    int expected = 0;
 
     if(pool == NULL) {
         return threadpool_invalid;
     }
 
-    if(pthread_mutex_lock(&(pool->lock)) != 0) {
-        return threadpool_lock_failure;
+    /* Already shutting down */
+    if(!__atomic_compare_exchange_n(&pool->shutdown, &expected,
+                                    (flags & threadpool_graceful) ?
+                                    graceful_shutdown : immediate_shutdown,
+                                    0, __ATOMIC_RELEASE, __ATOMIC_RELAXED)) {
+        return threadpool_shutdown;
     }
 
-    do {
-        /* Already shutting down */
-        if(pool->shutdown) {
-            err = threadpool_shutdown;
-            break;
-        }
-
-        pool->shutdown = (flags & threadpool_graceful) ?
-            graceful_shutdown : immediate_shutdown;
+    /* Wake up all worker threads */
+    threadpool_wake(pool, INT_MAX, 1);
 
-        /* Wake up all worker threads */
-        if((pthread_cond_broadcast(&(pool->notify)) != 0) ||
-           (pthread_mutex_unlock(&(pool->lock)) != 0)) {
-            err = threadpool_lock_failure;
-            break;
-        }
-
-        /* Join all worker thread */
-        for(i = 0; i < pool->thread_count; i++) {
-            if(pthread_join(pool->threads[i], NULL) != 0) {
-                err = threadpool_thread_failure;
-            }
+    /* Join all worker thread */
+    for(i = 0; i < pool->thread_count; i++) {
+        if(pthread_join(pool->threads[i], NULL) != 0) {
+            err = threadpool_thread_failure;
         }
-    } while(0);
+    }
 
     /* Only if everything went well do we deallocate the pool */
     if(!err) {
@@ -242,22 +507,20 @@ int threadpool_destroy(threadpool_t *pool, int flags)
 
 int threadpool_free(threadpool_t *pool)
 {
-    if(pool == NULL || pool->started > 0) {
+    int level;
+
+    if(pool == NULL || __atomic_load_n(&pool->started, __ATOMIC_ACQUIRE) > 0) {
         return -1;
     }
 
-    /* Did we manage to allocate ? */
-    if(pool->threads) {
-        free(pool->threads);
-        free(pool->queue);
-
-        /* Because we allocate pool->threads after initializing the
-           mutex and condition variable, we're sure they're
-           initialized. Let's lock the mutex just in case. */
-        pthread_mutex_lock(&(pool->lock));
-        pthread_mutex_destroy(&(pool->lock));
-        pthread_cond_destroy(&(pool->notify));
+    free(pool->threads);
+    for(level = 0; level < THREADPOOL_PRIORITIES; level++) {
+        threadpool_ring_free(pool->rings[level]);
     }
+#ifndef __linux__
+    pthread_mutex_destroy(&(pool->lock));
+    pthread_cond_destroy(&(pool->notify));
+#endif
     free(pool);
     return 0;
 }
@@ -267,39 +530,47 @@ static void *threadpool_thread(void *threadpool)
 {
     threadpool_t *pool = (threadpool_t *)threadpool;
     threadpool_task_t task;
+    uint32_t seq;
+    int shutdown;
 
     for(;;) {
-        /* Lock must be taken to wait on conditional variable */
-        pthread_mutex_lock(&(pool->lock));
+        shutdown = __atomic_load_n(&pool->shutdown, __ATOMIC_ACQUIRE);
+        if(shutdown == immediate_shutdown) {
+            break;
+        }
 
-        /* Wait on condition variable, check for spurious wakeups.
-           When returning from pthread_cond_wait(), we own the lock. */
-        while((pool->count == 0) && (!pool->shutdown)) {
-            pthread_cond_wait(&(pool->notify), &(pool->lock));
+        if(threadpool_pop(pool, &task)) {
+            /* Get to work */
+            (*(task.function))(task.argument);
+            continue;
         }
 
-        if((pool->shutdown == immediate_shutdown) ||
-           ((pool->shutdown == graceful_shutdown) &&
-            (pool->count == 0))) {
+        /* Graceful shutdown ends once the queue is drained - no producer
+           may still be adding by then (see threadpool_destroy()). */
+        if(shutdown == graceful_shutdown) {
             break;
         }
 
-        /* Grab our task */
-        task.function = pool->queue[pool->head].function;
-        task.argument = pool->queue[pool->head].argument;
-        pool->head = (pool->head + 1) % pool->queue_size;
-        pool->count -= 1;
+        /* Announce ourselves as idle, then look once more: a producer
+           that enqueued before seeing `idle` won't wake anyone. */
+        seq = __atomic_load_n(&pool->wake_seq, __ATOMIC_ACQUIRE);
+        __atomic_fetch_add(&pool->idle, 1, __ATOMIC_SEQ_CST);
+        __atomic_thread_fence(__ATOMIC_SEQ_CST);
 
-        /* Unlock */
-        pthread_mutex_unlock(&(pool->lock));
+        if(threadpool_pop(pool, &task)) {
+            __atomic_fetch_sub(&pool->idle, 1, __ATOMIC_RELAXED);
+            (*(task.function))(task.argument);
+            continue;
+        }
 
-        /* Get to work */
-        (*(task.function))(task.argument);
+        if(!__atomic_load_n(&pool->shutdown, __ATOMIC_ACQUIRE)) {
+            threadpool_park(pool, seq);
+        }
+        __atomic_fetch_sub(&pool->idle, 1, __ATOMIC_RELAXED);
     }
 
-    pool->started--;
+    __atomic_fetch_sub(&pool->started, 1, __ATOMIC_RELEASE);
 
-    pthread_mutex_unlock(&(pool->lock));
     pthread_exit(NULL);
     return(NULL);
 }
@@ -43,7 +43,12 @@ extern "C" {
  * Large values might slow down your system
  */
 #define MAX_THREADS 128
-#define MAX_QUEUE 65536
+#define MAX_QUEUE (1 << 20)
+
+/**
+ * Number of priority levels, 0 (runs first) to THREADPOOL_PRIORITIES - 1
+ */
+#define THREADPOOL_PRIORITIES 8
 
 typedef struct threadpool_t threadpool_t;
 
@@ -52,7 +57,8 @@ typedef enum {
     threadpool_lock_failure   = -2,
     threadpool_queue_full     = -3,
     threadpool_shutdown       = -4,
-    threadpool_thread_failure = -5
+    threadpool_thread_failure = -5,
+    threadpool_memory_failure = -6
 } threadpool_error_t;
 
 typedef enum {
@@ -71,7 +77,7 @@ threadpool_t *threadpool_create(int thread_count, int queue_size, int flags);
 
 /**
  * @function threadpool_add
- * @brief add a new task in the queue of a thread pool
+ * @brief add a new task in the queue of a thread pool, at priority 0
  * @param pool     Thread pool to which add the task.
  * @param function Pointer to the function that will perform the task.
  * @param argument Argument to be passed to the function.
@@ -82,6 +88,24 @@ threadpool_t *threadpool_create(int thread_count, int queue_size, int flags);
 int threadpool_add(threadpool_t *pool, void (*routine)(void *),
                    void *arg, int flags);
 
+/**
+ * @function threadpool_add_batch
+ * @brief add several tasks sharing one function, with a single wakeup
+ * @param pool       Thread pool to which add the tasks.
+ * @param function   Pointer to the function that will perform the tasks.
+ * @param arguments  Array of `count` arguments, one task each.
+ * @param priorities Array of `count` priority levels, or NULL for all 0.
+ *                   Out of range values are clamped.
+ * @param count      Number of tasks.
+ * @param flags     Unused parameter.
+ * @return the number of tasks added - the first that many of
+ * `arguments`, fewer than `count` only when the queue is full - or
+ * negative values in case of error (@see threadpool_error_t for codes).
+ */
+int threadpool_add_batch(threadpool_t *pool, void (*function)(void *),
+                         void **arguments, const int *priorities,
+                         int count, int flags);
+
 /**
  * @function threadpool_destroy
  * @brief Stops and destroys a thread pool.
@@ -90,7 +114,8 @@ int threadpool_add(threadpool_t *pool, void (*routine)(void *),
  *
  * Known values for flags are 0 (default) and threadpool_graceful in
  * which case the thread pool doesn't accept any new tasks but
- * processes all pending tasks before shutdown.
+ * processes all pending tasks before shutdown. Must not race with
+ * threadpool_add()/threadpool_add_batch() on the same pool.
  */
 int threadpool_destroy(threadpool_t *pool, int flags);
 
@@ -1,6 +1,18 @@
+/* preadv2()/pwritev2() and the RWF_* flags, from glibc's <sys/uio.h> */
+#define _GNU_SOURCE 1
+
+#include <errno.h>
+#include <fcntl.h>
+#include <poll.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <time.h>
 #include <unistd.h>
+#include <sys/stat.h>
+#include <sys/uio.h>
+#ifdef __linux__
+#include <sys/eventfd.h>
+#endif
 
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
@@ -34,26 +46,64 @@
 #endif
 
 #include "src/threadpool/threadpool.h"
+#include "src/freelist/freelist.h"
+#include "src/ioprio/ioprio.h"
+#include "src/rwflags/rwflags.h"
+
+#if defined(__linux__) && defined(RWF_NOWAIT)
+#define THAIO_RWF_SUPPORTED CAIO_RWF_ALL
+#else
+#define THAIO_RWF_SUPPORTED 0
+#endif
 
 
 static const unsigned CTX_POOL_SIZE_DEFAULT = 8;
 static const unsigned CTX_MAX_REQUESTS_DEFAULT = 512;
 
+/* UIO_MAXIOV - preadv()/pwritev() fail with EINVAL beyond this */
+#ifndef IOV_MAX
+#define IOV_MAX 1024
+#endif
+
 
 static PyTypeObject AIOOperationType;
 static PyTypeObject AIOContextType;
 
+/* Recycled Operation objects and READ/READV buffers, see freelist.h */
+static caio_freelist_t freelist = CAIO_FREELIST_INIT;
+
+/* set_zero_fill(): zero read buffers up front instead of only the part
+ * the read didn't fill, once it completes */
+static int zero_fill = 0;
+
+static const unsigned EV_MAX_REQUESTS_DEFAULT = 512;
+
+struct AIOOperation;
+
 typedef struct {
     PyObject_HEAD
     threadpool_t* pool;
-    uint16_t max_requests;
+    unsigned max_requests;
     uint8_t pool_size;
+    /* completion_queue=True: workers push finished Operations onto
+     * `completed` (lock-free, no GIL) and signal `fileno`, and
+     * process_events() runs their Python-side completion instead. */
+    uint8_t completion_queue;
+    /* inline_reads=True: submit() first tries each READ/READINTO with
+     * RWF_NOWAIT on the calling thread - see AIOOperation_try_inline(). */
+    uint8_t inline_reads;
+    struct AIOOperation* completed;     /* MPSC stack, newest first */
+    struct AIOOperation* reaped;        /* taken off it, oldest first */
+    int fileno;                         /* read end, -1 when disabled */
+    int signal_fd;                      /* write end - fileno for eventfd */
     PyObject* weakreflist;
 } AIOContext;
 
 
-typedef struct {
+typedef struct AIOOperation {
     PyObject_HEAD
+    struct AIOOperation* next;          /* AIOContext completion queue */
+    struct AIOOperation* chain_next;    /* submit_chain(): runs after this */
     PyObject* py_buffer;
     PyObject* callback;
     int opcode;
@@ -62,6 +112,7 @@ typedef struct {
     int result;
     uint8_t error;
     uint8_t in_progress;
+    uint16_t priority;  /* as passed - see src/ioprio/ioprio.h */
     uint8_t done;   /* genuine completion reached - set via a release
                      * store by worker() before it ever touches the GIL,
                      * and read via an acquire load from payload/
@@ -73,6 +124,18 @@ typedef struct {
                      * guards resubmission instead. */
     Py_ssize_t buf_size;
     char* buf;
+    size_t buf_capacity;    /* READ/READV: buf's real size, for the free
+                             * list - buf_size becomes the result */
+    uint8_t dirty;          /* buf allocated uninitialized and not yet
+                             * settled (AIOOperation_settle_buffer) */
+    uint8_t aligned;        /* READ: buf from caio_aligned_buffer_get(),
+                             * freed with free() instead */
+    int rw_flags;           /* READ/WRITE: RWF_* for preadv2()/pwritev2() */
+    struct iovec* iov;      /* READV/WRITEV: iovcnt entries */
+    Py_buffer* views;       /* WRITEV: one held export per iovec */
+    int iovcnt;
+    Py_buffer target;       /* READINTO: caller's buffer buf points into,
+                             * held until completion */
     PyObject* ctx;
     PyObject* weakreflist;
 } AIOOperation;
@@ -83,10 +146,29 @@ enum THAIO_OP_CODE {
     THAIO_WRITE,
     THAIO_FSYNC,
     THAIO_FDSYNC,
+    THAIO_READV,
+    THAIO_WRITEV,
+    THAIO_READINTO,
     THAIO_NOOP,
 };
 
 
+/* Releases readv()/writev()'s iovec array and, for writev(), the buffer
+ * exports it points into. GIL required. */
+static void
+AIOOperation_release_iov(AIOOperation *self) {
+    if (self->views != NULL) {
+        for (int i = 0; i < self->iovcnt; i++)
+            PyBuffer_Release(&self->views[i]);
+        PyMem_Free(self->views);
+        self->views = NULL;
+    }
+    PyMem_Free(self->iov);
+    self->iov = NULL;
+    self->iovcnt = 0;
+}
+
+
 static PyObject *AIOOperation_callback_ref(AIOOperation *self) {
     PyObject *callback;
     CAIO_BEGIN_CRITICAL_SECTION(self);
@@ -96,6 +178,22 @@ static PyObject *AIOOperation_callback_ref(AIOOperation *self) {
 }
 
 
+/* Zeroes the part of an uninitialized read buffer past the first `filled`
+ * bytes (a short read's tail, or all of it on error / before submission),
+ * so payload never exposes stale heap or recycled buffer contents. Must
+ * run while buf_size is still the allocated size. Needs no GIL - only
+ * ever called by whoever owns the Operation at that point. */
+static void
+AIOOperation_settle_buffer(AIOOperation *self, Py_ssize_t filled) {
+    if (!self->dirty) return;
+    self->dirty = 0;
+
+    if (filled < 0) filled = 0;
+    if (filled < self->buf_size)
+        memset(self->buf + filled, 0, (size_t) (self->buf_size - filled));
+}
+
+
 /*
  * Stops the thread pool - shared by close() and dealloc().
  *
@@ -132,6 +230,12 @@ AIOContext_dealloc(AIOContext *self) {
 
     AIOContext_close_pool(self);
 
+    if (self->signal_fd >= 0 && self->signal_fd != self->fileno)
+        close(self->signal_fd);
+    if (self->fileno >= 0)
+        close(self->fileno);
+    self->fileno = self->signal_fd = -1;
+
     Py_TYPE(self)->tp_free((PyObject *) self);
 }
 
@@ -143,20 +247,83 @@ AIOContext_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
     AIOContext *self;
 
     self = (AIOContext *) type->tp_alloc(type, 0);
+    if (self != NULL) self->fileno = self->signal_fd = -1;
     return (PyObject *) self;
 }
 
+
+/* The fd process_events()/an event loop waits on: an eventfd where there
+ * is one, a non-blocking pipe elsewhere. */
+static int AIOContext_open_signal(AIOContext *self) {
+#ifdef __linux__
+    self->fileno = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (self->fileno < 0) return -1;
+    self->signal_fd = self->fileno;
+#else
+    int fds[2];
+    if (pipe(fds) < 0) return -1;
+    for (int i = 0; i < 2; i++) {
+        fcntl(fds[i], F_SETFL, fcntl(fds[i], F_GETFL) | O_NONBLOCK);
+        fcntl(fds[i], F_SETFD, FD_CLOEXEC);
+    }
+    self->fileno = fds[0];
+    self->signal_fd = fds[1];
+#endif
+    return 0;
+}
+
+
+/* Worker side, no GIL. A full pipe / saturated eventfd counter is already
+ * a pending wakeup, so a failed write loses nothing. */
+static void AIOContext_signal(AIOContext *self) {
+    ssize_t written;
+#ifdef __linux__
+    uint64_t one = 1;
+    written = write(self->signal_fd, &one, sizeof(one));
+#else
+    char one = 1;
+    written = write(self->signal_fd, &one, sizeof(one));
+#endif
+    (void) written;
+}
+
+
+/* Resets the wakeup fd. Returns the number of signals consumed, 0 if
+ * there were none. */
+static uint64_t AIOContext_consume_signal(AIOContext *self) {
+#ifdef __linux__
+    uint64_t value = 0;
+    if (read(self->fileno, &value, sizeof(value)) != sizeof(value))
+        return 0;
+    return value;
+#else
+    char chunk[256];
+    uint64_t total = 0;
+    ssize_t size;
+    while ((size = read(self->fileno, chunk, sizeof(chunk))) > 0)
+        total += (uint64_t) size;
+    return total;
+#endif
+}
+
 static int
 AIOContext_init(AIOContext *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"max_requests", "pool_size", NULL};
+    static char *kwlist[] = {
+        "max_requests", "pool_size", "completion_queue", "inline_reads",
+        NULL
+    };
 
     self->pool = NULL;
     self->max_requests = 0;
 
+    int completion_queue = 0;
+    int inline_reads = 0;
+
     if (!PyArg_ParseTupleAndKeywords(
-            args, kwds, "|HH", kwlist,
-            &self->max_requests, &self->pool_size
+            args, kwds, "|IHpp", kwlist,
+            &self->max_requests, &self->pool_size, &completion_queue,
+            &inline_reads
     )) return -1;
 
     if (self->max_requests <= 0) {
@@ -185,12 +352,21 @@ AIOContext_init(AIOContext *self, PyObject *args, PyObject *kwds)
         return -1;
     }
 
+    if (completion_queue && self->fileno < 0) {
+        if (AIOContext_open_signal(self) < 0) {
+            PyErr_SetFromErrno(PyExc_SystemError);
+            return -1;
+        }
+    }
+    self->completion_queue = (uint8_t) completion_queue;
+    self->inline_reads = (uint8_t) inline_reads;
+
     self->pool = threadpool_create(self->pool_size, self->max_requests, 0);
 
     if (self->pool == NULL) {
         PyErr_Format(
             PyExc_RuntimeError,
-            "Pool initialization failed size=%d max_requests=%d",
+            "Pool initialization failed size=%d max_requests=%u",
             self->pool_size, self->max_requests
         );
         return -1;
@@ -205,91 +381,235 @@ static PyObject* AIOContext_repr(AIOContext *self) {
         return NULL;
     }
     return PyUnicode_FromFormat(
-        "<%s as %p: max_requests=%i, pool_size=%i, ctx=%lli>",
+        "<%s as %p: max_requests=%u, pool_size=%i, ctx=%lli>",
         Py_TYPE(self)->tp_name, self, self->max_requests,
         self->pool_size, self->pool
     );
 }
 
 
-void worker(void *arg) {
-    PyGILState_STATE state;
-
-    AIOOperation* op = arg;
-    PyObject* ctx = op->ctx;
-    op->ctx = NULL;
-    op->error = 0;
-
+/* Python-side half of a completion - GIL required. Consumes the
+ * submit()-time references to both the Operation and its Context. */
+static void AIOOperation_finish(AIOOperation *op, PyObject *ctx) {
     if (op->opcode == THAIO_NOOP) {
-        state = PyGILState_Ensure();
-        op->ctx = NULL;
         Py_DECREF(ctx);
         Py_DECREF(op);
-        PyGILState_Release(state);
         return;
     }
 
+    if (op->opcode == THAIO_WRITE) {
+        Py_CLEAR(op->py_buffer);
+    }
+    if (op->opcode == THAIO_WRITEV) {
+        AIOOperation_release_iov(op);
+        Py_CLEAR(op->py_buffer);
+    }
+    if (op->target.obj != NULL) {
+        PyBuffer_Release(&op->target);
+    }
+
+    /* Publish completion only after every result field and Python-owned
+     * buffer transition is complete. payload/get_value() acquire-load done,
+     * so a reader that observes true must also observe all writes above. */
+    CAIO_ATOMIC_STORE(op->done, 1);
+
+    PyObject *callback = AIOOperation_callback_ref(op);
+    if (callback != NULL) {
+        PyObject *rv = PyObject_CallFunction(callback, "i", op->result);
+        if (rv == NULL) {
+            PyErr_WriteUnraisable(callback);
+        } else {
+            Py_DECREF(rv);
+        }
+        Py_DECREF(callback);
+    }
+
+    Py_DECREF(ctx);
+    Py_DECREF(op);
+}
+
+
+/* Worker side, no GIL: a lock-free push onto the Context's completion
+ * stack. Only the push that finds it empty signals - the consumer swaps
+ * the whole stack out at once, so any later push before that swap is
+ * covered by the same wakeup. */
+static void AIOContext_enqueue(AIOContext *self, AIOOperation *op) {
+    AIOOperation* head = __atomic_load_n(&self->completed, __ATOMIC_RELAXED);
+    do {
+        op->next = head;
+    } while (!__atomic_compare_exchange_n(
+        &self->completed, &head, op, 1, __ATOMIC_RELEASE, __ATOMIC_RELAXED
+    ));
+
+    if (head == NULL) AIOContext_signal(self);
+}
+
+
+/* pread()/pwrite(), or preadv2()/pwritev2() when RWF_* flags are set -
+ * flags are only ever nonzero where those exist (THAIO_RWF_SUPPORTED). */
+static ssize_t thaio_pread(
+    int fd, void *buf, size_t size, off_t offset, int flags
+) {
+#if THAIO_RWF_SUPPORTED
+    if (flags) {
+        struct iovec iov = {buf, size};
+        return preadv2(fd, &iov, 1, offset, flags);
+    }
+#endif
+    return pread(fd, buf, size, offset);
+}
+
+
+static ssize_t thaio_pwrite(
+    int fd, const void *buf, size_t size, off_t offset, int flags
+) {
+#if THAIO_RWF_SUPPORTED
+    if (flags) {
+        struct iovec iov = {(void *) buf, size};
+        return pwritev2(fd, &iov, 1, offset, flags);
+    }
+#endif
+    return pwrite(fd, buf, size, offset);
+}
+
+
+/* Runs one Operation's syscall - or, for the rest of a chain cut short,
+ * fails it with ECANCELED instead. Returns whether it transferred
+ * everything it asked for, i.e. whether a chain may go on. */
+static int AIOOperation_execute(AIOOperation* op, int cancelled) {
+    op->error = 0;
+
+    if (op->opcode == THAIO_NOOP) return 1;
+
     int fileno = op->fileno;
     off_t offset = op->offset;
     int buf_size = op->buf_size;
     char* buf = op->buf;
+    ssize_t expected = buf_size;
 
-    int result;
+    int result = -1;
 
-    switch (op->opcode) {
-        case THAIO_WRITE:
-            result = pwrite(fileno, (const char*) buf, buf_size, offset);
-            break;
-        case THAIO_FSYNC:
-            result = fsync(fileno);
-            break;
-        case THAIO_FDSYNC:
+    if (op->opcode == THAIO_READV || op->opcode == THAIO_WRITEV) {
+        expected = 0;
+        for (int i = 0; i < op->iovcnt; i++) expected += op->iov[i].iov_len;
+    }
+
+    if (cancelled) {
+        errno = ECANCELED;
+    } else {
+        switch (op->opcode) {
+            case THAIO_WRITE:
+                result = thaio_pwrite(
+                    fileno, (const char*) buf, buf_size, offset, op->rw_flags
+                );
+                break;
+            case THAIO_FSYNC:
+                result = fsync(fileno);
+                expected = 0;
+                break;
+            case THAIO_FDSYNC:
 #ifdef HAVE_FDATASYNC
-            result = fdatasync(fileno);
+                result = fdatasync(fileno);
 #else
-            result = fsync(fileno);
+                result = fsync(fileno);
 #endif
-            break;
+                expected = 0;
+                break;
 
-        case THAIO_READ:
-            result = pread(fileno, buf, buf_size, offset);
-            break;
+            case THAIO_READ:
+            case THAIO_READINTO:
+                result = thaio_pread(
+                    fileno, buf, buf_size, offset, op->rw_flags
+                );
+                break;
+
+            case THAIO_READV:
+                result = preadv(fileno, op->iov, op->iovcnt, offset);
+                break;
+
+            case THAIO_WRITEV:
+                result = pwritev(fileno, op->iov, op->iovcnt, offset);
+                break;
+        }
     }
 
-    op->ctx = NULL;
     op->result = result;
 
     if (result < 0) op->error = errno;
 
-    if (op->opcode == THAIO_READ) {
+    if (op->opcode == THAIO_READ || op->opcode == THAIO_READV ||
+            op->opcode == THAIO_READINTO) {
+        AIOOperation_settle_buffer(op, result);
         op->buf_size = result;
     }
 
-    state = PyGILState_Ensure();
-    if (op->opcode == THAIO_WRITE) {
-        Py_CLEAR(op->py_buffer);
+    return result >= 0 && result == expected;
+}
+
+
+/* inline_reads: runs a READ/READINTO right here with RWF_NOWAIT, which
+ * the kernel only serves from the page cache - EAGAIN instead of ever
+ * blocking on the device. Returns 1 when that completed it, 0 when it
+ * has to go to the pool after all: on any error, and on a short read
+ * that didn't reach the end of file either, i.e. partly cached. Nothing
+ * about the Operation has changed in that case. */
+static int AIOOperation_try_inline(AIOOperation* op) {
+#if THAIO_RWF_SUPPORTED
+    if (op->opcode != THAIO_READ && op->opcode != THAIO_READINTO) return 0;
+
+    ssize_t result = thaio_pread(
+        op->fileno, op->buf, op->buf_size, op->offset,
+        op->rw_flags | RWF_NOWAIT
+    );
+    if (result < 0) return 0;
+    if (result > 0 && result < op->buf_size) {
+        // Short because it ran into the end of file, or only partly cached
+        struct stat st;
+        if (fstat(op->fileno, &st) < 0) return 0;
+        if (op->offset + result < st.st_size) return 0;
     }
 
-    /* Publish completion only after every result field and Python-owned
-     * buffer transition is complete. payload/get_value() acquire-load done,
-     * so a reader that observes true must also observe all writes above. */
-    CAIO_ATOMIC_STORE(op->done, 1);
+    op->result = (int) result;
+    op->error = 0;
+    AIOOperation_settle_buffer(op, result);
+    op->buf_size = result;
+    return 1;
+#else
+    (void) op;
+    return 0;
+#endif
+}
 
-    PyObject *callback = AIOOperation_callback_ref(op);
-    if (callback != NULL) {
-        PyObject *rv = PyObject_CallFunction(callback, "i", result);
-        if (rv == NULL) {
-            PyErr_WriteUnraisable(callback);
+
+void worker(void *arg) {
+    PyGILState_STATE state;
+
+    AIOOperation* op = arg;
+    int cancelled = 0;
+
+    // A chain (submit_chain()) runs start to end on this one thread.
+    while (op != NULL) {
+        AIOContext* ctx = (AIOContext*) op->ctx;
+        AIOOperation* next = op->chain_next;
+        op->ctx = NULL;
+        op->chain_next = NULL;
+
+        if (!AIOOperation_execute(op, cancelled)) cancelled = 1;
+
+        /* completion_queue: the Python side runs in process_events()
+         * instead, so this thread never needs the GIL at all. Neither ctx
+         * nor op may be touched past this point - the consumer may
+         * already own them. */
+        if (ctx->completion_queue) {
+            AIOContext_enqueue(ctx, op);
         } else {
-            Py_DECREF(rv);
+            state = PyGILState_Ensure();
+            AIOOperation_finish(op, (PyObject*) ctx);
+            PyGILState_Release(state);
         }
-        Py_DECREF(callback);
-    }
 
-    Py_DECREF(ctx);
-    Py_DECREF(op);
-
-    PyGILState_Release(state);
+        op = next;
+    }
 }
 
 
@@ -325,6 +645,9 @@ inline int process_pool_error(int code) {
                 "Thread failure"
             );
             return code;
+        case threadpool_memory_failure:
+            PyErr_NoMemory();
+            return code;
     }
 
     if (code < 0) PyErr_SetString(PyExc_RuntimeError, "Unknown error");
@@ -334,8 +657,12 @@ inline int process_pool_error(int code) {
 
 
 PyDoc_STRVAR(AIOContext_submit_docstring,
-    "Accepts multiple Operations. Returns \n\n"
-    "    Operation.submit(aio_op1, aio_op2, aio_opN, ...) -> int"
+    "Accepts multiple Operations. Returns how many of them it accepted, "
+    "counted from the first - the rest can be submitted again.\n\n"
+    "With inline_reads, reads the page cache can serve - up to the first "
+    "operation that has to go to the pool - complete before it returns, "
+    "and their callbacks are called from it.\n\n"
+    "    Context.submit(aio_op1, aio_op2, aio_opN, ...) -> int"
 );
 static PyObject* AIOContext_submit(
     AIOContext *self, PyObject *args
@@ -358,9 +685,17 @@ static PyObject* AIOContext_submit(
     // tuple length - *ops(*a_huge_tuple) must not be able to overflow the
     // stack.
     AIOOperation** ops = NULL;
+    AIOOperation** inline_ops = NULL;
+    int* priorities = NULL;
     if (nr > 0) {
         ops = PyMem_New(AIOOperation*, nr);
-        if (ops == NULL) {
+        priorities = PyMem_New(int, nr);
+        if (self->inline_reads) inline_ops = PyMem_New(AIOOperation*, nr);
+        if (ops == NULL || priorities == NULL ||
+                (self->inline_reads && inline_ops == NULL)) {
+            PyMem_Free(ops);
+            PyMem_Free(inline_ops);
+            PyMem_Free(priorities);
             PyErr_NoMemory();
             return NULL;
         }
@@ -374,6 +709,8 @@ static PyObject* AIOContext_submit(
                 "Wrong type for argument %zd", i
             );
             PyMem_Free(ops);
+            PyMem_Free(inline_ops);
+            PyMem_Free(priorities);
             return NULL;
         }
 
@@ -381,6 +718,7 @@ static PyObject* AIOContext_submit(
     }
 
     Py_ssize_t j=0;
+    Py_ssize_t n_inline = 0;
     int result = 0;
     int failed = 0;
 
@@ -394,6 +732,8 @@ static PyObject* AIOContext_submit(
         PyErr_SetString(PyExc_RuntimeError, "self->pool is NULL");
         failed = 1;
     } else {
+        Py_ssize_t claimed = 0;
+
         for (i=0; i < nr; i++) {
             // Atomic exchange, not check-then-set: two Contexts racing on
             // the same Operation must not both dispatch it to a worker.
@@ -403,25 +743,144 @@ static PyObject* AIOContext_submit(
             Py_INCREF(ops[i]);
             Py_INCREF(self);
 
-            result = threadpool_add(pool, worker, (void*) ops[i], 0);
-            if (process_pool_error(result) < 0) {
-                CAIO_ATOMIC_STORE(ops[i]->in_progress, 0);
+            /* Finished below, once out of the critical section. Only up
+             * to the first op bound for the pool: the pool may turn down
+             * a tail of those, and what's returned must stay a prefix. */
+            if (self->inline_reads && claimed == 0 &&
+                    AIOOperation_try_inline(ops[i])) {
                 ops[i]->ctx = NULL;
-                Py_DECREF(ops[i]);
-                Py_DECREF(self);
-                failed = 1;
-                break;
+                inline_ops[n_inline++] = ops[i];
+                continue;
             }
-            j++;
+
+            priorities[claimed] = caio_ioprio_queue_level(ops[i]->priority);
+            ops[claimed++] = ops[i];
+        }
+
+        // One queue reservation and one worker wakeup for the whole call.
+        // Everything past the accepted prefix goes back to retryable.
+        result = threadpool_add_batch(
+            pool, worker, (void**) ops, priorities,
+            (int) (claimed < MAX_QUEUE ? claimed : MAX_QUEUE), 0
+        );
+        if (result >= 0) {
+            j = result;
+            if (j < claimed) result = threadpool_queue_full;
+        }
+        if (process_pool_error(result) < 0) failed = 1;
+
+        for (i=j; i < claimed; i++) {
+            CAIO_ATOMIC_STORE(ops[i]->in_progress, 0);
+            ops[i]->ctx = NULL;
+            Py_DECREF(ops[i]);
+            Py_DECREF(self);
         }
     }
 
     CAIO_END_CRITICAL_SECTION();
 
+    /* Completed whatever happens to the rest, so always finished - and
+     * directly, even with completion_queue: whoever calls submit() is
+     * the one that drains process_events() too, and the point is to
+     * skip the round trip through the queue and its wakeup. */
+    for (i=0; i < n_inline; i++) {
+        AIOOperation_finish(inline_ops[i], (PyObject*) self);
+    }
+
     PyMem_Free(ops);
+    PyMem_Free(inline_ops);
+    PyMem_Free(priorities);
+
+    if (failed) return NULL;
+    return (PyObject*) PyLong_FromSsize_t(j + n_inline);
+}
+
+
+PyDoc_STRVAR(AIOContext_submit_chain_docstring,
+    "Submits Operations as one chain: a single worker thread runs them "
+    "in order, each only once the previous one transferred everything it "
+    "asked for. Otherwise the rest fail with ECANCELED.\n\n"
+    "All or nothing - raises ValueError if any of them is already "
+    "submitted.\n\n"
+    "    Context.submit_chain(op1, op2, ...) -> int"
+);
+static PyObject* AIOContext_submit_chain(
+    AIOContext *self, PyObject *args
+) {
+    Py_ssize_t nr = PyTuple_GET_SIZE(args);
+    Py_ssize_t i;
+
+    for (i = 0; i < nr; i++) {
+        if (!PyObject_TypeCheck(PyTuple_GET_ITEM(args, i), &AIOOperationType)) {
+            PyErr_Format(PyExc_TypeError, "Wrong type for argument %zd", i);
+            return NULL;
+        }
+    }
+    if (nr == 0) return PyLong_FromSsize_t(0);
+
+    int result = 0;
+    int failed = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+
+    if (self->pool == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "self->pool is NULL");
+        failed = 1;
+    } else {
+        for (i = 0; i < nr; i++) {
+            AIOOperation* op = (AIOOperation*) PyTuple_GET_ITEM(args, i);
+            if (CAIO_ATOMIC_LOAD_STORE(op->in_progress, 1)) {
+                PyErr_Format(
+                    PyExc_ValueError, "argument %zd is already submitted", i
+                );
+                failed = 1;
+                break;
+            }
+        }
+
+        if (!failed) {
+            for (i = 0; i < nr; i++) {
+                AIOOperation* op = (AIOOperation*) PyTuple_GET_ITEM(args, i);
+                op->ctx = (void*) self;
+                op->chain_next = (i + 1 < nr)
+                    ? (AIOOperation*) PyTuple_GET_ITEM(args, i + 1) : NULL;
+                Py_INCREF(op);
+                Py_INCREF(self);
+            }
+
+            AIOOperation* first = (AIOOperation*) PyTuple_GET_ITEM(args, 0);
+            int priority = caio_ioprio_queue_level(first->priority);
+            void* arg = first;
+            result = threadpool_add_batch(
+                self->pool, worker, &arg, &priority, 1, 0
+            );
+            if (result == 0) result = threadpool_queue_full;
+            if (process_pool_error(result) < 0) {
+                failed = 1;
+                for (i = 0; i < nr; i++) {
+                    AIOOperation* op = (AIOOperation*) PyTuple_GET_ITEM(args, i);
+                    op->ctx = NULL;
+                    op->chain_next = NULL;
+                    Py_DECREF(op);
+                    Py_DECREF(self);
+                }
+                i = nr;
+            }
+        }
+
+        if (failed) {
+            // Everything claimed above goes back to retryable.
+            for (Py_ssize_t k = 0; k < i; k++) {
+                AIOOperation* op = (AIOOperation*) PyTuple_GET_ITEM(args, k);
+                CAIO_ATOMIC_STORE(op->in_progress, 0);
+            }
+        }
+    }
+
+    CAIO_END_CRITICAL_SECTION();
 
     if (failed) return NULL;
-    return (PyObject*) PyLong_FromSsize_t(j);
+    return PyLong_FromSsize_t(nr);
 }
 
 
@@ -437,15 +896,202 @@ static PyObject* AIOContext_cancel(
 }
 
 
+/*
+ * Takes up to `max` finished Operations off the completion queue, oldest
+ * first, and runs their Python-side completion. Returns how many.
+ *
+ * Workers push onto `completed` newest-first; it's swapped out whole and
+ * reversed into `reaped` only once `reaped` runs dry, so ordering holds
+ * across calls that each take fewer than a full batch. Both lists belong
+ * to the consumer side - under free-threading, concurrent process_events()
+ * calls serialize on the Context's critical section.
+ */
+static Py_ssize_t AIOContext_process(AIOContext *self, Py_ssize_t max) {
+    AIOOperation** ops = PyMem_New(AIOOperation*, max);
+    if (ops == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    Py_ssize_t count = 0;
+
+    CAIO_BEGIN_CRITICAL_SECTION(self);
+    while (count < max) {
+        if (self->reaped == NULL) {
+            AIOOperation* stack = __atomic_exchange_n(
+                &self->completed, NULL, __ATOMIC_ACQUIRE
+            );
+            if (stack == NULL) break;
+
+            while (stack != NULL) {
+                AIOOperation* next = stack->next;
+                stack->next = self->reaped;
+                self->reaped = stack;
+                stack = next;
+            }
+        }
+
+        ops[count] = self->reaped;
+        self->reaped = self->reaped->next;
+        ops[count]->next = NULL;
+        count++;
+    }
+    CAIO_END_CRITICAL_SECTION();
+
+    // Outside the critical section - callbacks may re-enter this Context.
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_INCREF(self);
+        AIOOperation_finish(ops[i], (PyObject*) self);
+        Py_DECREF(self);
+    }
+
+    PyMem_Free(ops);
+    return count;
+}
+
+
+PyDoc_STRVAR(AIOContext_process_events_docstring,
+    "Runs the callbacks of finished Operations. Only meaningful for a "
+    "Context created with completion_queue=True - returns 0 otherwise.\n\n"
+    "    Context.process_events(max_requests=512, min_requests=0, "
+    "timeout=0) -> int\n\n"
+    "Waits up to `timeout` seconds (negative - indefinitely) for at least "
+    "`min_requests` completions. Returns the number processed."
+);
+static PyObject* AIOContext_process_events(
+    AIOContext *self, PyObject *args, PyObject *kwds
+) {
+    static char *kwlist[] = {"max_requests", "min_requests", "timeout", NULL};
+
+    unsigned max_requests = EV_MAX_REQUESTS_DEFAULT;
+    unsigned min_requests = 0;
+    int timeout = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "|IIi", kwlist,
+            &max_requests, &min_requests, &timeout
+    )) return NULL;
+
+    if (max_requests == 0) {
+        max_requests = EV_MAX_REQUESTS_DEFAULT;
+    }
+
+    /* Sizes the batch buffer in AIOContext_process() - same bound as the
+     * other backends' process_events(). */
+    static const unsigned MAX_EVENTS_REQUEST = 1u << 20;
+    if (max_requests > MAX_EVENTS_REQUEST) {
+        PyErr_Format(
+            PyExc_OverflowError,
+            "max_requests (%u) exceeds the maximum allowed (%u)",
+            max_requests, MAX_EVENTS_REQUEST
+        );
+        return NULL;
+    }
+
+    if (min_requests > max_requests) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "min_requests \"%d\" must be lower then max_requests \"%d\"",
+            min_requests, max_requests
+        );
+        return NULL;
+    }
+
+    if (!self->completion_queue) return PyLong_FromSsize_t(0);
+
+    struct timespec deadline;
+    clock_gettime(CLOCK_MONOTONIC, &deadline);
+    deadline.tv_sec += timeout;
+
+    Py_ssize_t total = 0;
+
+    for (;;) {
+        Py_ssize_t n = AIOContext_process(self, max_requests - total);
+        if (n < 0) return NULL;
+        total += n;
+
+        if (total >= (Py_ssize_t) min_requests || timeout == 0) break;
+        if ((Py_ssize_t) max_requests <= total) break;
+
+        int wait_ms = -1;
+        if (timeout > 0) {
+            struct timespec now;
+            clock_gettime(CLOCK_MONOTONIC, &now);
+            long long left = (
+                (long long) (deadline.tv_sec - now.tv_sec) * 1000 +
+                (deadline.tv_nsec - now.tv_nsec) / 1000000
+            );
+            if (left <= 0) break;
+            wait_ms = (int) left;
+        }
+
+        struct pollfd pfd = {.fd = self->fileno, .events = POLLIN};
+        int rc;
+
+        Py_BEGIN_ALLOW_THREADS
+        rc = poll(&pfd, 1, wait_ms);
+        Py_END_ALLOW_THREADS
+
+        if (rc < 0) {
+            if (errno != EINTR) {
+                PyErr_SetFromErrno(PyExc_SystemError);
+                return NULL;
+            }
+            if (PyErr_CheckSignals() < 0) return NULL;
+        }
+
+        AIOContext_consume_signal(self);
+    }
+
+    return PyLong_FromSsize_t(total);
+}
+
+
+PyDoc_STRVAR(AIOContext_poll_docstring,
+    "Resets the fileno() readiness after an event loop reported it. "
+    "Raises BlockingIOError when it wasn't ready.\n\n"
+    "    Context.poll() -> int"
+);
+static PyObject* AIOContext_poll(
+    AIOContext *self, PyObject *Py_UNUSED(ignored)
+) {
+    if (!self->completion_queue) {
+        PyErr_SetString(
+            PyExc_RuntimeError,
+            "Context was created without completion_queue"
+        );
+        return NULL;
+    }
+
+    uint64_t result = AIOContext_consume_signal(self);
+    if (result == 0) {
+        PyErr_SetNone(PyExc_BlockingIOError);
+        return NULL;
+    }
+
+    return PyLong_FromUnsignedLongLong(result);
+}
+
+
 PyDoc_STRVAR(AIOContext_close_docstring,
     "Stops the native thread pool. Idempotent - a second call is a no-op.\n\n"
     "Graceful: any Operation already running or still queued gets to run "
-    "to completion first. submit() after close() raises RuntimeError."
+    "to completion first - with completion_queue, their callbacks run "
+    "before close() returns. submit() after close() raises RuntimeError."
 );
 static PyObject* AIOContext_close(
     AIOContext *self, PyObject *Py_UNUSED(ignored)
 ) {
     AIOContext_close_pool(self);
+
+    if (self->completion_queue) {
+        while (1) {
+            Py_ssize_t n = AIOContext_process(self, EV_MAX_REQUESTS_DEFAULT);
+            if (n < 0) return NULL;
+            if (n == 0) break;
+        }
+    }
+
     Py_RETURN_NONE;
 }
 
@@ -463,11 +1109,32 @@ static PyMemberDef AIOContext_members[] = {
     },
     {
         "max_requests",
-        T_USHORT,
+        T_UINT,
         offsetof(AIOContext, max_requests),
         READONLY,
         "max requests"
     },
+    {
+        "fileno",
+        T_INT,
+        offsetof(AIOContext, fileno),
+        READONLY,
+        "completion queue wakeup fd, -1 without completion_queue"
+    },
+    {
+        "completion_queue",
+        T_BOOL,
+        offsetof(AIOContext, completion_queue),
+        READONLY,
+        "completions are delivered through process_events()"
+    },
+    {
+        "inline_reads",
+        T_BOOL,
+        offsetof(AIOContext, inline_reads),
+        READONLY,
+        "submit() serves page cache hits without a thread hop"
+    },
     {NULL}  /* Sentinel */
 };
 
@@ -482,6 +1149,21 @@ static PyMethodDef AIOContext_methods[] = {
         (PyCFunction) AIOContext_cancel, METH_VARARGS,
         AIOContext_cancel_docstring
     },
+    {
+        "submit_chain",
+        (PyCFunction) AIOContext_submit_chain, METH_VARARGS,
+        AIOContext_submit_chain_docstring
+    },
+    {
+        "process_events",
+        (PyCFunction) AIOContext_process_events, METH_VARARGS | METH_KEYWORDS,
+        AIOContext_process_events_docstring
+    },
+    {
+        "poll",
+        (PyCFunction) AIOContext_poll, METH_NOARGS,
+        AIOContext_poll_docstring
+    },
     {
         "close",
         (PyCFunction) AIOContext_close, METH_NOARGS,
@@ -520,16 +1202,29 @@ AIOOperation_traverse(AIOOperation *self, visitproc visit, void *arg) {
 static int
 AIOOperation_clear(AIOOperation *self) {
     Py_CLEAR(self->callback);
-
-    /* self->buf is a separate PyMem_Calloc allocation py_buffer's own
-     * memoryview only views, not owns - clearing py_buffer alone would
-     * leak it (and, if this runs before this Operation's own eventual
-     * dealloc, that dealloc's identical free-then-NULL below prevents a
-     * double free only because this already set it to NULL). */
-    if ((self->opcode == THAIO_READ) && self->buf != NULL) {
-        PyMem_Free(self->buf);
+    AIOOperation_release_iov(self);
+    if (self->target.obj != NULL) PyBuffer_Release(&self->target);
+
+    /* self->buf is a separate allocation py_buffer's own memoryview only
+     * views, not owns - clearing py_buffer alone would leak it (and, if
+     * this runs before this Operation's own eventual dealloc, that
+     * dealloc's identical free-then-NULL below prevents a double free
+     * only because this already set it to NULL). It goes back to the
+     * free list only if no memoryview handed out can still reach it. */
+    if ((self->opcode == THAIO_READ || self->opcode == THAIO_READV) &&
+            self->buf != NULL) {
+        if (self->aligned) {
+            free(self->buf);
+        } else if (caio_freelist_view_is_private(self->py_buffer)) {
+            caio_freelist_buffer_put(
+                &freelist, self->buf, self->buf_capacity
+            );
+        } else {
+            PyMem_Free(self->buf);
+        }
         self->buf = NULL;
     }
+    self->aligned = 0;
 
     Py_CLEAR(self->py_buffer);
 
@@ -552,10 +1247,42 @@ AIOOperation_dealloc(AIOOperation *self) {
         PyObject_ClearWeakRefs((PyObject *) self);
 
     AIOOperation_clear(self);
+
+    if (Py_TYPE(self) == &AIOOperationType &&
+            caio_freelist_object_put(&freelist, (PyObject *) self))
+        return;
+
     Py_TYPE(self)->tp_free((PyObject *) self);
 }
 
 
+/* Read buffer of `size` bytes, from the free list when a cached one of
+ * its size class is available - or, for a nonzero `alignment`, a private
+ * aligned allocation. Left uninitialized unless set_zero_fill() is on -
+ * pread() is about to overwrite it anyway, and whatever it doesn't is
+ * zeroed by AIOOperation_settle_buffer() before anything can see it. */
+static char* AIOOperation_alloc_buffer(
+    AIOOperation *self, size_t size, size_t alignment
+) {
+    char* buf;
+    if (alignment) {
+        buf = caio_aligned_buffer_get(size, alignment);
+        self->buf_capacity = size;
+        self->aligned = buf != NULL;
+    } else {
+        buf = caio_freelist_buffer_get(&freelist, size, &self->buf_capacity);
+    }
+    if (buf == NULL) return NULL;
+
+    if (zero_fill) {
+        memset(buf, 0, size);
+    } else {
+        self->dirty = 1;
+    }
+    return buf;
+}
+
+
 static PyObject* AIOOperation_repr(AIOOperation *self) {
     char* mode;
 
@@ -575,6 +1302,18 @@ static PyObject* AIOOperation_repr(AIOOperation *self) {
         case THAIO_FDSYNC:
             mode = "fdsync";
             break;
+
+        case THAIO_READV:
+            mode = "readv";
+            break;
+
+        case THAIO_WRITEV:
+            mode = "writev";
+            break;
+
+        case THAIO_READINTO:
+            mode = "readinto";
+            break;
         default:
             mode = "noop";
             break;
@@ -598,16 +1337,26 @@ PyDoc_STRVAR(AIOOperation_read_docstring,
     "        aio_context: Context,\n"
     "        fd: int, \n"
     "        offset: int,\n"
-    "        priority=0\n"
-    "    )"
+    "        priority=0,\n"
+    "        *,\n"
+    "        alignment=0,\n"
+    "        flags=0\n"
+    "    )\n\n"
+    "A nonzero alignment (a power of two) allocates the buffer on that\n"
+    "boundary, as O_DIRECT requires. flags are RWF_* request flags, see\n"
+    "caio.rwflags."
 );
 
 static PyObject* AIOOperation_read(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
-    static char *kwlist[] = {"nbytes", "fd", "offset", "priority", NULL};
+    static char *kwlist[] = {
+        "nbytes", "fd", "offset", "priority", "alignment", "flags", NULL
+    };
 
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
@@ -621,27 +1370,32 @@ static PyObject* AIOOperation_read(
     self->weakreflist = NULL;
 
     uint64_t nbytes = 0;
-    uint16_t priority;
+    Py_ssize_t alignment = 0;
+    self->priority = 0;
+    self->rw_flags = 0;
 
     int argIsOk = PyArg_ParseTupleAndKeywords(
-        args, kwds, "KI|LH", kwlist,
+        args, kwds, "KI|LH$ni", kwlist,
         &nbytes,
         &(self->fileno),
         &(self->offset),
-        &priority
+        &(self->priority),
+        &alignment,
+        &(self->rw_flags)
     );
 
-    if (!argIsOk) {
+    if (!argIsOk || !caio_alignment_check(alignment) ||
+            !caio_rwflags_check(self->rw_flags, THAIO_RWF_SUPPORTED)) {
         Py_DECREF(self);
         return NULL;
     }
 
-    // PyMem_Calloc can return NULL for a large enough (or just
+    // The allocation can fail for a large enough (or just
     // OOM-at-the-time) nbytes - proceeding with a NULL buf would hand the
     // kernel (via pread() in worker()) and PyMemoryView_FromMemory a NULL
     // pointer with a nonzero declared size, corrupting memory instead of
     // raising a catchable error.
-    self->buf = PyMem_Calloc(nbytes, sizeof(char));
+    self->buf = AIOOperation_alloc_buffer(self, nbytes, (size_t) alignment);
     if (self->buf == NULL && nbytes > 0) {
         Py_DECREF(self);
         PyErr_NoMemory();
@@ -674,24 +1428,30 @@ PyDoc_STRVAR(AIOOperation_write_docstring,
     "        payload_bytes: bytes,\n"
     "        fd: int, \n"
     "        offset: int,\n"
-    "        priority=0\n"
-    "    )"
+    "        priority=0,\n"
+    "        *,\n"
+    "        flags=0\n"
+    "    )\n\n"
+    "flags are RWF_* request flags, see caio.rwflags."
 );
 
 static PyObject* AIOOperation_write(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
-    static char *kwlist[] = {"payload_bytes", "fd", "offset", "priority", NULL};
+    static char *kwlist[] = {
+        "payload_bytes", "fd", "offset", "priority", "flags", NULL
+    };
 
     if (self == NULL) {
         PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
         return NULL;
     }
 
-    // unused
-    uint16_t priority;
+    self->priority = 0;
 
     self->buf = NULL;
     self->py_buffer = NULL;
@@ -706,15 +1466,19 @@ static PyObject* AIOOperation_write(
     // bytes object this Operation is going to own.
     PyObject* payload_bytes = NULL;
 
+    self->rw_flags = 0;
+
     int argIsOk = PyArg_ParseTupleAndKeywords(
-        args, kwds, "OI|LH", kwlist,
+        args, kwds, "OI|LH$i", kwlist,
         &payload_bytes,
         &(self->fileno),
         &(self->offset),
-        &priority
+        &(self->priority),
+        &(self->rw_flags)
     );
 
-    if (!argIsOk) {
+    if (!argIsOk ||
+            !caio_rwflags_check(self->rw_flags, THAIO_RWF_SUPPORTED)) {
         Py_DECREF(self);
         return NULL;
     }
@@ -750,6 +1514,299 @@ static PyObject* AIOOperation_write(
 }
 
 
+/* Validates the readv()/writev() iovec count and allocates the array.
+ * Returns NULL with an exception set if it's out of range. */
+static struct iovec* AIOOperation_alloc_iov(Py_ssize_t count) {
+    if (count < 1 || count > IOV_MAX) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "expected between 1 and %d buffers, got %zd", IOV_MAX, count
+        );
+        return NULL;
+    }
+
+    struct iovec* iov = PyMem_New(struct iovec, count);
+    if (iov == NULL) PyErr_NoMemory();
+    return iov;
+}
+
+
+/*
+    AIOOperation.readinto classmethod definition
+*/
+PyDoc_STRVAR(AIOOperation_readinto_docstring,
+    "Creates a new instance of Operation reading into a caller's buffer.\n\n"
+    "    Operation.readinto(\n"
+    "        buffer: writable buffer,\n"
+    "        fd: int, \n"
+    "        offset: int,\n"
+    "        priority=0\n"
+    "    )\n\n"
+    "    pread() fills buffer directly; get_value() returns the number of\n"
+    "    bytes read. buffer stays exported until completion."
+);
+
+static PyObject* AIOOperation_readinto(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+
+    static char *kwlist[] = {"buffer", "fd", "offset", "priority", NULL};
+
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
+        return NULL;
+    }
+
+    self->buf = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->weakreflist = NULL;
+
+    PyObject* buffer = NULL;
+    self->priority = 0;
+
+    int argIsOk = PyArg_ParseTupleAndKeywords(
+        args, kwds, "OI|LH", kwlist,
+        &buffer,
+        &(self->fileno),
+        &(self->offset),
+        &(self->priority)
+    );
+
+    if (!argIsOk) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->opcode = THAIO_READINTO;
+
+    if (PyObject_GetBuffer(buffer, &self->target, PyBUF_WRITABLE)) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->py_buffer = buffer;
+    Py_INCREF(self->py_buffer);
+
+    self->buf = self->target.buf;
+    self->buf_size = self->target.len;
+
+    return (PyObject*) self;
+}
+
+
+/*
+    AIOOperation.readv classmethod definition
+*/
+PyDoc_STRVAR(AIOOperation_readv_docstring,
+    "Creates a new instance of Operation on vectored read mode.\n\n"
+    "    Operation.readv(\n"
+    "        sizes: Sequence[int],\n"
+    "        fd: int, \n"
+    "        offset: int,\n"
+    "        priority=0\n"
+    "    )\n\n"
+    "    get_value() returns one bytes object per entry of sizes."
+);
+
+static PyObject* AIOOperation_readv(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+
+    static char *kwlist[] = {"sizes", "fd", "offset", "priority", NULL};
+
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
+        return NULL;
+    }
+
+    self->buf = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->weakreflist = NULL;
+
+    PyObject* sizes = NULL;
+    self->priority = 0;
+
+    int argIsOk = PyArg_ParseTupleAndKeywords(
+        args, kwds, "OI|LH", kwlist,
+        &sizes,
+        &(self->fileno),
+        &(self->offset),
+        &(self->priority)
+    );
+
+    if (!argIsOk) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->opcode = THAIO_READV;
+
+    PyObject* seq = PySequence_Fast(sizes, "sizes must be a sequence of ints");
+    if (seq == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+    self->iov = AIOOperation_alloc_iov(count);
+    if (self->iov == NULL) {
+        Py_DECREF(seq);
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->iovcnt = (int) count;
+
+    Py_ssize_t total = 0;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_ssize_t size = PyNumber_AsSsize_t(
+            PySequence_Fast_GET_ITEM(seq, i), PyExc_OverflowError
+        );
+        if (size == -1 && PyErr_Occurred()) {
+            Py_DECREF(seq);
+            Py_DECREF(self);
+            return NULL;
+        }
+        if (size < 0 || size > PY_SSIZE_T_MAX - total) {
+            Py_DECREF(seq);
+            Py_DECREF(self);
+            PyErr_Format(PyExc_ValueError, "invalid size at %zd", i);
+            return NULL;
+        }
+        self->iov[i].iov_len = (size_t) size;
+        total += size;
+    }
+    Py_DECREF(seq);
+
+    // One contiguous buffer, as for read(), that the iovecs are
+    // consecutive slices of.
+    self->buf = AIOOperation_alloc_buffer(self, total, 0);
+    if (self->buf == NULL && total > 0) {
+        Py_DECREF(self);
+        PyErr_NoMemory();
+        return NULL;
+    }
+    self->buf_size = total;
+
+    char* base = self->buf;
+    for (int i = 0; i < self->iovcnt; i++) {
+        self->iov[i].iov_base = base;
+        base += self->iov[i].iov_len;
+    }
+
+    self->py_buffer = PyMemoryView_FromMemory(self->buf, total, PyBUF_READ);
+    if (self->py_buffer == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    return (PyObject*) self;
+}
+
+
+/*
+    AIOOperation.writev classmethod definition
+*/
+PyDoc_STRVAR(AIOOperation_writev_docstring,
+    "Creates a new instance of Operation on vectored write mode.\n\n"
+    "    Operation.writev(\n"
+    "        buffers: Sequence[bytes],\n"
+    "        fd: int, \n"
+    "        offset: int,\n"
+    "        priority=0\n"
+    "    )\n\n"
+    "    Writes the bytes-like buffers back to back without joining them."
+);
+
+static PyObject* AIOOperation_writev(
+    PyTypeObject *type, PyObject *args, PyObject *kwds
+) {
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
+
+    static char *kwlist[] = {"buffers", "fd", "offset", "priority", NULL};
+
+    if (self == NULL) {
+        PyErr_SetString(PyExc_MemoryError, "can not allocate memory");
+        return NULL;
+    }
+
+    self->buf = NULL;
+    self->py_buffer = NULL;
+    self->in_progress = 0;
+    self->done = 0;
+    self->weakreflist = NULL;
+
+    PyObject* buffers = NULL;
+    self->priority = 0;
+
+    int argIsOk = PyArg_ParseTupleAndKeywords(
+        args, kwds, "OI|LH", kwlist,
+        &buffers,
+        &(self->fileno),
+        &(self->offset),
+        &(self->priority)
+    );
+
+    if (!argIsOk) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->opcode = THAIO_WRITEV;
+
+    // A private tuple rather than the caller's own sequence - a list
+    // mutated later must not drift from what the iovecs point at.
+    self->py_buffer = PySequence_Tuple(buffers);
+    if (self->py_buffer == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    Py_ssize_t count = PyTuple_GET_SIZE(self->py_buffer);
+    self->iov = AIOOperation_alloc_iov(count);
+    if (self->iov == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->views = PyMem_New(Py_buffer, count);
+    if (self->views == NULL) {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+
+    Py_ssize_t total = 0;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_buffer* view = &self->views[i];
+        if (PyObject_GetBuffer(
+                PyTuple_GET_ITEM(self->py_buffer, i), view, PyBUF_SIMPLE)) {
+            Py_DECREF(self);
+            return NULL;
+        }
+        // Counted as soon as it's held, so a later failure releases it
+        self->iovcnt = (int) i + 1;
+
+        self->iov[i].iov_base = view->buf;
+        self->iov[i].iov_len = (size_t) view->len;
+        total += view->len;
+    }
+    self->buf_size = total;
+
+    return (PyObject*) self;
+}
+
+
 /*
     AIOOperation.fsync classmethod definition
 */
@@ -765,7 +1822,9 @@ PyDoc_STRVAR(AIOOperation_fsync_docstring,
 static PyObject* AIOOperation_fsync(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
     static char *kwlist[] = {"fd", "priority", NULL};
 
@@ -774,7 +1833,7 @@ static PyObject* AIOOperation_fsync(
         return NULL;
     }
 
-    uint16_t priority;
+    self->priority = 0;
 
     self->buf = NULL;
     self->py_buffer = NULL;
@@ -785,7 +1844,7 @@ static PyObject* AIOOperation_fsync(
     int argIsOk = PyArg_ParseTupleAndKeywords(
         args, kwds, "I|H", kwlist,
         &(self->fileno),
-        &priority
+        &(self->priority)
     );
 
     if (!argIsOk) {
@@ -814,7 +1873,9 @@ PyDoc_STRVAR(AIOOperation_fdsync_docstring,
 static PyObject* AIOOperation_fdsync(
     PyTypeObject *type, PyObject *args, PyObject *kwds
 ) {
-    AIOOperation *self = (AIOOperation *) type->tp_alloc(type, 0);
+    AIOOperation *self = (AIOOperation *) caio_freelist_object_new(
+        &freelist, type
+    );
 
     static char *kwlist[] = {"fd", "priority", NULL};
 
@@ -828,12 +1889,12 @@ static PyObject* AIOOperation_fdsync(
     self->in_progress = 0;
     self->done = 0;
     self->weakreflist = NULL;
-    uint16_t priority;
+    self->priority = 0;
 
     int argIsOk = PyArg_ParseTupleAndKeywords(
         args, kwds, "I|H", kwlist,
         &(self->fileno),
-        &priority
+        &(self->priority)
     );
 
     if (!argIsOk) {
@@ -849,6 +1910,30 @@ static PyObject* AIOOperation_fdsync(
 /*
     AIOOperation.get_value method definition
 */
+/* readv()'s result: the first `filled` bytes of buf, cut at the iovec
+ * boundaries - always one item per iovec. */
+static PyObject* AIOOperation_split_iov(AIOOperation *self, Py_ssize_t filled) {
+    PyObject* result = PyList_New(self->iovcnt);
+    if (result == NULL) return NULL;
+
+    for (int i = 0; i < self->iovcnt; i++) {
+        Py_ssize_t size = (Py_ssize_t) self->iov[i].iov_len;
+        if (size > filled) size = filled;
+        filled -= size;
+
+        PyObject* chunk = PyBytes_FromStringAndSize(
+            (const char*) self->iov[i].iov_base, size
+        );
+        if (chunk == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, chunk);
+    }
+    return result;
+}
+
+
 PyDoc_STRVAR(AIOOperation_get_value_docstring,
     "Method returns a bytes value of Operation's result or None.\n\n"
     "    Operation.get_value() -> Optional[bytes]"
@@ -892,7 +1977,14 @@ static PyObject* AIOOperation_get_value(
                 self->buf, self->buf_size
             );
 
+        case THAIO_READV:
+            if (self->iov == NULL || self->buf == NULL)
+                Py_RETURN_NONE;
+            return AIOOperation_split_iov(self, self->buf_size);
+
         case THAIO_WRITE:
+        case THAIO_WRITEV:
+        case THAIO_READINTO:
             return PyLong_FromSsize_t(self->result);
     }
 
@@ -963,6 +2055,9 @@ static PyObject *AIOOperation_payload_getter(AIOOperation *self, void *closure)
     if (self->py_buffer == NULL)
         Py_RETURN_NONE;
 
+    /* Not submitted (yet) - nothing was read into it */
+    AIOOperation_settle_buffer(self, 0);
+
     Py_INCREF(self->py_buffer);
     return self->py_buffer;
 }
@@ -986,6 +2081,11 @@ static PyMemberDef AIOOperation_members[] = {
         offsetof(AIOOperation, fileno),
         READONLY, "file descriptor"
     },
+    {
+        "priority", T_USHORT,
+        offsetof(AIOOperation, priority),
+        READONLY, "request priority"
+    },
     {
         "offset", T_ULONGLONG,
         offsetof(AIOOperation, offset),
@@ -1037,6 +2137,24 @@ static PyMethodDef AIOOperation_methods[] = {
         METH_CLASS | METH_VARARGS | METH_KEYWORDS,
         AIOOperation_fdsync_docstring
     },
+    {
+        "readinto",
+        (PyCFunction) AIOOperation_readinto,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_readinto_docstring
+    },
+    {
+        "readv",
+        (PyCFunction) AIOOperation_readv,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_readv_docstring
+    },
+    {
+        "writev",
+        (PyCFunction) AIOOperation_writev,
+        METH_CLASS | METH_VARARGS | METH_KEYWORDS,
+        AIOOperation_writev_docstring
+    },
     {
         "get_value",
         (PyCFunction) AIOOperation_get_value, METH_NOARGS,
@@ -1072,11 +2190,74 @@ AIOOperationType = {
 };
 
 
+PyDoc_STRVAR(set_zero_fill_docstring,
+    "Whether read buffers are zero-filled when allocated.\n\n"
+    "    set_zero_fill(enabled: bool) -> bool\n\n"
+    "    Off by default: only the part of a buffer a read did not fill is\n"
+    "    zeroed, after it completes. Returns the previous setting."
+);
+static PyObject* thread_aio_set_zero_fill(PyObject *module, PyObject *arg) {
+    int enabled = PyObject_IsTrue(arg);
+    if (enabled < 0) return NULL;
+
+    int previous = zero_fill;
+    zero_fill = enabled;
+    return PyBool_FromLong(previous);
+}
+
+
+PyDoc_STRVAR(freelist_info_docstring, CAIO_FREELIST_INFO_DOC);
+static PyObject* thread_aio_freelist_info(PyObject *module, PyObject *args) {
+    return caio_freelist_info(&freelist);
+}
+
+
+PyDoc_STRVAR(freelist_trim_docstring, CAIO_FREELIST_TRIM_DOC);
+static PyObject* thread_aio_freelist_trim(PyObject *module, PyObject *args) {
+    return PyLong_FromSize_t(caio_freelist_shrink(&freelist, 0, 0));
+}
+
+
+PyDoc_STRVAR(freelist_set_limits_docstring, CAIO_FREELIST_SET_LIMITS_DOC);
+static PyObject* thread_aio_freelist_set_limits(
+    PyObject *module, PyObject *args, PyObject *kwds
+) {
+    return caio_freelist_set_limits(&freelist, args, kwds);
+}
+
+
+static PyMethodDef thread_aio_methods[] = {
+    {
+        "set_zero_fill",
+        (PyCFunction) thread_aio_set_zero_fill, METH_O,
+        set_zero_fill_docstring
+    },
+    {
+        "freelist_info",
+        (PyCFunction) thread_aio_freelist_info, METH_NOARGS,
+        freelist_info_docstring
+    },
+    {
+        "freelist_trim",
+        (PyCFunction) thread_aio_freelist_trim, METH_NOARGS,
+        freelist_trim_docstring
+    },
+    {
+        "freelist_set_limits",
+        (PyCFunction) thread_aio_freelist_set_limits,
+        METH_VARARGS | METH_KEYWORDS,
+        freelist_set_limits_docstring
+    },
+    {NULL}  /* Sentinel */
+};
+
+
 static PyModuleDef thread_aio_module = {
     PyModuleDef_HEAD_INIT,
     .m_name = "thread_aio",
     .m_doc = "Thread based AIO.",
     .m_size = -1,
+    .m_methods = thread_aio_methods,
 };
 
 
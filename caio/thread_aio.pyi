@@ -1,15 +1,36 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from .abstract import AbstractContext, AbstractOperation
 
 # noinspection PyPropertyDefinition
 class Context(AbstractContext):
-    def __init__(self, max_requests: int = 512, pool_size=8): ...
+    def __init__(
+        self, max_requests: int = 512, pool_size=8,
+        completion_queue: bool = False, inline_reads: bool = False,
+    ): ...
 
     @property
     def pool_size(self) -> int: ...
 
+    @property
+    def completion_queue(self) -> bool: ...
+
+    @property
+    def inline_reads(self) -> bool: ...
+
+    @property
+    def fileno(self) -> int: ...
+
+    def process_events(
+        self, max_requests: int = 512, min_requests: int = 0,
+        timeout: int = 0,
+    ) -> int: ...
+
+    def poll(self) -> int: ...
+
+    def submit_chain(self, *aio_operations: Operation) -> int: ...
+
     def close(self) -> None: ...
 
 
@@ -17,13 +38,14 @@ class Context(AbstractContext):
 class Operation(AbstractOperation):
     @classmethod
     def read(
-        cls, nbytes: int, fd: int, offset: int, priority=0
+        cls, nbytes: int, fd: int, offset: int, priority=0,
+        *, alignment: int = 0, flags: int = 0,
     ) -> AbstractOperation: ...
 
     @classmethod
     def write(
         cls, payload_bytes: bytes,
-        fd: int, offset: int, priority=0,
+        fd: int, offset: int, priority=0, *, flags: int = 0,
     ) -> AbstractOperation: ...
 
     @classmethod
@@ -32,7 +54,22 @@ class Operation(AbstractOperation):
     @classmethod
     def fdsync(cls, fd: int, priority=0) -> AbstractOperation: ...
 
-    def get_value(self) -> bytes | int | None: ...
+    @classmethod
+    def readinto(
+        cls, buffer: Any, fd: int, offset: int, priority=0,
+    ) -> AbstractOperation: ...
+
+    @classmethod
+    def readv(
+        cls, sizes: Sequence[int], fd: int, offset: int, priority=0,
+    ) -> AbstractOperation: ...
+
+    @classmethod
+    def writev(
+        cls, buffers: Sequence[bytes], fd: int, offset: int, priority=0,
+    ) -> AbstractOperation: ...
+
+    def get_value(self) -> bytes | list[bytes] | int | None: ...
 
     @property
     def fileno(self) -> int: ...
@@ -41,11 +78,14 @@ class Operation(AbstractOperation):
     def offset(self) -> int: ...
 
     @property
-    def payload(self) -> bytes | memoryview | None: ...
+    def payload(self) -> Any: ...
 
     @property
     def nbytes(self) -> int: ...
 
+    @property
+    def priority(self) -> int: ...
+
     @property
     def result(self) -> int: ...
 
@@ -53,3 +93,14 @@ class Operation(AbstractOperation):
     def error(self) -> int: ...
 
     def set_callback(self, callback: Callable[[int], Any]) -> bool: ...
+
+
+# Zero read buffers up front rather than only what a read left unfilled
+def set_zero_fill(enabled: bool) -> bool: ...
+
+# Per-module cache of recycled Operation objects and read buffers
+def freelist_info() -> dict[str, Any]: ...
+def freelist_trim() -> int: ...
+def freelist_set_limits(
+    max_bytes: int | None = None, max_objects: int | None = None,
+) -> None: ...
@@ -7,5 +7,39 @@ class AsyncioContext(AsyncioContextBase):
     OPERATION_CLASS = Operation
     CONTEXT_CLASS = Context
 
+    def _create_context(self, max_requests, **kwargs):
+        # Workers push completions onto the Context's queue and signal its
+        # fileno instead of taking the GIL for a call_soon_threadsafe()
+        # each - drained here, on the event loop's own thread.
+        kwargs.setdefault("completion_queue", True)
+        context = super()._create_context(max_requests, **kwargs)
+        if context.completion_queue:
+            self.loop.add_reader(context.fileno, self._on_read_event)
+        return context
+
+    def _on_done(self, future, result):
+        """
+        With completion_queue, callbacks run from process_events() on
+        the event loop's thread - set the result directly.
+        """
+        if not self.context.completion_queue:
+            super()._on_done(future, result)
+            return
+        if future.done():
+            return
+        future.set_result(True)
+
     def _destroy_context(self):
+        if self.context.completion_queue:
+            self.loop.remove_reader(self.context.fileno)
         self.context.close()
+
+    def _on_read_event(self):
+        # Same as linux_aio's: a stale wakeup is never a reason to skip
+        # draining.
+        try:
+            self.context.poll()
+        except BlockingIOError:
+            pass
+        while self.context.process_events():
+            pass
@@ -12,6 +12,7 @@ from caio import (
     linux_uring_asyncio,
     python_aio,
     thread_aio,
+    thread_aio_asyncio,
     variants,
     variants_asyncio,
 )
@@ -151,19 +152,49 @@ if linux_uring is not None:
         ),
     ))
 
+    extra_asyncio_variants.append(named_variant(
+        "linux_uring[batched=True]",
+        AsyncioContext=functools.partial(
+            linux_uring_asyncio.AsyncioContext, batched=True,
+        ),
+    ))
+
 if linux_aio is not None:
     extra_asyncio_variants.append(named_variant(
         "linux_aio[deferred=True]",
         AsyncioContext=functools.partial(linux_aio_asyncio.AsyncioContext, deferred=True),
     ))
+    extra_asyncio_variants.append(named_variant(
+        "linux_aio[batched=True]",
+        AsyncioContext=functools.partial(
+            linux_aio_asyncio.AsyncioContext, deferred=True, batched=True,
+        ),
+    ))
+
+if thread_aio is not None:
+    extra_context_variants.append(named_variant(
+        "thread_aio[completion_queue=True]",
+        Context=functools.partial(thread_aio.Context, completion_queue=True),
+        Operation=thread_aio.Operation,
+    ))
+    # AsyncioContext defaults to completion_queue=True - keep the
+    # per-operation callback path covered too.
+    extra_asyncio_variants.append(named_variant(
+        "thread_aio[completion_queue=False]",
+        AsyncioContext=functools.partial(
+            thread_aio_asyncio.AsyncioContext, completion_queue=False,
+        ),
+    ))
 
 all_variants = variants + tuple(extra_context_variants)
 all_variants_asyncio = variants_asyncio + tuple(extra_asyncio_variants)
 
-# extra_context_variants are always linux_uring, always polling-capable -
-# added directly rather than via hasattr() (doesn't see through partial).
+# extra_context_variants are always polling-capable - added directly
+# rather than via hasattr() (doesn't see through partial). Plain thread_aio
+# has process_events() too, but without completion_queue it's a no-op.
 polling_variants = [
-    v for v in variants if hasattr(v.Context, "process_events")
+    v for v in variants
+    if hasattr(v.Context, "process_events") and v is not thread_aio
 ] + extra_context_variants
 
 # Only thread_aio/python_aio have a worker-pool queue distinct from
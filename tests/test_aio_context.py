@@ -27,6 +27,9 @@ def test_operation_repr_does_not_crash(backend):
             backend.Operation.write(b"hello", fd, 0),
             backend.Operation.fsync(fd),
             backend.Operation.fdsync(fd),
+            backend.Operation.readinto(bytearray(4), fd, 0),
+            backend.Operation.readv([4, 4], fd, 0),
+            backend.Operation.writev([b"a", b"b"], fd, 0),
         ]
         for op in ops:
             assert isinstance(repr(op), str)
@@ -75,3 +78,34 @@ def test_sync_operation_properties(backend, ctor_name):
         assert op.nbytes == 0
         # Some backends return None, others an empty buffer - both falsy.
         assert not op.payload
+
+
+def test_vectored_operation_validation(backend):
+    """readv()/writev() reject a bad iovec list at construction time, the
+    same way on every backend, instead of failing later on a worker."""
+    with tempfile.NamedTemporaryFile() as f:
+        fd = f.fileno()
+
+        op = backend.Operation.readv([3, 0, 5], fd, 2)
+        assert op.nbytes == 8
+
+        op = backend.Operation.writev([b"head", bytearray(b"er")], fd, 0)
+        assert op.nbytes == 6
+
+        with pytest.raises(ValueError):
+            backend.Operation.readv([], fd, 0)
+        with pytest.raises(ValueError):
+            backend.Operation.readv([-1], fd, 0)
+        with pytest.raises(ValueError):
+            backend.Operation.writev([b"x"] * 1025, fd, 0)
+        with pytest.raises(TypeError):
+            backend.Operation.writev([b"x", "str"], fd, 0)
+
+
+def test_readinto_requires_writable_buffer(backend):
+    with tempfile.NamedTemporaryFile() as f:
+        op = backend.Operation.readinto(bytearray(16), f.fileno(), 0)
+        assert op.nbytes == 16
+
+        with pytest.raises(BufferError):
+            backend.Operation.readinto(b"read-only", f.fileno(), 0)
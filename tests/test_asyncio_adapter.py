@@ -6,6 +6,8 @@ from unittest.mock import Mock
 import aiomisc
 import pytest
 
+from caio.buffers import BufferArena, logical_block_size
+
 
 @aiomisc.timeout(5)
 async def test_linux_uring_asyncio_forwards_context_kwargs():
@@ -178,6 +180,140 @@ async def test_partial_read_at_eof(tmp_path, async_context):
         assert len(data) == len(payload)
 
 
+@aiomisc.timeout(5)
+async def test_readinto(tmp_path, async_context):
+    """readinto() fills the caller's own buffer in place and returns the
+    byte count - only the part actually read is touched."""
+    context = async_context
+    with open(str(tmp_path / "temp.bin"), "wb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+        fd = fp.fileno()
+        await context.write(b"0123456789", fd, 0)
+
+        buffer = bytearray(b"-" * 16)
+        assert await context.readinto(buffer, fd, 0) == 10
+        assert buffer == b"0123456789------"
+
+        view = memoryview(buffer)
+        assert await context.readinto(view[12:], fd, 6) == 4
+        view.release()
+        assert buffer == b"0123456789--6789"
+
+        # The export is dropped on completion, not pinned for good
+        buffer.extend(b"!")
+
+
+@aiomisc.timeout(5)
+async def test_readv_writev(tmp_path, async_context):
+    """writev() lands its buffers back to back; readv() hands one chunk
+    back per requested size, short (then empty) past EOF."""
+    context = async_context
+    with open(str(tmp_path / "temp.bin"), "wb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+        fd = fp.fileno()
+
+        buffers = [b"header:", bytearray(b"body"), memoryview(b"!\n")]
+        assert await context.writev(buffers, fd, 3) == 13
+        assert await context.read(32, fd, 0) == b"\x00" * 3 + b"header:body!\n"
+
+        chunks = await context.readv([3, 7, 4, 8, 1], fd, 0)
+        assert chunks == [
+            b"\x00" * 3, b"header:", b"body", b"!\n", b"",
+        ]
+
+
+@aiomisc.timeout(5)
+async def test_submit_chain(tmp_path, async_context):
+    """Chained operations resolve to their values in order; the first
+    failure is raised, and nothing after it runs."""
+    context = async_context
+    operation = context.OPERATION_CLASS
+    path = tmp_path / "temp.bin"
+    with open(str(path), "wb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+        fd = fp.fileno()
+
+        assert await context.submit_chain(
+            operation.write(b"chained", fd, 0),
+            operation.fdsync(fd),
+            operation.read(7, fd, 0),
+        ) == [7, None, b"chained"]
+
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"")
+    fd = os.open(str(path), os.O_RDONLY)
+    other_fd = os.open(str(other), os.O_WRONLY)
+    try:
+        # linux_aio rejects the bad fd at submit time with ValueError
+        with pytest.raises((OSError, SystemError, ValueError)):
+            await context.submit_chain(
+                operation.write(b"never", fd, 0),
+                operation.write(b"never", other_fd, 0),
+            )
+    finally:
+        os.close(fd)
+        os.close(other_fd)
+    assert other.read_bytes() == b""
+
+
+@aiomisc.timeout(5)
+async def test_concurrent_chains_on_a_full_semaphore(
+    tmp_path, async_context_maker,
+):
+    """Chains waiting for slots at once must not each end up holding part
+    of them - they'd wait for one another forever."""
+    async with async_context_maker(max_requests=4) as context:
+        operation = context.OPERATION_CLASS
+        path = tmp_path / "temp.bin"
+        path.write_bytes(b"0123456789")
+        with open(str(path), "rb") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            # Stand-ins for four operations in flight
+            for _ in range(4):
+                await context.semaphore.acquire()
+
+            chains = [
+                asyncio.ensure_future(context.submit_chain(*(
+                    operation.read(1, fd, offset) for offset in range(3)
+                )))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            for _ in range(4):
+                context.semaphore.release()
+                await asyncio.sleep(0)
+
+            assert await asyncio.gather(*chains) == [[b"0", b"1", b"2"]] * 2
+
+            with pytest.raises(ValueError):
+                await context.submit_chain(*(
+                    operation.read(1, fd, 0) for _ in range(5)
+                ))
+
+
+@aiomisc.timeout(5)
+async def test_partial_reject_keeps_running_slots(async_context):
+    """Ops a batch got accepted keep their slots until they complete, even
+    once the batch has failed on the ones rejected."""
+    context = async_context
+    running = []
+
+    def accept_first(ops, futures):
+        running.append(futures[0])
+        for future in futures[1:]:
+            future.set_exception(OSError("Operation was not submitted"))
+
+    context._submit_ops = accept_first
+    free = context.semaphore._value
+    with pytest.raises(OSError):
+        await context.submit_many(
+            *(context.OPERATION_CLASS.fsync(0) for _ in range(3)),
+        )
+    assert context.semaphore._value == free - 1
+
+    running[0].set_result(True)
+    await asyncio.sleep(0)
+    assert context.semaphore._value == free
+
+
 @aiomisc.timeout(5)
 async def test_fsync_and_fdsync(tmp_path, async_context):
     context = async_context
@@ -222,6 +358,275 @@ async def test_write_extends_file_sparsely(tmp_path, async_context):
         assert hole == b"\x00" * hole_size
 
 
+def count_submits(context):
+    """Records every operation passed to ``context.submit()``."""
+    submitted = []
+    submit = context.submit
+
+    def counting_submit(op):
+        submitted.append(op)
+        return submit(op)
+
+    context.submit = counting_submit
+    return submitted
+
+
+@aiomisc.timeout(5)
+async def test_group_commit_shares_syncs(tmp_path, async_context_maker):
+    """Concurrent syncs of one fd cost one operation plus at most one
+    more for those arriving while it's in flight."""
+    async with async_context_maker(group_commit=True) as context:
+        submitted = count_submits(context)
+        with open(str(tmp_path / "temp.bin"), "wb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            results = await asyncio.gather(
+                *[context.fdsync(fd) for _ in range(50)],
+                context.fsync(fd),
+            )
+            assert results == [None] * 51
+            assert 1 <= len(submitted) <= 2
+            assert not context._sync_groups
+
+        with pytest.raises((OSError, SystemError, ValueError)):
+            await asyncio.gather(context.fdsync(fd), context.fdsync(fd))
+
+
+@aiomisc.timeout(5)
+async def test_group_commit_cancelled(tmp_path, async_context_maker):
+    """A sync group cancelled mid-sync cancels its waiters, both the ones
+    on the sync in flight and the ones queued for the next."""
+    async with async_context_maker(group_commit=True) as context:
+        never = asyncio.Event()
+
+        async def stuck_submit(op):
+            await never.wait()
+
+        context.submit = stuck_submit
+        with open(str(tmp_path / "temp.bin"), "wb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            first = asyncio.ensure_future(context.fdsync(fd))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(context.fsync(fd))
+            await asyncio.sleep(0)
+
+            context._sync_groups[fd].task.cancel()
+            for waiter in (first, second):
+                with pytest.raises(asyncio.CancelledError):
+                    await waiter
+            assert not context._sync_groups
+
+
+@aiomisc.timeout(5)
+async def test_iter_chunks(tmp_path, async_context):
+    context = async_context
+    data = os.urandom(10_000)
+    path = tmp_path / "temp.bin"
+    path.write_bytes(data)
+    with open(str(path), "rb") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+        fd = fp.fileno()
+
+        chunks = [
+            chunk async for chunk in context.iter_chunks(
+                fd, chunk_size=3000, window=2,
+            )
+        ]
+        assert [len(c) for c in chunks] == [3000, 3000, 3000, 1000]
+        assert b"".join(chunks) == data
+
+        chunks = [
+            chunk async for chunk in context.iter_chunks(
+                fd, 100, 7100, chunk_size=3000,
+            )
+        ]
+        assert [len(c) for c in chunks] == [3000, 3000, 1000]
+        assert b"".join(chunks) == data[100:7100]
+
+        # Stopping early cancels the reads still in flight
+        stream = context.iter_chunks(fd, chunk_size=1000, window=4)
+        assert await stream.__anext__() == data[:1000]
+        await stream.aclose()
+
+
+@aiomisc.timeout(5)
+async def test_iter_chunks_into_arena(tmp_path, async_context):
+    data = os.urandom(10_000)
+    path = tmp_path / "temp.bin"
+    path.write_bytes(data)
+    with BufferArena(4096, 2) as arena, open(str(path), "rb") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+        fd = fp.fileno()
+
+        received = []
+        async for chunk in async_context.iter_chunks(
+            fd, chunk_size=3000, window=3, arena=arena,
+        ):
+            assert isinstance(chunk, memoryview)
+            received.append(bytes(chunk))
+        del chunk
+        assert b"".join(received) == data
+        assert arena.available == 2
+
+        with pytest.raises(ValueError):
+            await async_context.iter_chunks(
+                fd, chunk_size=8192, arena=arena,
+            ).__anext__()
+
+
+@aiomisc.timeout(5)
+async def test_iter_chunks_cancelled_keeps_busy_buffers(async_context):
+    """A read cancelled while the kernel may still be writing into its
+    arena buffer must not have that buffer handed out again."""
+    async def slow_readinto(buffer, fd, offset, priority=0):
+        # Cancelled like submit() is: at once, the operation itself
+        # possibly still running
+        await asyncio.sleep(10)
+
+    async_context.readinto = slow_readinto
+    arena = BufferArena(4096, 2)
+    chunks = async_context.iter_chunks(
+        0, chunk_size=1000, window=2, arena=arena,
+    )
+    consumer = asyncio.ensure_future(chunks.__anext__())
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+    assert arena.available == 0
+
+
+@aiomisc.timeout(5)
+async def test_read_many_write_many(tmp_path, async_context_maker):
+    async with async_context_maker(max_requests=16) as context:
+        batches = []
+        submit_ops = context._submit_ops
+
+        def counting_submit_ops(ops, futures):
+            batches.append(len(ops))
+            return submit_ops(ops, futures)
+
+        context._submit_ops = counting_submit_ops
+        with open(str(tmp_path / "temp.bin"), "wb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            records = [bytes([i]) * 64 for i in range(16)]
+            assert await context.write_many(
+                (record, fd, i * 64) for i, record in enumerate(records)
+            ) == [64] * 16
+            assert batches == [16]
+
+            assert await context.read_many(
+                [(64, fd, i * 64) for i in reversed(range(16))],
+            ) == records[::-1]
+            assert batches == [16, 16]
+
+            # More than max_requests: split, each part submitted as soon
+            # as it would otherwise wait for a free slot
+            batches.clear()
+            requests = [(64, fd, (i % 16) * 64) for i in range(40)]
+            results = await context.read_many(requests)
+            assert results == [records[i % 16] for i in range(40)]
+            assert sum(batches) == 40
+            assert max(batches) <= 16
+
+            assert await context.read_many([]) == []
+
+
+@aiomisc.timeout(5)
+async def test_coalesce_reads(tmp_path, async_context_maker):
+    data = os.urandom(64 * 1024)
+    path = tmp_path / "temp.bin"
+    path.write_bytes(data)
+
+    async with async_context_maker(coalesce_reads=16384) as context:
+        submitted = count_submits(context)
+        with open(str(path), "rb") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            # 0-8192 overlap and touch, 12288 leaves a gap, the last one
+            # runs past the end of file: four reads in all.
+            requests = [
+                (4096, 0), (4096, 4096), (1000, 2000),
+                (4096, 12288), (100, 40000), (4096, 65000),
+            ]
+            results = await asyncio.gather(*(
+                context.read(nbytes, fd, offset) for nbytes, offset in requests
+            ))
+            assert results == [
+                data[offset:offset + nbytes] for nbytes, offset in requests
+            ]
+            assert all(type(r) is bytes for r in results)
+            assert len(submitted) == 4
+
+            # The span limit splits a run of touching reads
+            submitted.clear()
+            results = await asyncio.gather(*(
+                context.read(4096, fd, offset)
+                for offset in range(0, 32768, 4096)
+            ))
+            assert b"".join(results) == data[:32768]
+            assert len(submitted) == 2
+
+
+@aiomisc.timeout(5)
+async def test_coalesce_writes(tmp_path, async_context_maker):
+    path = tmp_path / "temp.bin"
+    async with async_context_maker(coalesce_writes=16384) as context:
+        submitted = count_submits(context)
+        with open(str(path), "wb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            records = [bytes([i]) * 200 for i in range(100)]
+            results = await asyncio.gather(*(
+                context.write(record, fd, i * 200)
+                for i, record in enumerate(records)
+            ))
+            assert results == [200] * 100
+            # 20000 bytes of back to back appends, at most 16384 per writev
+            assert len(submitted) == 2
+
+            # An overlapping write and one past a gap each get their own
+            submitted.clear()
+            results = await asyncio.gather(
+                context.write(b"a" * 10, fd, 20000),
+                context.write(b"b" * 10, fd, 20005),
+                context.write(b"c" * 10, fd, 30000),
+            )
+            assert results == [10, 10, 10]
+            assert len(submitted) == 3
+
+    assert path.read_bytes()[:20000] == b"".join(records)
+
+
+@aiomisc.timeout(5)
+async def test_single_flight(tmp_path, async_context_maker):
+    path = tmp_path / "temp.bin"
+    path.write_bytes(b"0123456789")
+    async with async_context_maker(single_flight=True) as context:
+        submitted = count_submits(context)
+        with open(str(path), "rb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            results = await asyncio.gather(
+                *(context.read(4, fd, 2) for _ in range(20)),
+                context.read(4, fd, 3),
+            )
+            assert results == [b"2345"] * 20 + [b"3456"]
+            assert len(submitted) == 2
+            assert not context._flights
+
+            # A read issued after a write never joins one from before it
+            first = asyncio.ensure_future(context.read(4, fd, 0))
+            await asyncio.sleep(0)
+            write = asyncio.ensure_future(context.write(b"ab", fd, 0))
+            await write
+            second = await context.read(4, fd, 0)
+            assert await first in (b"0123", b"ab23")
+            assert second == b"ab23"
+
+
 @aiomisc.timeout(10)
 async def test_max_requests_backpressure(tmp_path, async_context_maker):
     """A tiny max_requests must still let far more concurrent operations
@@ -280,3 +685,33 @@ async def test_concurrent_non_overlapping_chunks(tmp_path, async_context):
 
         for i, (got, want) in enumerate(zip(results, expected)):
             assert got == want, f"chunk {i} mismatch"
+
+
+@aiomisc.timeout(5)
+async def test_aligned_read(tmp_path, async_context):
+    if not hasattr(os, "O_DIRECT"):
+        pytest.skip("O_DIRECT is Linux-only")
+
+    path = str(tmp_path / "temp.bin")
+    data = os.urandom(3 * 4096)
+    with open(path, "wb") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+        fp.write(data)
+
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+    except OSError:
+        pytest.skip("filesystem does not support O_DIRECT")
+    try:
+        block = max(logical_block_size(fd), 4096)
+        assert await async_context.read(
+            2 * block, fd, block, alignment=block,
+        ) == data[block:3 * block]
+        # Short at the end of file, like read()
+        assert await async_context.read(
+            2 * block, fd, 2 * block, alignment=block,
+        ) == data[2 * block:]
+
+        with pytest.raises(ValueError):
+            await async_context.read(block, fd, 0, alignment=3)
+    finally:
+        os.close(fd)
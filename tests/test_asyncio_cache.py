@@ -0,0 +1,100 @@
+import asyncio
+import os
+
+import aiomisc
+import pytest
+
+from caio import CachedAsyncioContext
+
+
+@aiomisc.timeout(5)
+async def test_cached_reads(tmp_path, async_context_maker):
+    data = os.urandom(10_000)
+    path = tmp_path / "temp.bin"
+    path.write_bytes(data)
+
+    async with CachedAsyncioContext(
+        async_context_maker(), capacity_bytes=8192, block_size=1024,
+    ) as ctx:
+        with open(str(path), "rb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            # Concurrent misses on the same blocks share one read each
+            results = await asyncio.gather(*(
+                ctx.read(1500, fd, 100) for _ in range(10)
+            ))
+            assert results == [data[100:1600]] * 10
+            assert ctx.misses == 2
+            assert ctx.cached_bytes == 2048
+
+            assert await ctx.read(500, fd, 1100) == data[1100:1600]
+            assert ctx.hits == 1
+
+            # Past the end of file, like read()
+            assert await ctx.read(4096, fd, 9000) == data[9000:]
+            assert await ctx.read(10, fd, 20_000) == b""
+
+            # Writes through the wrapper invalidate what they touch
+            assert await ctx.write(b"new", fd, 1500) == 3
+            assert await ctx.read(10, fd, 1495) == (
+                data[1495:1500] + b"new" + data[1503:1505]
+            )
+
+            # Least recently used blocks are evicted first
+            await ctx.read(len(data), fd, 0)
+            assert ctx.cached_bytes <= 8192
+            misses = ctx.misses
+            await ctx.read(10, fd, 9990)
+            assert ctx.misses == misses
+            await ctx.read(10, fd, 0)
+            assert ctx.misses == misses + 1
+
+            ctx.invalidate(fd)
+            assert ctx.cached_bytes == 0
+
+
+@aiomisc.timeout(5)
+async def test_cached_aligned_reads(tmp_path, async_context_maker):
+    if not hasattr(os, "O_DIRECT"):
+        pytest.skip("O_DIRECT is Linux-only")
+
+    data = os.urandom(10_000)
+    path = tmp_path / "temp.bin"
+    path.write_bytes(data)
+    try:
+        fd = os.open(str(path), os.O_RDONLY | os.O_DIRECT)
+    except OSError:
+        pytest.skip("filesystem does not support O_DIRECT")
+
+    try:
+        async with CachedAsyncioContext(
+            async_context_maker(), capacity_bytes=1 << 20,
+            block_size=4096, alignment=4096,
+        ) as ctx:
+            assert await ctx.read(5000, fd, 3000) == data[3000:8000]
+            assert await ctx.read(100, fd, 9900) == data[9900:]
+    finally:
+        os.close(fd)
+
+
+@aiomisc.timeout(5)
+async def test_cached_reads_see_the_file_grow(tmp_path, async_context_maker):
+    data = os.urandom(8192)
+    path = tmp_path / "temp.bin"
+    path.write_bytes(data[:100])
+
+    async with CachedAsyncioContext(
+        async_context_maker(), capacity_bytes=1 << 20, block_size=4096,
+    ) as ctx:
+        with open(str(path), "rb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+
+            assert await ctx.read(8192, fd, 0) == data[:100]
+            assert await ctx.read(10, fd, 5000) == b""
+
+            # Written past the short block at the old end of file only
+            assert await ctx.write(data[4096:], fd, 4096) == 4096
+            assert await ctx.read(8192, fd, 0) == (
+                data[:100] + bytes(3996) + data[4096:]
+            )
+            assert await ctx.read(10, fd, 5000) == data[5000:5010]
@@ -0,0 +1,198 @@
+import asyncio
+import os
+
+import aiomisc
+import pytest
+
+from caio import AsyncFile
+
+
+@aiomisc.timeout(10)
+async def test_sequential_read_with_read_ahead(tmp_path, async_context):
+    data = os.urandom(100_000)
+    path = tmp_path / "temp.bin"
+    path.write_bytes(data)
+
+    async with await AsyncFile.open(
+        path, "rb", context=async_context, chunk_size=4096, read_ahead=3,
+    ) as fp:
+        assert await fp.read(10) == data[:10]
+        # Reads spanning several chunks, then the rest
+        assert await fp.read(10_000) == data[10:10_010]
+        assert fp.tell() == 10_010
+        assert len(fp._ahead) <= 3
+        assert await fp.read() == data[10_010:]
+        assert await fp.read() == b""
+
+        fp.seek(-5, os.SEEK_END)
+        assert await fp.read() == data[-5:]
+        fp.seek(50_000)
+        chunks = [chunk async for chunk in fp.iter_chunks(30_000)]
+        assert b"".join(chunks) == data[50_000:]
+        assert [len(c) for c in chunks] == [30_000, 20_000]
+
+    assert fp.closed
+    with pytest.raises(ValueError):
+        await fp.read()
+
+
+@aiomisc.timeout(10)
+async def test_buffered_writes(tmp_path, async_context):
+    path = tmp_path / "temp.bin"
+    pieces = [bytes([i % 256]) * 200 for i in range(500)]
+
+    async with await AsyncFile.open(
+        path, "wb+", context=async_context, write_buffer_size=8192,
+    ) as fp:
+        for piece in pieces:
+            assert await fp.write(piece) == 200
+        assert fp.tell() == 100_000
+        assert fp.seek(0, os.SEEK_END) == 100_000
+
+        # Reads see buffered writes
+        fp.seek(0)
+        assert await fp.read(400) == pieces[0] + pieces[1]
+
+        # Overwrite in the middle, away from the buffered tail
+        fp.seek(1000)
+        await fp.write(b"x" * 10)
+        fp.seek(995)
+        assert await fp.read(20) == pieces[4][:5] + b"x" * 10 + pieces[5][5:10]
+        await fp.fsync()
+
+    expected = bytearray(b"".join(pieces))
+    expected[1000:1010] = b"x" * 10
+    assert path.read_bytes() == expected
+
+
+@aiomisc.timeout(10)
+async def test_lines_and_modes(tmp_path, async_context):
+    path = tmp_path / "temp.txt"
+
+    async with await AsyncFile.open(path, "w", context=async_context) as fp:
+        await fp.write(b"first\nsecond\n")
+    async with await AsyncFile.open(path, "a", context=async_context) as fp:
+        assert fp.tell() == 13
+        await fp.write(b"third")
+
+    async with await AsyncFile.open(
+        path, "r", context=async_context, chunk_size=4,
+    ) as fp:
+        assert [line async for line in fp] == [
+            b"first\n", b"second\n", b"third",
+        ]
+
+    with pytest.raises(FileExistsError):
+        await AsyncFile.open(path, "x", context=async_context)
+    with pytest.raises(ValueError):
+        await AsyncFile.open(path, "rw", context=async_context)
+
+
+@aiomisc.timeout(10)
+async def test_default_context(tmp_path):
+    path = tmp_path / "temp.bin"
+    async with await AsyncFile.open(path, "wb+") as fp:
+        await fp.write(b"hello")
+        fp.seek(0)
+        assert await fp.read() == b"hello"
+    assert fp.owns_context
+
+
+@aiomisc.timeout(10)
+async def test_close_waits_for_every_write(tmp_path, async_context):
+    """A failed write-behind write must not get the fd closed while the
+    others are still using it."""
+    write = async_context.write
+    release = asyncio.Event()
+    landed = []
+
+    async def write_failing_first(payload, fd, offset, *args, **kwargs):
+        if offset == 0:
+            raise OSError("first write failed")
+        await release.wait()
+        result = await write(payload, fd, offset, *args, **kwargs)
+        landed.append(offset)
+        return result
+
+    async_context.write = write_failing_first
+    path = tmp_path / "temp.bin"
+    fp = await AsyncFile.open(
+        path, "wb", context=async_context, write_buffer_size=4,
+    )
+    await fp.write(b"aaaa")
+    await fp.write(b"bbbb")
+
+    closing = asyncio.ensure_future(fp.close())
+    await asyncio.sleep(0.1)
+    assert not closing.done()
+    os.fstat(fp.fd)
+
+    release.set()
+    with pytest.raises(OSError, match="first write failed"):
+        await closing
+    assert landed == [4]
+    assert path.read_bytes() == b"\x00" * 4 + b"bbbb"
+
+
+@aiomisc.timeout(10)
+async def test_readline_with_coalesced_reads(tmp_path, async_context_maker):
+    path = tmp_path / "temp.txt"
+    path.write_bytes(b"first\nsecond\n" * 1000)
+
+    context = async_context_maker(coalesce_reads=1 << 16)
+    async with context, await AsyncFile.open(
+        path, "rb", context=context, chunk_size=4096,
+    ) as fp:
+        lines = [line async for line in fp]
+    assert lines == [b"first\n", b"second\n"] * 1000
+
+
+@aiomisc.timeout(10)
+async def test_readline_copies_only_the_line(tmp_path, async_context):
+    """Lines come straight out of the chunk read, not out of a copy of
+    everything left in it."""
+    path = tmp_path / "temp.txt"
+    path.write_bytes(b"line\n" * 20_000)
+
+    async with await AsyncFile.open(
+        path, "rb", context=async_context, chunk_size=1 << 20,
+    ) as fp:
+        assert await fp.read(3) == b"lin"
+        buffer = fp._buffer
+        assert await fp.readline() == b"e\n"
+        assert await fp.read(7) == b"line\nli"
+        assert fp._buffer is buffer
+        lines = [line async for line in fp]
+    assert lines == [b"ne\n"] + [b"line\n"] * 19_997
+
+
+@aiomisc.timeout(10)
+async def test_cancelled_write_while_write_behind_is_full(
+    tmp_path, async_context,
+):
+    """A write() cancelled while waiting for a write-behind slot keeps its
+    data buffered - close() still writes it out."""
+    write = async_context.write
+    gate = asyncio.Event()
+
+    async def gated_write(*args, **kwargs):
+        await gate.wait()
+        return await write(*args, **kwargs)
+
+    async_context.write = gated_write
+    path = tmp_path / "temp.bin"
+    fp = await AsyncFile.open(
+        path, "wb", context=async_context, write_buffer_size=4,
+        write_behind=1,
+    )
+    await fp.write(b"aaaa")
+
+    waiting = asyncio.ensure_future(fp.write(b"bbbb"))
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    gate.set()
+    await fp.close()
+    assert path.read_bytes() == b"aaaabbbb"
@@ -0,0 +1,65 @@
+import ctypes
+import os
+
+import pytest
+
+from caio.buffers import BufferArena, aligned_buffer, logical_block_size
+
+
+@pytest.mark.parametrize("alignment", [512, 4096, 1 << 16])
+def test_aligned_buffer(alignment):
+    view = aligned_buffer(10_000, alignment)
+    assert view.nbytes == 10_000
+    assert not view.readonly
+    assert bytes(view) == bytes(10_000)
+
+    address = ctypes.addressof(ctypes.c_char.from_buffer(view))
+    assert address % alignment == 0
+
+    with pytest.raises(ValueError):
+        aligned_buffer(4096, 3000)
+
+
+def test_logical_block_size(tmp_path):
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    try:
+        size = logical_block_size(fd)
+    finally:
+        os.close(fd)
+    assert size >= 512
+    assert size & (size - 1) == 0
+
+
+@pytest.mark.parametrize("hugepages", [False, True])
+def test_buffer_arena(hugepages):
+    with BufferArena(6000, 2, hugepages=hugepages) as arena:
+        assert isinstance(arena.hugepages, bool)
+        first, second = arena.acquire(), arena.acquire()
+        assert first.nbytes == second.nbytes == 6000
+        for buffer in (first, second):
+            address = ctypes.addressof(ctypes.c_char.from_buffer(buffer))
+            assert address % 4096 == 0
+        assert arena.available == 0
+
+        # Exhausted - a buffer of its own instead of an error
+        extra = arena.acquire()
+        assert extra.nbytes == 6000
+        arena.release(extra)
+        assert arena.available == 0
+
+        first[:5] = b"hello"
+        arena.release(first)
+        assert arena.available == 1
+        with pytest.raises(ValueError):
+            first[:5]
+        assert arena.acquire()[:5] == b"hello"
+
+        # Still in use through a slice - nothing changes until it's gone
+        head = second[:10]
+        with pytest.raises(BufferError):
+            arena.close()
+        assert arena.available == 0
+        del head
+
+    with pytest.raises(ValueError):
+        BufferArena(0, 1)
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+from conftest import wait_until
+
+from caio.ioprio import (
+    IOPRIO_NORM,
+    IoprioClass,
+    ioprio_class,
+    ioprio_value,
+    queue_level,
+)
+
+
+def test_ioprio_value_layout():
+    assert ioprio_value(IoprioClass.IDLE) == 3 << 13
+    assert ioprio_value(IoprioClass.BE, 4) == (2 << 13) | 4
+    assert ioprio_class(ioprio_value(IoprioClass.RT, 1)) is IoprioClass.RT
+    assert ioprio_class(5) is IoprioClass.NONE
+
+    with pytest.raises(ValueError):
+        ioprio_value(IoprioClass.BE, 8)
+    with pytest.raises(ValueError):
+        ioprio_value(7)
+
+
+def test_queue_level():
+    assert queue_level(0) == IOPRIO_NORM
+    assert queue_level(1) == 1
+    assert queue_level(3) == 3
+    assert queue_level(100) == 7
+    assert queue_level(ioprio_value(IoprioClass.RT, 5)) == 0
+    assert queue_level(ioprio_value(IoprioClass.BE, 5)) == 5
+    assert queue_level(ioprio_value(IoprioClass.BE, 0)) == 0
+    assert queue_level(ioprio_value(IoprioClass.IDLE)) == 7
+
+
+@pytest.mark.parametrize("priority", [
+    0, 3, 9, ioprio_value(IoprioClass.BE, 2), ioprio_value(IoprioClass.IDLE),
+])
+def test_priority_is_accepted(tmp_path, backend, priority):
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    try:
+        os.pwrite(fd, b"data", 0)
+        ctx = backend.Context(max_requests=4)
+        op = backend.Operation.read(4, fd, 0, priority=priority)
+        assert op.priority == priority
+
+        done = []
+        op.set_callback(done.append)
+        assert ctx.submit(op) == 1
+        wait_until(ctx, lambda: bool(done))
+        assert op.get_value() == b"data"
+
+        # Only reads and writes hand the kernel an ioprio
+        op = backend.Operation.fdsync(fd, priority=priority)
+        op.set_callback(done.append)
+        assert ctx.submit(op) == 1
+        wait_until(ctx, lambda: len(done) == 2)
+        op.get_value()
+    finally:
+        os.close(fd)
@@ -108,3 +108,30 @@ def test_scheduling_failure_rolls_back_the_reserved_slot():
         ctx.submit(python_aio.Operation.fsync(0))
 
     assert ctx._in_progress == 0
+
+
+def test_priority_orders_queued_operations():
+    """Lower priority values jump ahead of operations already queued,
+    and the default 0 sits between 3 and 7."""
+    with tempfile.NamedTemporaryFile() as f:
+        ctx = python_aio.Context(max_requests=16, pool_size=1)
+
+        # Keep the single worker busy so everything below queues up
+        release = threading.Event()
+        ctx.pool.apply_async(release.wait)
+
+        order = []
+        done = threading.Event()
+        ops = [
+            python_aio.Operation.write(b"x", f.fileno(), i, priority=p)
+            for i, p in enumerate([7, 7, 3, 0, 1])
+        ]
+        for i, op in enumerate(ops):
+            op.set_callback(lambda _r, i=i: (order.append(i), len(order) == 5 and done.set()))
+        assert ctx.submit(*ops) == len(ops)
+        assert ops[0].priority == 7
+
+        release.set()
+        assert done.wait(5.0)
+        assert order == [4, 2, 3, 0, 1]
+        ctx.close()
@@ -0,0 +1,194 @@
+import errno
+import os
+
+import aiomisc
+import pytest
+from conftest import wait_until
+
+from caio.rwflags import RWF_APPEND, RWF_DSYNC, RWF_NOWAIT
+
+
+def run(backend, op):
+    ctx = backend.Context(max_requests=4)
+    done = []
+    op.set_callback(done.append)
+    assert ctx.submit(op) == 1
+    wait_until(ctx, lambda: bool(done))
+    return op.get_value()
+
+
+def check_supported(backend):
+    operation = getattr(backend, "Operation", backend)
+    try:
+        operation.read(1, 0, 0, flags=RWF_NOWAIT)
+    except ValueError:
+        pytest.skip("no preadv2()/pwritev2() on this platform")
+
+
+def test_write_flags(tmp_path, backend):
+    check_supported(backend)
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    try:
+        os.pwrite(fd, b"head", 0)
+        assert run(
+            backend, backend.Operation.write(b"tail", fd, 0, flags=RWF_APPEND),
+        ) == 4
+        assert run(
+            backend, backend.Operation.write(b"HE", fd, 0, flags=RWF_DSYNC),
+        ) == 2
+        assert os.pread(fd, 16, 0) == b"HEadtail"
+    finally:
+        os.close(fd)
+
+
+def test_nowait_read_of_cached_data(tmp_path, backend):
+    check_supported(backend)
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    try:
+        os.pwrite(fd, b"data", 0)
+        # Just written, so in the page cache - unless the filesystem
+        # doesn't do RWF_NOWAIT at all
+        try:
+            value = run(
+                backend, backend.Operation.read(4, fd, 0, flags=RWF_NOWAIT),
+            )
+        except (OSError, SystemError) as exc:
+            if os.strerror(errno.EOPNOTSUPP) not in str(exc):
+                raise
+            pytest.skip("filesystem does not support RWF_NOWAIT")
+        assert value == b"data"
+    finally:
+        os.close(fd)
+
+
+def test_unknown_flags_are_rejected(backend):
+    with pytest.raises(ValueError):
+        backend.Operation.read(1, 0, 0, flags=1 << 20)
+    with pytest.raises(ValueError):
+        backend.Operation.write(b"x", 0, 0, flags=1 << 20)
+
+
+@aiomisc.timeout(5)
+async def test_asyncio_flags(tmp_path, async_context):
+    check_supported(async_context.OPERATION_CLASS)
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"head")
+    with open(str(path), "rb+") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+        fd = fp.fileno()
+        assert await async_context.write(
+            b"tail", fd, 0, flags=RWF_APPEND,
+        ) == 4
+        assert await async_context.write(b"HE", fd, 0, flags=RWF_DSYNC) == 2
+        assert await async_context.read(8, fd, 0) == b"HEadtail"
+
+
+def inline_context(backend):
+    check_supported(backend)
+    try:
+        return backend.Context(max_requests=4, inline_reads=True)
+    except TypeError:
+        pytest.skip("only the thread pool backends read inline")
+
+
+def test_inline_reads_complete_in_submit(tmp_path, backend):
+    ctx = inline_context(backend)
+    data = os.urandom(8192)
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    try:
+        os.pwrite(fd, data, 0)
+        buffer = bytearray(100)
+        ops = [
+            backend.Operation.read(4096, fd, 1000),
+            backend.Operation.readinto(buffer, fd, 8000),
+            backend.Operation.read(4096, fd, 6000),
+            backend.Operation.read(10, fd, 9000),
+        ]
+        done = []
+        for op in ops:
+            op.set_callback(done.append)
+
+        # Just written, so cached - done before submit() returns, the
+        # ones cut short by the end of file too
+        assert ctx.submit(*ops) == 4
+        if not done:
+            pytest.skip("filesystem does not support RWF_NOWAIT")
+        assert done == [4096, 100, 2192, 0]
+        assert ops[0].get_value() == data[1000:5096]
+        assert buffer == data[8000:8100]
+        assert ops[2].get_value() == data[6000:]
+        assert ops[3].get_value() == b""
+
+        # Anything else still goes through the pool
+        write = backend.Operation.write(b"x", fd, 0)
+        write.set_callback(done.append)
+        assert ctx.submit(write) == 1
+        wait_until(ctx, lambda: len(done) == 5)
+        assert os.pread(fd, 1, 0) == b"x"
+    finally:
+        os.close(fd)
+        ctx.close()
+
+
+def test_inline_reads_fall_back_to_the_pool(tmp_path, backend):
+    ctx = inline_context(backend)
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    os.close(fd)
+    # A bad fd fails inline too - the pool is where it's reported from
+    op = backend.Operation.read(10, fd, 0)
+    done = []
+    op.set_callback(done.append)
+    try:
+        assert ctx.submit(op) == 1
+        wait_until(ctx, lambda: bool(done))
+        with pytest.raises((OSError, SystemError)):
+            op.get_value()
+    finally:
+        ctx.close()
+
+
+@aiomisc.timeout(5)
+async def test_asyncio_inline_reads(tmp_path, async_context_maker):
+    try:
+        context = async_context_maker(inline_reads=True)
+    except TypeError:
+        pytest.skip("only the thread pool backends read inline")
+
+    data = os.urandom(10_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    async with context:
+        check_supported(context.OPERATION_CLASS)
+        with open(str(path), "rb") as fp:  # noqa: ASYNC230 (brief sync setup, not the operation under test)
+            fd = fp.fileno()
+            assert await context.read(5000, fd, 3000) == data[3000:8000]
+            assert await context.read(100, fd, 9950) == data[9950:]
+
+
+def test_inline_reads_only_ahead_of_the_pool(tmp_path):
+    """thread_aio: submit() returns how many it accepted from the first
+    on, so a read behind an op bound for the pool goes there too."""
+    from caio import thread_aio
+
+    check_supported(thread_aio)
+    # Callbacks of ops the pool ran only ever come from process_events()
+    ctx = thread_aio.Context(
+        max_requests=4, completion_queue=True, inline_reads=True,
+    )
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    try:
+        os.pwrite(fd, b"data", 0)
+        done = []
+        ops = [
+            thread_aio.Operation.fdsync(fd),
+            thread_aio.Operation.read(4, fd, 0),
+        ]
+        for op in ops:
+            op.set_callback(done.append)
+
+        assert ctx.submit(*ops) == 2
+        assert done == []
+        wait_until(ctx, lambda: len(done) == 2)
+        assert ops[1].get_value() == b"data"
+    finally:
+        os.close(fd)
+        ctx.close()
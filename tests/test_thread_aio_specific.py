@@ -4,6 +4,7 @@ not a bug pattern shared with the other backends, so these don't belong in
 the cross-backend parametrized suite. Skipped outright wherever thread_aio
 itself isn't available.
 """
+import contextlib
 import threading
 
 import pytest
@@ -62,3 +63,108 @@ def test_queue_overflow_allows_retry_with_original_data(tmp_path):
         assert rf.read(len(payload)) == payload, (
             "resubmitted operation must write its ORIGINAL payload, not lost/empty data"
         )
+
+
+def test_completion_queue_runs_callbacks_in_process_events(tmp_path):
+    """With completion_queue=True workers never run callbacks themselves -
+    they only signal fileno, and process_events() runs them on the calling
+    thread, oldest first."""
+    with open(str(tmp_path / "temp.bin"), "wb+") as f:
+        fd = f.fileno()
+        ctx = thread_aio.Context(max_requests=16, pool_size=1, completion_queue=True)
+        assert ctx.completion_queue
+        assert ctx.fileno >= 0
+
+        threads = []
+        ops = [thread_aio.Operation.write(b"x", fd, i) for i in range(8)]
+        for i, op in enumerate(ops):
+            op.set_callback(lambda _r, i=i: threads.append((i, threading.get_ident())))
+
+        assert ctx.submit(*ops) == len(ops)
+        assert ctx.process_events(min_requests=len(ops), timeout=5) == len(ops)
+        assert threads == [(i, threading.get_ident()) for i in range(len(ops))]
+        assert all(op.result == 1 for op in ops)
+
+        # Whether the wakeup is still pending depends on whether
+        # process_events() had to wait - either way, it's spent afterwards.
+        with contextlib.suppress(BlockingIOError):
+            ctx.poll()
+        with pytest.raises(BlockingIOError):
+            ctx.poll()
+        assert ctx.process_events() == 0
+        ctx.close()
+
+
+def test_completion_queue_close_reaps_pending(tmp_path):
+    with open(str(tmp_path / "temp.bin"), "wb+") as f:
+        ctx = thread_aio.Context(completion_queue=True)
+        done = []
+        op = thread_aio.Operation.write(b"data", f.fileno(), 0)
+        op.set_callback(done.append)
+        ctx.submit(op)
+        ctx.close()
+        assert done == [4]
+
+
+def test_process_events_without_completion_queue():
+    ctx = thread_aio.Context()
+    assert not ctx.completion_queue
+    assert ctx.fileno == -1
+    assert ctx.process_events() == 0
+    with pytest.raises(RuntimeError):
+        ctx.poll()
+    with pytest.raises(ValueError):
+        ctx.process_events(max_requests=1, min_requests=2)
+    ctx.close()
+
+
+def test_large_queue_and_batched_submit(tmp_path):
+    """max_requests is no longer capped at 65535, and one submit() call
+    queues its whole batch at once."""
+    with open(str(tmp_path / "temp.bin"), "wb+") as f:
+        fd = f.fileno()
+        ctx = thread_aio.Context(max_requests=100000, pool_size=4, completion_queue=True)
+        assert ctx.max_requests == 100000
+
+        ops = [thread_aio.Operation.write(b"x", fd, i) for i in range(1000)]
+        assert ctx.submit(*ops) == len(ops)
+        assert ctx.process_events(max_requests=len(ops), min_requests=len(ops), timeout=10) == len(ops)
+        assert all(op.result == 1 for op in ops)
+        ctx.close()
+
+    with pytest.raises(ValueError):
+        thread_aio.Context(max_requests=1 << 20)
+
+
+def test_priority_orders_queued_operations(tmp_path):
+    """Lower priority values jump ahead of operations already queued,
+    across any number of submit() calls. The default 0 sits between 3
+    and 7."""
+    with open(str(tmp_path / "temp.bin"), "wb+") as f:
+        fd = f.fileno()
+        ctx = thread_aio.Context(max_requests=16, pool_size=1)
+
+        blocker_started = threading.Event()
+        release = threading.Event()
+        blocker = thread_aio.Operation.fsync(fd)
+        blocker.set_callback(lambda _r: (blocker_started.set(), release.wait(5.0)))
+        ctx.submit(blocker)
+        assert blocker_started.wait(5.0)
+
+        order = []
+        done = threading.Event()
+        ops = [
+            thread_aio.Operation.write(b"x", fd, i, priority=p)
+            for i, p in enumerate([7, 7, 3, 0, 100])
+        ]
+        for i, op in enumerate(ops):
+            op.set_callback(lambda _r, i=i: (order.append(i), len(order) == 5 and done.set()))
+        assert ctx.submit(*ops[:2]) == 2
+        assert ctx.submit(*ops[2:]) == 3
+        assert ops[4].priority == 100
+
+        release.set()
+        assert done.wait(5.0)
+        # Out of range values share the last level, in submission order
+        assert order == [2, 3, 0, 1, 4]
+        ctx.close()
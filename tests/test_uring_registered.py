@@ -0,0 +1,181 @@
+"""
+linux_uring's registered resources (IORING_REGISTER_*): state the kernel
+sets up once per Context instead of once per operation. Everything here is
+linux_uring-only and skipped outright where it isn't available.
+"""
+import os
+
+import aiomisc
+import pytest
+from conftest import drain
+
+linux_uring = pytest.importorskip("caio.linux_uring")
+
+
+@pytest.fixture
+def fd(tmp_path):
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    yield fd
+    os.close(fd)
+
+
+def test_fixed_write_then_read_roundtrip(fd):
+    ctx = linux_uring.Context(max_requests=8)
+    ctx.register_buffers(4, 4096)
+    assert (ctx.buffers_count, ctx.buffers_size) == (4, 4096)
+
+    ctx.get_buffer(1)[:5] = b"hello"
+    write = linux_uring.Operation.write_fixed(5, fd, 0, 1)
+    ctx.submit(write)
+    drain(ctx, 1)
+    assert write.get_value() == 5
+
+    read = linux_uring.Operation.read_fixed(4096, fd, 0, 2)
+    ctx.submit(read)
+    drain(ctx, 1)
+
+    value = read.get_value()
+    assert isinstance(value, memoryview)
+    assert bytes(value) == b"hello"
+    assert read.nbytes == 5
+    # Aliases slot 2 itself - no copy was made.
+    assert bytes(ctx.get_buffer(2)[:5]) == b"hello"
+
+
+def test_fixed_result_outlives_context(fd):
+    """A memoryview handed out by get_value() must keep the pool alive on
+    its own, not dangle once the Context that registered it is gone."""
+    os.pwrite(fd, b"payload", 0)
+
+    ctx = linux_uring.Context(max_requests=8)
+    ctx.register_buffers(1, 64)
+    op = linux_uring.Operation.read_fixed(64, fd, 0, 0)
+    ctx.submit(op)
+    drain(ctx, 1)
+    value = op.get_value()
+
+    del ctx, op
+    assert bytes(value) == b"payload"
+
+
+def test_fixed_ops_validated_against_registered_pool(fd):
+    ctx = linux_uring.Context(max_requests=8)
+
+    with pytest.raises(ValueError, match="register_buffers"):
+        ctx.submit(linux_uring.Operation.read_fixed(16, fd, 0, 0))
+
+    ctx.register_buffers(2, 1024)
+    with pytest.raises(RuntimeError):
+        ctx.register_buffers(2, 1024)
+
+    good = linux_uring.Operation.read_fixed(16, fd, 0, 0)
+    with pytest.raises(ValueError):
+        ctx.submit(good, linux_uring.Operation.read_fixed(16, fd, 0, 2))
+    with pytest.raises(ValueError):
+        ctx.submit(good, linux_uring.Operation.read_fixed(2048, fd, 0, 0))
+
+    # Rejected batches must not have staged the valid op ahead of them.
+    assert ctx.submit(good) == 1
+    drain(ctx, 1)
+
+    with pytest.raises(IndexError):
+        ctx.get_buffer(2)
+
+    ctx.unregister_buffers()
+    ctx.unregister_buffers()
+    with pytest.raises(RuntimeError):
+        ctx.get_buffer(0)
+
+
+@aiomisc.timeout(5)
+async def test_asyncio_fixed_roundtrip(fd):
+    from caio.linux_uring_asyncio import AsyncioContext
+
+    async with AsyncioContext(max_requests=8) as context:
+        context.context.register_buffers(2, 4096)
+        context.context.get_buffer(0)[:3] = b"abc"
+
+        assert await context.write_fixed(3, fd, 10, 0) == 3
+        assert bytes(await context.read_fixed(16, fd, 10, 1)) == b"abc"
+
+
+def test_fixed_file_roundtrip(tmp_path):
+    fd = os.open(str(tmp_path / "data.bin"), os.O_RDWR | os.O_CREAT)
+    ctx = linux_uring.Context(max_requests=8)
+    ctx.register_files([None, fd])
+    assert ctx.files_count == 2
+
+    # The table holds its own reference - the original fd can go.
+    os.close(fd)
+
+    write = linux_uring.Operation.write(b"hello", 1, 0, fixed_file=True)
+    assert write.fixed_file
+    ctx.submit(write)
+    drain(ctx, 1)
+    assert write.get_value() == 5
+
+    fsync = linux_uring.Operation.fsync(1, fixed_file=True)
+    read = linux_uring.Operation.read(16, 1, 0, fixed_file=True)
+    ctx.submit(fsync, read)
+    drain(ctx, 2)
+    assert read.get_value() == b"hello"
+
+
+def test_sparse_files_table_update(fd):
+    os.pwrite(fd, b"data", 0)
+
+    ctx = linux_uring.Context(max_requests=8)
+    ctx.register_files(4)
+    assert ctx.files_count == 4
+
+    # Empty slot: the kernel fails it as a completion, not at submit.
+    op = linux_uring.Operation.read(4, 3, 0, fixed_file=True)
+    ctx.submit(op)
+    drain(ctx, 1)
+    with pytest.raises(SystemError):
+        op.get_value()
+
+    assert ctx.update_files(3, [fd]) == 1
+    op = linux_uring.Operation.read(4, 3, 0, fixed_file=True)
+    ctx.submit(op)
+    drain(ctx, 1)
+    assert op.get_value() == b"data"
+
+    with pytest.raises(IndexError):
+        ctx.update_files(3, [fd, fd])
+
+
+def test_fixed_files_validated_against_table(fd):
+    ctx = linux_uring.Context(max_requests=8)
+    op = linux_uring.Operation.read(4, 0, 0, fixed_file=True)
+
+    with pytest.raises(ValueError, match="register_files"):
+        ctx.submit(op)
+    with pytest.raises(RuntimeError):
+        ctx.update_files(0, [fd])
+
+    ctx.register_files([fd])
+    with pytest.raises(RuntimeError):
+        ctx.register_files([fd])
+
+    good = linux_uring.Operation.read(4, 0, 0, fixed_file=True)
+    with pytest.raises(ValueError, match="out of range"):
+        ctx.submit(good, linux_uring.Operation.read(4, 1, 0, fixed_file=True))
+    assert ctx.submit(good) == 1
+    drain(ctx, 1)
+
+    ctx.unregister_files()
+    ctx.unregister_files()
+    assert ctx.files_count == 0
+
+
+@aiomisc.timeout(5)
+async def test_asyncio_fixed_file_roundtrip(fd):
+    from caio.linux_uring_asyncio import AsyncioContext
+
+    async with AsyncioContext(max_requests=8) as context:
+        context.context.register_files([fd])
+
+        assert await context.write(b"xyz", 0, 0, fixed_file=True) == 3
+        await context.fdsync(0, fixed_file=True)
+        assert await context.read(3, 0, 0, fixed_file=True) == b"xyz"